@@ -0,0 +1,256 @@
+import gzip
+import os
+import zlib
+from pathlib import Path
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse
+from starlette.staticfiles import StaticFiles
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 응답 압축 (Accept-Encoding 협상: zstd / br / gzip)
+# brotli, zstandard 패키지가 없으면 해당 인코딩은 협상 대상에서 빠지고 gzip만 사용합니다.
+
+COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/x-ndjson", "application/javascript", "application/xml",
+    "image/svg+xml", "application/vnd.apache.arrow.stream",
+)
+# 같은 q 값이면 앞쪽 인코딩 우선
+PREFERENCE = ("zstd", "br", "gzip")
+# 정적 파일 사전 압축본 확장자
+SUFFIXES = {"zstd": ".zst", "br": ".br", "gzip": ".gz"}
+
+
+class _GzipStream:
+    def __init__(self):
+        self.compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip 헤더
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self):
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self.compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.flush()
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self):
+        self.compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self):
+        return self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self.compressor.flush()
+
+
+def available_encodings():
+    encoders = {"gzip": _GzipStream}
+    if brotli is not None:
+        encoders["br"] = _BrotliStream
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdStream
+    return encoders
+
+
+ENCODERS = available_encodings()
+
+
+def negotiate(accept_encoding, available=None):
+    """Accept-Encoding(q 값 포함)에서 사용할 인코딩 선택 - 없으면 None"""
+    available = [e for e in PREFERENCE if e in (available or ENCODERS)]
+    weights = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip()] = q
+    candidates = []
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > 0:
+            candidates.append((q, -PREFERENCE.index(encoding), encoding))
+    return max(candidates)[2] if candidates else None
+
+
+def is_compressible(content_type):
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _weak_etag(headers):
+    # 압축본은 바이트가 달라지므로 약한 ETag로 표시 (If-None-Match 비교는 그대로 동작)
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """ASGI 응답 압축 미들웨어
+
+    - 단건 응답: 본문이 minimum_size 미만이면 압축하지 않음
+    - 스트리밍 응답(more_body): chunk마다 압축 후 flush 하여 바로 전송
+    - 이미 Content-Encoding이 있거나(사전 압축 정적 파일 등) 압축 효과가 없는 형식(Parquet, 이미지)은 그대로 전달
+    """
+
+    def __init__(self, app, minimum_size=None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"start": None, "encoder": None, "passthrough": False}
+
+        async def send_compressed(message):
+            if message["type"] == "http.response.start":
+                state["start"] = message  # 첫 본문 chunk를 보고 압축 여부 결정
+                return
+            if message["type"] != "http.response.body" or state["passthrough"]:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if state["encoder"] is None:
+                start = state["start"]
+                headers = MutableHeaders(scope=start)
+                content_length = headers.get("content-length")
+                too_small = (not more_body and len(body) < self.minimum_size) or (
+                    content_length is not None and int(content_length) < self.minimum_size
+                )
+                if (start["status"] in (204, 304) or "content-encoding" in headers
+                        or not is_compressible(headers.get("content-type")) or too_small):
+                    state["passthrough"] = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                state["encoder"] = ENCODERS[encoding]()
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                _weak_etag(headers)
+                if not more_body:
+                    compressed = state["encoder"].compress(body) + state["encoder"].finish()
+                    headers["content-length"] = str(len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                del headers["content-length"]
+                await send(start)
+
+            encoder = state["encoder"]
+            if more_body:
+                chunk = encoder.compress(body) + encoder.flush()
+            else:
+                chunk = encoder.compress(body) + encoder.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+# ---- 정적 파일 사전 압축 ----
+
+def _compress_file(data, encoding):
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return zstandard.ZstdCompressor(level=19).compress(data)
+
+
+def precompress_static(directory, minimum_size=None):
+    """directory 아래 압축 가능한 파일의 .gz/.br/.zst 압축본 생성 (원본보다 오래된 압축본만 다시 생성)"""
+    minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+    from mimetypes import guess_type
+
+    created = 0
+    for path in Path(directory).rglob("*"):
+        if not path.is_file() or path.suffix in SUFFIXES.values() or path.stat().st_size < minimum_size:
+            continue
+        if not is_compressible(guess_type(path.name)[0]):
+            continue
+        data = None
+        for encoding in ENCODERS:
+            target = path.with_name(path.name + SUFFIXES[encoding])
+            if target.exists() and target.stat().st_mtime >= path.stat().st_mtime:
+                continue
+            data = path.read_bytes() if data is None else data
+            compressed = _compress_file(data, encoding)
+            if len(compressed) >= len(data):
+                continue
+            temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            temp.write_bytes(compressed)
+            os.replace(temp, target)  # 여러 워커가 동시에 시작해도 반쯤 쓰인 파일을 내보내지 않도록
+            created += 1
+    return created
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Accept-Encoding에 맞는 사전 압축본(.zst/.br/.gz)이 있으면 그 파일을 보내고 긴 캐시 헤더를 붙이는 StaticFiles"""
+
+    def __init__(self, *args, max_age=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_age = settings.STATIC_CACHE_MAX_AGE if max_age is None else max_age
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if not isinstance(response, FileResponse) or response.status_code != 200:
+            return response
+
+        available = {e for e in ENCODERS if os.path.exists(str(response.path) + SUFFIXES[e])}
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), available) if available else None
+        if encoding is not None:
+            compressed_path = str(response.path) + SUFFIXES[encoding]
+            original = response.headers
+            response = FileResponse(
+                compressed_path, media_type=response.media_type, stat_result=os.stat(compressed_path)
+            )
+            response.headers["content-encoding"] = encoding
+            # 조건부 요청(If-None-Match/If-Modified-Since)은 원본 기준으로 비교되므로 원본 값을 유지
+            response.headers["etag"] = f"W/{original['etag']}"
+            response.headers["last-modified"] = original["last-modified"]
+        if available:
+            response.headers.add_vary_header("Accept-Encoding")
+        response.headers["cache-control"] = f"public, max-age={self.max_age}"
+        return response
@@ -0,0 +1,104 @@
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.config import settings
+
+# DB 커넥션 풀 설정 / 현황
+# 풀이 가득 찼을 때 커넥션을 얻기까지 기다린 시간과 대기 초과(TimeoutError) 횟수를 기록해 /api/db/pool 로 확인합니다.
+
+# 커넥션을 바로 얻지 못하고 기다린 것으로 볼 최소 시간(초)
+WAIT_THRESHOLD = 0.001
+
+
+class TimedQueuePool(QueuePool):
+    """커넥션 획득 대기 시간을 기록하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.wait_lock:
+                self.checkouts += 1
+                self.timeouts += timed_out
+                if elapsed >= WAIT_THRESHOLD:
+                    self.waits += 1
+                    self.wait_seconds += elapsed
+                    self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+
+    def wait_stats(self):
+        with self.wait_lock:
+            return {
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.wait_seconds / self.waits * 1000, 3) if self.waits else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+# 동기 드라이버 URL → 비동기 드라이버 URL
+ASYNC_DRIVERS = {
+    "mysql": "mysql+asyncmy", "mysql+pymysql": "mysql+asyncmy",
+    "postgresql": "postgresql+asyncpg", "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_url(url):
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+def engine_options(url, is_async=False):
+    """create_engine / create_async_engine 인자 (SQLite는 파일 잠금 특성상 풀 설정 없이 기본값 사용)
+
+    비동기 엔진은 asyncio용 기본 풀(AsyncAdaptedQueuePool)을 사용하므로 대기 시간 기록은 동기 엔진만 합니다.
+    """
+    if url.startswith("sqlite"):
+        # aiosqlite 기본 NullPool은 요청마다 연결(+전용 스레드)을 새로 만들므로 풀 사용
+        return {"connect_args": {"check_same_thread": False}, **({"poolclass": AsyncAdaptedQueuePool} if is_async else {})}
+    options = {} if is_async else {"poolclass": TimedQueuePool}
+    return {
+        **options,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "Y",
+    }
+
+
+def pool_status(engine):
+    """풀 종류별 사용 중/유휴/초과 커넥션 수와 대기 통계"""
+    pool = engine.pool
+    status = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),  # 생성 전 자리는 음수로 표시되므로 0으로 맞춤
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "recycle": pool._recycle,
+            "pre_ping": pool._pre_ping,
+        })
+    if isinstance(pool, TimedQueuePool):
+        status.update(pool.wait_stats())
+    return status
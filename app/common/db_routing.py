@@ -0,0 +1,162 @@
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+# 읽기 복제본(replica) 라우팅
+# 조회 API 세션의 SELECT는 복제 지연이 허용 범위 이내인 복제본으로 순환(round-robin) 분배하고,
+# 쓰기(INSERT/UPDATE/DELETE, flush)와 그 이후의 같은 세션 조회, 텍스트 SQL은 primary로 보냅니다.
+
+# 요청 처리 중 복제본에서 조회한 복제본 순번을 담는 set (응답 캐시 미들웨어가 요청마다 설정)
+replica_reads = ContextVar("replica_reads", default=None)
+
+
+def _mysql_lag(conn):
+    for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):  # 8.0.22 미만은 SLAVE
+        try:
+            row = conn.execute(text(statement)).mappings().first()
+            break
+        except Exception:
+            continue
+    else:
+        return 0.0
+    if row is None:
+        return 0.0  # 복제 설정이 없는 서버 (단독 인스턴스)
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return float("inf") if lag is None else float(lag)  # NULL: 복제 중지
+
+
+def _postgresql_lag(conn):
+    # 수신한 WAL을 모두 반영했으면 primary에 쓰기가 없어 replay 시각이 오래된 것이므로 지연 0
+    return float(conn.execute(text(
+        "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0"
+        " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+        " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    )).scalar())
+
+
+LAG_PROBES = {"mysql": _mysql_lag, "postgresql": _postgresql_lag}
+
+
+def replica_lag(engine):
+    """복제 지연(초) - 지연을 알 수 없는 DB(SQLite 등)는 0, 접속 실패는 무한대"""
+    probe = LAG_PROBES.get(engine.dialect.name)
+    if probe is None:
+        return 0.0
+    try:
+        with engine.connect() as conn:
+            return probe(conn)
+    except Exception as e:
+        logger.warning(f"[DB 복제본] 지연 확인 실패 {engine.url.render_as_string(hide_password=True)}: {e}")
+        return float("inf")
+
+
+class ReplicaSet:
+    """복제본 엔진 목록 + 복제 지연 상태
+
+    지연 확인(접속 + 복제 상태 조회)은 백그라운드 스레드가 check_interval초마다 수행하고,
+    next_index()는 마지막 확인 결과만 읽으므로 접속이 안 되는 복제본이 있어도 요청(이벤트 루프)이 멈추지 않습니다.
+    아직 한 번도 확인하지 않은 복제본은 사용하지 않습니다. (첫 확인 전까지는 primary)
+    """
+
+    def __init__(self, engines, max_lag=30, check_interval=10, lag_probe=replica_lag):
+        self.engines = list(engines)
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag_probe = lag_probe
+        self.lags = [float("inf")] * len(self.engines)
+        self.checked_at = [None] * len(self.engines)
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def refresh(self):
+        """모든 복제본의 지연을 확인해 lags를 갱신 (백그라운드 스레드에서 호출)"""
+        for index, engine in enumerate(self.engines):
+            lag = self.lag_probe(engine)
+            with self.lock:
+                self.lags[index] = lag
+                self.checked_at[index] = time.monotonic()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"[DB 복제본] 지연 확인 오류: {e}")
+            self._stop.wait(self.check_interval)
+
+    def start(self):
+        """지연 확인 스레드 시작 (이미 실행 중이면 무시)"""
+        with self.lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="replica-lag", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self.lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout=self.check_interval)
+
+    def lag(self, index):
+        """마지막으로 확인한 복제 지연(초) - 확인 전이면 무한대"""
+        return self.lags[index]
+
+    def next_index(self):
+        """지연이 허용 범위 이내인 다음 복제본 순번 (없으면 None)"""
+        if self._thread is None:
+            self.start()
+        start = next(self.counter)
+        for step in range(len(self.engines)):
+            index = (start + step) % len(self.engines)
+            if self.lag(index) <= self.max_lag:
+                return index
+        return None
+
+    def status(self):
+        return [
+            {"url": engine.url.render_as_string(hide_password=True), "lag": self.lags[i],
+             "healthy": self.lags[i] <= self.max_lag, "checked": self.checked_at[i] is not None}
+            for i, engine in enumerate(self.engines)
+        ]
+
+
+class RoutingSession(Session):
+    """SELECT는 복제본, 나머지는 primary(bind)로 보내는 Session
+
+    replicas: ReplicaSet (None이면 항상 primary)
+    replica_binds: 실제 실행할 엔진 목록 (AsyncSession에서는 비동기 복제본 엔진의 sync_engine, 기본값 replicas.engines)
+    한 번 primary로 쓰기를 보낸 세션은 이후 조회도 primary를 사용합니다. (방금 쓴 데이터를 복제 지연 없이 조회)
+    """
+
+    def __init__(self, *args, replicas=None, replica_binds=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.replica_binds = replica_binds if replica_binds is not None else (replicas.engines if replicas else [])
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if self.replicas is None or not self.replica_binds or self.info.get("use_primary"):
+            return primary
+        if self._flushing or not isinstance(clause, Select) or clause._for_update_arg is not None:
+            if self._flushing or getattr(clause, "is_dml", False):
+                self.info["use_primary"] = True
+            return primary
+        index = self.replicas.next_index()
+        if index is None:
+            return primary
+        reads = replica_reads.get()
+        if reads is not None:
+            reads.add(index)
+        return self.replica_binds[index]
@@ -0,0 +1,63 @@
+import logging
+import pandas as pd
+from sqlalchemy import BigInteger, Float, Integer, Numeric, String
+from app.db import engine
+
+logger = logging.getLogger(__name__)
+
+
+def coerce_frame(df, model):
+    """DataFrame을 모델 컬럼 타입에 맞게 컬럼 단위로 일괄 변환 (행 단위 변환 없음)
+
+    모델에 없는 컬럼과 자동 증가 PK는 제외합니다.
+    """
+    table = model.__table__
+    out = pd.DataFrame(index=df.index)
+    for column in table.columns:
+        if column.primary_key and column.autoincrement in (True, "auto"):
+            continue
+        if column.name not in df.columns:
+            continue
+        series = df[column.name]
+        if hasattr(column.type, "coerce_series"):
+            # 문자열 ↔ DATE/DATETIME/숫자 변환 컬럼 (app.common.types)
+            out[column.name] = column.type.coerce_series(series)
+        elif isinstance(column.type, (Integer, BigInteger)):
+            out[column.name] = pd.to_numeric(series, errors="coerce").round().astype("Int64")
+        elif isinstance(column.type, (Float, Numeric)):
+            out[column.name] = pd.to_numeric(series, errors="coerce").astype("float64")
+        elif isinstance(column.type, String):
+            if pd.api.types.is_datetime64_any_dtype(series):
+                series = series.dt.strftime("%Y-%m-%d")
+            out[column.name] = series.astype(object).where(series.notna(), None).map(
+                lambda v: v if v is None or isinstance(v, str) else str(v)
+            )
+        else:
+            out[column.name] = series
+    return out
+
+
+def replace_partition(df, model, key_col="strd_dt", chunksize=500, scope=None):
+    """key_col 값(예: strd_dt)이 같은 기존 행을 지우고 DataFrame을 다건 INSERT로 적재
+
+    삭제와 적재를 하나의 트랜잭션에서 처리하므로 중간에 실패하면 기존 데이터가 유지됩니다.
+    scope: 삭제 범위를 더 좁힐 컬럼 조건 {컬럼명: 값}
+    """
+    if df is None or df.empty:
+        return 0
+
+    frame = coerce_frame(df, model)
+    keys = frame[key_col].dropna().unique().tolist()
+    key = getattr(model, key_col)
+
+    with engine.begin() as conn:
+        stmt = model.__table__.delete().where(key.in_(keys))
+        for col, value in (scope or {}).items():
+            stmt = stmt.where(getattr(model, col) == value)
+        deleted = conn.execute(stmt).rowcount
+        frame.to_sql(
+            model.__tablename__, con=conn, if_exists="append", index=False,
+            method="multi", chunksize=chunksize
+        )
+    logger.info(f"[DB 적재] {model.__tablename__} {key_col}={keys}: {deleted}건 삭제, {len(frame)}건 적재")
+    return len(frame)
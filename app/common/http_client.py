@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import threading
+import time
+import httpx
+import requests
+from app.config import settings
+from app.common.rate_governor import governor
+from app.common.resilience import IDEMPOTENT_METHODS, RETRY_STATUSES, Retry, breaker, retry_after
+
+logger = logging.getLogger(__name__)
+
+# 크롤러 공용 HTTP 클라이언트
+# 모든 외부 호출은 호출 제한(app.common.rate_governor)과 재시도 / 서킷 브레이커(app.common.resilience)를 거치고,
+# timeout을 지정하지 않으면 HTTP_TIMEOUT을 사용합니다.
+# 재시도 대상: 접속 오류 / timeout, 429·5xx 응답 (POST 등 멱등이 아닌 요청은 서버가 처리하지 않은 429와 접속 실패만)
+# 재시도를 모두 실패한 응답은 그대로 돌려주므로 호출하는 쪽의 raise_for_status() 처리는 그대로입니다.
+
+
+def _retry_delay(retry, method, status_code=None, headers=None, error=None):
+    """재시도 전 대기 시간 (재시도하지 않으면 None)"""
+    idempotent = method.upper() in IDEMPOTENT_METHODS
+    if error is not None:
+        connect_failed = isinstance(error, (requests.ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout))
+        return retry.next_delay() if idempotent or connect_failed else None
+    if status_code not in RETRY_STATUSES or not (idempotent or status_code == 429):
+        return None
+    return retry.next_delay(retry_after(headers.get("Retry-After")))
+
+
+class GovernedSession(requests.Session):
+    """호출 제한 + 재시도 + 서킷 브레이커를 적용하는 requests.Session
+
+    source: 제한을 적용할 소스 이름 (생략하면 요청 URL의 호스트로 판단)
+    요청마다 cost=로 할당량 차감 단위, retries=로 최대 시도 횟수를 지정할 수 있습니다.
+    """
+
+    def __init__(self, source=None, timeout=None):
+        super().__init__()
+        self.source = source
+        self.timeout = timeout or settings.HTTP_TIMEOUT
+
+    def request(self, method, url, *args, cost=1, retries=None, **kwargs):
+        target = self.source or url
+        circuit = breaker(governor.resolve(target)[0].name)
+        retry = Retry(retries)
+        timeout = kwargs.pop("timeout", None) or self.timeout
+        while True:
+            circuit.allow()
+            try:
+                with governor.limit(target, cost=cost):
+                    response = super().request(method, url, *args, timeout=retry.timeout(timeout), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                circuit.failure()
+                delay = _retry_delay(retry, method, error=e)
+                if delay is None:
+                    raise
+                logger.warning(f"[HTTP 재시도] {method} {url} {retry.attempt}회 실패, {delay:.1f}초 후 재시도: {e}")
+                time.sleep(delay)
+                continue
+            except Exception:
+                circuit.release()  # 할당량 초과 등 업스트림과 무관한 오류
+                raise
+            if response.status_code >= 500:
+                circuit.failure()
+            else:
+                circuit.success()
+            delay = _retry_delay(retry, method, response.status_code, response.headers)
+            if delay is None:
+                return response
+            logger.warning(f"[HTTP 재시도] {method} {url} 응답 {response.status_code}, {delay:.1f}초 후 재시도")
+            response.close()
+            time.sleep(delay)
+
+
+class GovernedAsyncTransport(httpx.AsyncBaseTransport):
+    """호출 제한 + 재시도 + 서킷 브레이커를 적용하는 httpx 비동기 전송 계층 (AsyncClient(transport=...)로 사용)"""
+
+    def __init__(self, source=None, retries=None, **kwargs):
+        self.source = source
+        self.retries = retries
+        self.transport = httpx.AsyncHTTPTransport(**kwargs)
+
+    async def handle_async_request(self, request):
+        target = self.source or request.url.host
+        circuit = breaker(governor.resolve(target)[0].name)
+        retry = Retry(self.retries)
+        while True:
+            circuit.allow()
+            try:
+                async with governor.limit_async(target):
+                    response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                circuit.failure()
+                delay = _retry_delay(retry, request.method, error=e)
+                if delay is None:
+                    raise
+                logger.warning(f"[HTTP 재시도] {request.method} {request.url} {retry.attempt}회 실패, {delay:.1f}초 후 재시도: {e}")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                circuit.release()
+                raise
+            if response.status_code >= 500:
+                circuit.failure()
+            else:
+                circuit.success()
+            delay = _retry_delay(retry, request.method, response.status_code, response.headers)
+            if delay is None:
+                return response
+            logger.warning(f"[HTTP 재시도] {request.method} {request.url} 응답 {response.status_code}, {delay:.1f}초 후 재시도")
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+# 스레드마다 세션 하나 (스케줄러 작업이 여러 스레드에서 동시에 실행되므로 세션을 스레드 간에 공유하지 않음)
+_local = threading.local()
+
+
+def session():
+    if not hasattr(_local, "session"):
+        _local.session = GovernedSession()
+    return _local.session
+
+
+def get(url, **kwargs):
+    return session().get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    return session().post(url, **kwargs)
@@ -0,0 +1,61 @@
+import datetime
+import decimal
+import orjson
+import pandas as pd
+from fastapi.responses import ORJSONResponse, Response
+
+# orjson 기반 응답 (FastAPI 기본 응답 클래스)
+# 엔드포인트가 dict를 반환하면 FastAPI가 jsonable_encoder를 거치므로, 행이 많은 목록은
+# rows_response / frame_response 로 Response를 직접 반환해 변환 단계를 건너뜁니다.
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value):
+    """orjson이 직접 처리하지 못하는 타입 (Decimal, pandas Timestamp/NA 등)"""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(value).__name__}")
+
+
+def dumps(content):
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content):
+        return dumps(content)
+
+
+def _wrap(fields, key, items_json):
+    """{**fields, key: <이미 직렬화된 배열>} 본문을 바이트 연결로 생성"""
+    head = dumps(fields)[:-1]  # 마지막 '}' 제거
+    separator = b"," if fields else b""
+    return head + separator + dumps(key) + b":" + items_json + b"}"
+
+
+def rows_response(rows, columns, key="items", status_code=200, **fields):
+    """DB 조회 결과 행(튜플)을 ORM 객체/jsonable_encoder 없이 바로 JSON 응답으로 변환
+
+    columns: 응답 키 순서 (컬럼 속성 또는 문자열), rows는 db.query(*컬럼).all() 결과
+    """
+    keys = [c if isinstance(c, str) else c.key for c in columns]
+    items_json = dumps([dict(zip(keys, row)) for row in rows])
+    return Response(_wrap(fields, key, items_json), status_code=status_code, media_type="application/json")
+
+
+def frame_response(df, key="rows", status_code=200, **fields):
+    """DataFrame을 records 형식 JSON으로 바로 변환 (df.to_dict 없이 행 튜플을 orjson으로 직렬화)
+
+    df.to_json은 실수를 유효 숫자 10자리(double_precision)로 잘라 쓰므로 사용하지 않고,
+    orjson으로 float 값을 손실 없이 출력합니다. (NaN/NaT는 null)
+    """
+    keys = list(df.columns)
+    items_json = dumps([dict(zip(keys, row)) for row in df.itertuples(index=False, name=None)])
+    return Response(_wrap(fields, key, items_json), status_code=status_code, media_type="application/json")
@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+from app.config import settings
+
+# 외부 호출 속도 / 동시 호출 / 일일 할당량 관리
+# 여러 크롤러(스케줄러 작업, /api/run/*)가 같은 업스트림을 동시에 호출해도 호스트별 토큰 버킷으로 초당 호출 수를,
+# 소스별로 동시 호출 수와 일일 할당량(호출 수 또는 YouTube 단위)을 함께 제한합니다.
+# 할당량은 프로세스 메모리에 집계하므로 크롤러는 스케줄러가 도는 한 프로세스에서 실행하는 것을 전제로 합니다.
+
+# 소스 이름 → 호스트, 초당 호출 수(rate), 순간 허용량(burst), 최대 동시 호출 수, 일일 할당량(0이면 제한 없음), 할당량 초기화 기준 시간대
+# hosts가 없는 소스(라이브러리 호출)는 소스 이름으로 직접 지정합니다.
+SOURCES = {
+    "naver-openapi": {
+        "hosts": ["openapi.naver.com"], "rate": settings.NAVER_SEARCH_MAX_QPS,
+        "max_concurrency": settings.NAVER_SEARCH_MAX_CONNECTIONS, "daily_quota": settings.NAVER_SEARCH_DAILY_QUOTA,
+    },
+    "naver-finance": {"hosts": ["finance.naver.com"], "rate": 2, "max_concurrency": 2},
+    "youtube": {
+        "hosts": ["youtube.googleapis.com"], "rate": 5, "max_concurrency": 4,
+        "daily_quota": settings.YOUTUBE_DAILY_QUOTA, "timezone": "America/Los_Angeles",  # 태평양 시간 자정 초기화
+    },
+    "seoul-openapi": {
+        "hosts": ["openapi.seoul.go.kr"], "rate": 5, "max_concurrency": 2,
+        "daily_quota": settings.PUBLIC_DATA_DAILY_QUOTA,
+    },
+    "kma-apihub": {
+        "hosts": ["apihub.kma.go.kr"], "rate": 5, "max_concurrency": 2,
+        "daily_quota": settings.PUBLIC_DATA_DAILY_QUOTA,
+    },
+    "data-go-kr": {
+        "hosts": ["apis.data.go.kr"], "rate": 5, "max_concurrency": 2,
+        "daily_quota": settings.PUBLIC_DATA_DAILY_QUOTA,
+    },
+    "jeju-datahub": {
+        "hosts": ["open.jejudatahub.net"], "rate": 2, "max_concurrency": 2,
+        "daily_quota": settings.PUBLIC_DATA_DAILY_QUOTA,
+    },
+    "kakao": {"hosts": ["kapi.kakao.com", "kauth.kakao.com"], "rate": 2, "max_concurrency": 1},
+    "finance-data-reader": {"rate": 5, "max_concurrency": settings.MARKET_FETCH_WORKERS},
+}
+
+
+class QuotaExceeded(RuntimeError):
+    """일일 할당량 초과 (호출하지 않고 바로 실패)"""
+
+
+class TokenBucket:
+    """초당 rate개 토큰이 채워지는 버킷 (최대 burst개)
+
+    take()는 토큰을 먼저 예약하고 기다릴 시간(초)을 돌려주므로 동기 / 비동기 호출이 같은 버킷을 나눠 씁니다.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1, rate)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        if self.rate <= 0:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+            self.updated = now
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class Source:
+    """소스 하나의 호스트별 버킷, 동시 호출 수, 일일 사용량"""
+
+    def __init__(self, name, hosts=(), rate=0, burst=None, max_concurrency=0, daily_quota=0,
+                 timezone=settings.SCHEDULER_TIMEZONE):
+        self.name = name
+        self.hosts = list(hosts)
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.daily_quota = daily_quota
+        self.timezone = ZoneInfo(timezone)
+        self.buckets = {}
+        self.active = 0
+        self.used = 0
+        self.quota_dt = None
+        self.waited = 0.0
+        self.rejected = 0
+        self.cond = threading.Condition()
+
+    def bucket(self, key):
+        with self.cond:
+            if key not in self.buckets:
+                self.buckets[key] = TokenBucket(self.rate, self.burst)
+            return self.buckets[key]
+
+    def charge(self, cost):
+        """일일 사용량 차감 (할당량을 넘으면 QuotaExceeded)"""
+        today = datetime.now(self.timezone).strftime('%Y%m%d')
+        with self.cond:
+            if self.quota_dt != today:
+                self.quota_dt, self.used = today, 0
+            if self.daily_quota and self.used + cost > self.daily_quota:
+                self.rejected += 1
+                raise QuotaExceeded(f"[호출 제한] {self.name} 일일 할당량 초과 ({self.used}/{self.daily_quota})")
+            self.used += cost
+
+    def try_enter(self):
+        with self.cond:
+            if self.max_concurrency and self.active >= self.max_concurrency:
+                return False
+            self.active += 1
+            return True
+
+    def enter(self):
+        with self.cond:
+            while self.max_concurrency and self.active >= self.max_concurrency:
+                self.cond.wait()
+            self.active += 1
+
+    def leave(self):
+        with self.cond:
+            self.active -= 1
+            self.cond.notify()
+
+    def add_wait(self, seconds):
+        with self.cond:
+            self.waited += seconds
+
+    def status(self):
+        with self.cond:
+            return {
+                "hosts": self.hosts, "rate": self.rate, "max_concurrency": self.max_concurrency,
+                "active": self.active, "daily_quota": self.daily_quota, "used": self.used,
+                "quota_dt": self.quota_dt, "rejected": self.rejected, "waited_seconds": round(self.waited, 3),
+            }
+
+
+class RateGovernor:
+    """호출 대상(URL, 호스트, 소스 이름) → 소스 제한 적용
+
+    SOURCES에 없는 호스트는 기본 제한(HTTP_DEFAULT_RATE / HTTP_DEFAULT_CONCURRENCY)으로 호스트마다 소스를 만듭니다.
+    """
+
+    def __init__(self, sources=SOURCES):
+        self.sources = {name: Source(name, **spec) for name, spec in sources.items()}
+        self.hosts = {host: source for source in self.sources.values() for host in source.hosts}
+        self.lock = threading.Lock()
+
+    def resolve(self, target):
+        """(소스, 버킷 키) - target은 소스 이름, 호스트 또는 URL"""
+        if target in self.sources:
+            return self.sources[target], target
+        host = (urlsplit(target).hostname if "://" in target else target).lower()
+        with self.lock:
+            source = self.hosts.get(host)
+            if source is None:
+                source = self.hosts[host] = Source(
+                    host, hosts=[host], rate=settings.HTTP_DEFAULT_RATE,
+                    max_concurrency=settings.HTTP_DEFAULT_CONCURRENCY,
+                )
+        return source, host
+
+    @contextmanager
+    def limit(self, target, cost=1):
+        source, key = self.resolve(target)
+        source.charge(cost)
+        source.enter()
+        try:
+            wait = source.bucket(key).take()
+            if wait:
+                source.add_wait(wait)
+                time.sleep(wait)
+            yield source
+        finally:
+            source.leave()
+
+    @asynccontextmanager
+    async def limit_async(self, target, cost=1):
+        source, key = self.resolve(target)
+        source.charge(cost)
+        # 이벤트 루프를 막지 않도록 동시 호출 자리는 짧게 기다리며 다시 시도
+        while not source.try_enter():
+            await asyncio.sleep(0.01)
+        try:
+            wait = source.bucket(key).take()
+            if wait:
+                source.add_wait(wait)
+                await asyncio.sleep(wait)
+            yield source
+        finally:
+            source.leave()
+
+    def status(self):
+        with self.lock:
+            sources = {source.name: source for source in [*self.sources.values(), *self.hosts.values()]}
+        return {name: source.status() for name, source in sources.items()}
+
+
+governor = RateGovernor()
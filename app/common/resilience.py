@@ -0,0 +1,162 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 외부 호출 재시도 / 서킷 브레이커
+# 재시도는 호출 1건의 전체 시간(deadline) 안에서 지수 백오프 + 지터(full jitter)로 기다리고, 서버가 Retry-After를 주면 그 시간을 따릅니다.
+# 업스트림(소스 또는 호스트)별 서킷 브레이커는 연속 실패가 CIRCUIT_FAILURE_THRESHOLD회를 넘으면 CIRCUIT_RESET_TIMEOUT초 동안
+# 호출하지 않고 바로 실패(CircuitOpen)하며, 그 뒤 한 건만 시험 호출해 성공하면 다시 닫습니다.
+
+# 재시도할 HTTP 상태 코드 / 재시도해도 중복 처리되지 않는 메서드 (POST는 429만 재시도)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class CircuitOpen(RuntimeError):
+    """서킷이 열려 있어 호출하지 않고 실패"""
+
+
+def backoff_delay(attempt, base=None, cap=None):
+    """attempt번째(0부터) 재시도 전 대기 시간 - 0 ~ min(cap, base * 2^attempt) 사이 무작위"""
+    base = settings.HTTP_RETRY_BACKOFF if base is None else base
+    cap = settings.HTTP_RETRY_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 초 (없거나 해석할 수 없으면 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class Retry:
+    """호출 1건의 재시도 상태 (시도 횟수, 남은 시간)"""
+
+    def __init__(self, max_attempts=None, deadline=None):
+        self.max_attempts = max_attempts or settings.HTTP_RETRY_MAX_ATTEMPTS
+        self.deadline_at = time.monotonic() + (deadline or settings.HTTP_RETRY_DEADLINE)
+        self.attempt = 0
+
+    def remaining(self):
+        return max(0.0, self.deadline_at - time.monotonic())
+
+    def timeout(self, timeout):
+        """시도 1회의 timeout (남은 시간보다 길지 않게)"""
+        if isinstance(timeout, (int, float)):
+            return max(0.1, min(timeout, self.remaining()))
+        return timeout
+
+    def next_delay(self, wait=None):
+        """다음 재시도 전 대기 시간 - 재시도 횟수를 다 썼거나 deadline을 넘기면 None"""
+        self.attempt += 1
+        if self.attempt >= self.max_attempts:
+            return None
+        delay = backoff_delay(self.attempt - 1) if wait is None else wait
+        return delay if delay < self.remaining() else None
+
+
+class CircuitBreaker:
+    """업스트림 하나의 서킷 상태 (closed → open → half_open → closed)"""
+
+    def __init__(self, name, failure_threshold=None, reset_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or settings.CIRCUIT_RESET_TIMEOUT
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """호출 가능 여부 확인 (열려 있으면 CircuitOpen)"""
+        with self.lock:
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state, self.probing = "half_open", False
+            if self.state == "closed" or (self.state == "half_open" and not self.probing):
+                self.probing = self.state == "half_open"
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        raise CircuitOpen(f"[서킷 브레이커] {self.name} 호출 차단 중 ({retry_in:.0f}초 후 재시도)")
+
+    def success(self):
+        with self.lock:
+            if self.state != "closed":
+                logger.info(f"[서킷 브레이커] {self.name} 복구")
+            self.state, self.failures, self.probing = "closed", 0, False
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(f"[서킷 브레이커] {self.name} 연속 실패 {self.failures}회, {self.reset_timeout}초 동안 차단")
+                self.state, self.opened_at, self.probing = "open", time.monotonic(), False
+
+    def release(self):
+        """결과를 판단할 수 없는 호출 종료 (시험 호출 자리만 반납)"""
+        with self.lock:
+            self.probing = False
+
+    def status(self):
+        with self.lock:
+            return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker(name):
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+def breakers_status():
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.status() for b in breakers}
+
+
+def call(name, func, retryable=lambda e: True, max_attempts=None, deadline=None):
+    """HTTP 클라이언트를 거치지 않는 외부 호출(라이브러리)을 재시도 + 서킷 브레이커로 실행
+
+    retryable(예외)가 False인 오류(잘못된 요청, 할당량 초과 등)는 업스트림 장애로 보지 않고 바로 다시 발생시킵니다.
+    """
+    circuit = breaker(name)
+    retry = Retry(max_attempts, deadline)
+    while True:
+        circuit.allow()
+        try:
+            result = func()
+        except Exception as e:
+            if not retryable(e):
+                circuit.success()
+                raise
+            circuit.failure()
+            delay = retry.next_delay()
+            if delay is None:
+                raise
+            logger.warning(f"[재시도] {name} {retry.attempt}회 실패, {delay:.1f}초 후 재시도: {e}")
+            time.sleep(delay)
+            continue
+        circuit.success()
+        return result
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+from app.config import settings
+from app.common.db_routing import replica_reads
+
+logger = logging.getLogger(__name__)
+
+# GET 응답 캐시 (경로 + 쿼리 파라미터 → 응답 본문, ETag)
+# 캐시 키에 조회 테이블의 버전을 포함하고, 테이블에 쓰기가 커밋되면 버전을 올려 이전 응답을 무효화합니다.
+# 무효화 후 복제 지연 허용 시간(DB_REPLICA_MAX_LAG) 동안 복제본에서 읽은 응답은 아직 쓰기가 반영되지 않았을 수 있어 저장하지 않습니다.
+
+
+class LocalCacheBackend:
+    """프로세스 내 LRU + TTL 저장소 (공유 저장소가 없을 때 / 테스트용 대체 구현)"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.versions = {}
+        self.written_at = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_versions(self, tables):
+        with self.lock:
+            return [self.versions.get(table, 0) for table in tables]
+
+    def bump_version(self, table):
+        with self.lock:
+            self.versions[table] = self.versions.get(table, 0) + 1
+            self.written_at[table] = time.time()
+
+    def get_written_at(self, tables):
+        with self.lock:
+            return [self.written_at.get(table, 0.0) for table in tables]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def size(self):
+        return len(self.entries)
+
+
+class RedisCacheBackend:
+    """여러 워커/서버가 공유하는 Redis 저장소 (redis 패키지 필요)"""
+
+    def __init__(self, url):
+        import redis
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        return self.client.get(key)
+
+    def set(self, key, value, ttl):
+        self.client.set(key, value, ex=ttl)
+
+    def get_versions(self, tables):
+        return [int(v or 0) for v in self.client.mget([f"resp-ver:{table}" for table in tables])]
+
+    def bump_version(self, table):
+        # 무효화 시각은 다른 워커도 복제본 응답 저장 여부를 판단할 수 있도록 함께 공유
+        self.client.pipeline().incr(f"resp-ver:{table}").set(f"resp-written:{table}", time.time()).execute()
+
+    def get_written_at(self, tables):
+        return [float(v or 0) for v in self.client.mget([f"resp-written:{table}" for table in tables])]
+
+    def clear(self):
+        for key in self.client.scan_iter("resp:*"):
+            self.client.delete(key)
+
+    def size(self):
+        return sum(1 for _ in self.client.scan_iter("resp:*"))
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl, replica_max_lag=0):
+        self.backend = backend
+        self.ttl = ttl
+        self.replica_max_lag = replica_max_lag
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def key_for(self, path, query_params, tables):
+        query = "&".join(f"{k}={v}" for k, v in sorted(query_params.multi_items()))
+        versions = ",".join(f"{t}:{v}" for t, v in zip(tables, self.backend.get_versions(tables)))
+        return f"resp:{path}?{query}|{versions}"
+
+    def get(self, key):
+        raw = self.backend.get(key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        header, _, body = raw.partition(b"\n")
+        return json.loads(header), body
+
+    def set(self, key, body, media_type, store=True):
+        meta = {"etag": f'"{hashlib.sha1(body).hexdigest()}"', "media_type": media_type}
+        if store:
+            self.backend.set(key, json.dumps(meta).encode() + b"\n" + body, self.ttl)
+        else:
+            self.skipped += 1
+        return meta, body
+
+    def recently_written(self, tables):
+        """테이블 중 복제 지연 허용 시간 안에 무효화된(쓰기가 커밋된) 것이 있는지"""
+        since = time.time() - self.replica_max_lag
+        return any(written_at > since for written_at in self.backend.get_written_at(tables))
+
+    def invalidate(self, *tables):
+        for table in tables:
+            self.backend.bump_version(table)
+        logger.info(f"[응답 캐시] 무효화: {sorted(tables)}")
+
+    def stats(self):
+        return {
+            "backend": type(self.backend).__name__, "ttl": self.ttl, "entries": self.backend.size(),
+            "hits": self.hits, "misses": self.misses, "skipped": self.skipped,
+        }
+
+
+def create_backend():
+    if settings.RESPONSE_CACHE_URL:
+        try:
+            return RedisCacheBackend(settings.RESPONSE_CACHE_URL)
+        except ImportError:
+            logger.warning("[응답 캐시] redis 패키지가 없어 프로세스 내 캐시를 사용합니다.")
+    return LocalCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(create_backend(), settings.RESPONSE_CACHE_TTL, settings.DB_REPLICA_MAX_LAG)
+
+
+def track_table_writes(engine):
+    """INSERT/UPDATE/DELETE한 테이블을 기록했다가 커밋 후 커넥션이 풀로 반환될 때 캐시 무효화
+
+    커밋 직전(commit 이벤트)에 무효화하면 그 사이 조회한 이전 데이터가 새 버전 키로 캐시될 수 있어
+    실제 커밋이 끝난 뒤(checkin)에 버전을 올립니다.
+    """
+
+    @event.listens_for(engine, "after_execute")
+    def collect(conn, clauseelement, multiparams, params, execution_options, result):
+        table = getattr(clauseelement, "table", None)
+        if getattr(clauseelement, "is_dml", False) and table is not None:
+            conn.info.setdefault("cache_pending_tables", set()).add(table.name)
+
+    @event.listens_for(engine, "commit")
+    def committed(conn):
+        pending = conn.info.pop("cache_pending_tables", None)
+        if pending:
+            conn.info.setdefault("cache_committed_tables", set()).update(pending)
+
+    @event.listens_for(engine, "rollback")
+    def rolled_back(conn):
+        conn.info.pop("cache_pending_tables", None)
+
+    @event.listens_for(engine, "checkin")
+    def released(dbapi_connection, connection_record):
+        if connection_record is None:
+            return
+        tables = connection_record.info.pop("cache_committed_tables", None)
+        if tables:
+            response_cache.invalidate(*tables)
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """routes(경로 → 조회 테이블, 하위 경로 포함)에 등록된 GET 응답을 캐시하고 ETag / 304 Not Modified 처리
+
+    조회 테이블이 None인 경로(스트리밍 응답 등)는 캐시하지 않습니다.
+    """
+
+    def __init__(self, app, routes):
+        super().__init__(app)
+        # 긴 경로 우선 매칭
+        self.routes = sorted(routes.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def tables_for(self, path):
+        for prefix, tables in self.routes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return tables
+        return None
+
+    async def dispatch(self, request, call_next):
+        if request.method != "GET" or settings.RESPONSE_CACHE_YN != "Y":
+            return await call_next(request)
+        tables = self.tables_for(request.url.path)
+        if tables is None:
+            return await call_next(request)
+
+        # 테이블 버전을 조회 전에 읽어야 조회 도중 커밋된 쓰기가 있어도 새 데이터가 이전 키로만 저장됨
+        key = response_cache.key_for(request.url.path, request.query_params, tables)
+        cached = response_cache.get(key)
+        status = "HIT"
+        if cached is None:
+            # 엔드포인트 실행(다른 태스크/스레드)에 같은 set이 전달되어 복제본 조회 여부가 기록됨
+            reads = set()
+            token = replica_reads.set(reads)
+            try:
+                response = await call_next(request)
+                if response.status_code != 200:
+                    return response
+                body = b"".join([chunk async for chunk in response.body_iterator])
+            finally:
+                replica_reads.reset(token)
+            # 방금 무효화된 테이블을 복제본에서 읽었으면 아직 반영 전일 수 있으므로 응답만 하고 저장하지 않음
+            store = not (reads and response_cache.recently_written(tables))
+            cached = response_cache.set(key, body, response.headers.get("content-type"), store=store)
+            status = "MISS" if store else "SKIP"
+
+        meta, body = cached
+        headers = {"ETag": meta["etag"], "Cache-Control": "no-cache", "X-Cache": status}
+        if meta["etag"] in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, headers={**headers, "Content-Type": meta["media_type"]})
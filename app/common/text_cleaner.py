@@ -0,0 +1,73 @@
+import html
+import re
+import unicodedata
+from functools import lru_cache
+
+# 배치 정제: 건별로 정규식을 돌리지 않고 전체 문자열을 구분자로 이어 붙여 한 번에 치환한 뒤 다시 나눔
+_SEP = "\x00"
+_TAG_RE = re.compile(r"<[^>\x00]+>")  # 구분자를 넘어 다른 항목까지 지우지 않도록 \x00 제외
+_HIGHLIGHT_TAGS = ("<b>", "</b>")      # 검색 API 강조 태그 (정규식 없이 먼저 제거)
+_SPECIAL_CHARS = ("'", "#")
+
+
+class TextCleaner:
+    """HTML 태그/엔티티 제거, 키워드 제거, NFC 정규화, 공백 정리를 수행하는 정제기"""
+
+    def __init__(self, strip_terms=()):
+        # 긴 단어부터 제거 (짧은 단어가 긴 단어의 일부만 지우지 않도록)
+        self.strip_terms = sorted({unicodedata.normalize("NFC", t) for t in strip_terms if t}, key=len, reverse=True)
+
+    def clean_batch(self, texts, max_len=None):
+        """문자열 목록 전체를 한 번에 정제 (max_len을 주면 정제 후 앞부분만)"""
+        texts = [text or "" for text in texts]
+        if not texts:
+            return []
+        joined = _SEP.join(texts)
+        if joined.count(_SEP) != len(texts) - 1:  # 원문에 구분자가 있으면 제거 후 다시 연결
+            joined = _SEP.join(text.replace(_SEP, "") for text in texts)
+
+        if "&" in joined:
+            # 엔티티를 먼저 복원해야 &lt;b&gt;, &#39; 등도 태그/특수문자로 함께 제거됨
+            joined = html.unescape(joined)
+        joined = unicodedata.normalize("NFC", joined)
+        for tag in _HIGHLIGHT_TAGS:
+            joined = joined.replace(tag, "")
+        if "<" in joined:
+            joined = _TAG_RE.sub("", joined)
+        for term in (*_SPECIAL_CHARS, *self.strip_terms):
+            joined = joined.replace(term, "")
+
+        # 연속 공백과 탭/개행 등 whitespace를 공백 하나로 정리 (앞뒤 공백 제거)
+        cleaned = [" ".join(part.split()) for part in joined.split(_SEP)]
+        if max_len is not None:
+            cleaned = [text[:max_len].rstrip() for text in cleaned]
+        return cleaned
+
+
+@lru_cache(maxsize=4096)
+def get_cleaner(strip_terms=()):
+    """제거 단어 조합별 정제기 캐시 (단어 정규화/정렬 재사용)"""
+    return TextCleaner(strip_terms)
+
+
+def default_strip_terms(keyword):
+    """등록부에 제거 단어가 없을 때 사용할 기본값 (키워드 자체와 공백 단위 토큰)"""
+    return [keyword] + keyword.split()
+
+
+def clean_blog_titles(items, keyword, strip_terms_by_keyword, max_len=20):
+    """블로그 검색 결과 item(title, description) 목록을 정제한 제목 목록
+
+    description을 정제한 앞부분을 제목으로 쓰고, 5자 미만이면 원본 title을 정제해서 사용합니다. (키워드 단어는 유지)
+    키워드 하나의 검색 결과 전체(여러 페이지)를 한 번의 배치로 정제합니다.
+    """
+    cleaner = get_cleaner(tuple(strip_terms_by_keyword.get(keyword) or default_strip_terms(keyword)))
+    titles = cleaner.clean_batch([item.get("description") for item in items], max_len)
+
+    # description이 너무 짧은 행만 title 정제
+    too_short = [i for i, title in enumerate(titles) if len(title) < 5]
+    if too_short:
+        fallback = get_cleaner().clean_batch([items[i].get("title") for i in too_short], max_len)
+        for i, title in zip(too_short, fallback):
+            titles[i] = title
+    return titles
@@ -0,0 +1,103 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+# 거래소 휴장일 (주말 제외). 매년 거래소 공시 기준으로 다음 해 목록을 추가해야 합니다.
+# KRX: 한국거래소 휴장일 (공휴일, 대체공휴일, 선거일, 근로자의날, 연말휴장일)
+# NYSE: 뉴욕증권거래소 휴장일 (observed 기준)
+HOLIDAYS = {
+    "KRX": {
+        # 2024
+        "20240101", "20240209", "20240212", "20240301", "20240410", "20240501", "20240506",
+        "20240515", "20240606", "20240815", "20240916", "20240917", "20240918", "20241001",
+        "20241003", "20241009", "20241225", "20241231",
+        # 2025
+        "20250101", "20250127", "20250128", "20250129", "20250130", "20250303", "20250501",
+        "20250505", "20250506", "20250603", "20250606", "20250815", "20251003", "20251006",
+        "20251007", "20251008", "20251009", "20251225", "20251231",
+        # 2026
+        "20260101", "20260216", "20260217", "20260218", "20260302", "20260501", "20260505",
+        "20260525", "20260603", "20260817", "20260924", "20260925", "20261005", "20261009",
+        "20261225", "20261231",
+        # 2027
+        "20270101", "20270208", "20270209", "20270301", "20270505", "20270513", "20270816",
+        "20270914", "20270915", "20270916", "20271004", "20271011", "20271227", "20271231",
+    },
+    "NYSE": {
+        # 2024
+        "20240101", "20240115", "20240219", "20240329", "20240527", "20240619", "20240704",
+        "20240902", "20241128", "20241225",
+        # 2025
+        "20250101", "20250109", "20250120", "20250217", "20250418", "20250526", "20250619",
+        "20250704", "20250901", "20251127", "20251225",
+        # 2026
+        "20260101", "20260119", "20260216", "20260403", "20260525", "20260619", "20260703",
+        "20260907", "20261126", "20261225",
+        # 2027
+        "20270101", "20270118", "20270215", "20270326", "20270531", "20270618", "20270705",
+        "20270906", "20271125", "20271224",
+    },
+}
+
+# 휴장일 테이블이 없는 거래소(ETC 등)는 주말만 제외
+MAX_LOOKBACK_DAYS = 30
+
+# 당일 일봉이 확정되는 정규장 마감 시각 (KST)
+KST = ZoneInfo("Asia/Seoul")
+MARKET_CLOSE = {"KRX": time(15, 30)}
+
+
+def is_trading_day(market, day):
+    """해당 거래소의 거래일 여부"""
+    if day.weekday() >= 5:  # 5=토요일, 6=일요일
+        return False
+    return day.strftime('%Y%m%d') not in HOLIDAYS.get(market.upper(), ())
+
+
+def last_trading_day(market, as_of=None):
+    """as_of(기본: 오늘) 당일 또는 그 이전의 가장 최근 거래일"""
+    day = as_of or date.today()
+    for _ in range(MAX_LOOKBACK_DAYS):
+        if is_trading_day(market, day):
+            return day
+        day -= timedelta(days=1)
+    raise ValueError(f"{market}: {as_of} 이전 {MAX_LOOKBACK_DAYS}일 내 거래일이 없습니다")
+
+
+def previous_trading_day(market, day):
+    """day 직전 거래일 (당일 제외)"""
+    return last_trading_day(market, day - timedelta(days=1))
+
+
+def reference_trading_day(market, today=None):
+    """시세 조회 기준 거래일 (KRX: 당일 포함 최근 거래일, 해외: 시차로 전일 이전 최근 거래일)"""
+    today = today or date.today()
+    if market.upper() == "KRX":
+        return last_trading_day(market, today)
+    return previous_trading_day(market, today)
+
+
+def last_completed_trading_day(market, now=None):
+    """일봉이 확정된 가장 최근 거래일 (KRX는 장 마감 전이면 직전 거래일, 해외는 reference_trading_day와 같음)
+
+    now: 기준 시각 (시간대가 없으면 KST로 간주, 기본: 현재 시각)
+    """
+    now = now or datetime.now(KST)
+    if now.tzinfo is not None:
+        now = now.astimezone(KST)
+    close = MARKET_CLOSE.get(market.upper())
+    if close is None:
+        return reference_trading_day(market, now.date())
+    if now.time() < close:
+        return previous_trading_day(market, now.date())
+    return last_trading_day(market, now.date())
+
+
+def trading_days(market, start, end):
+    """start ~ end(포함) 구간의 거래일 목록"""
+    days = []
+    day = start
+    while day <= end:
+        if is_trading_day(market, day):
+            days.append(day)
+        day += timedelta(days=1)
+    return days
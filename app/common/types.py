@@ -0,0 +1,149 @@
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+import pandas as pd
+from sqlalchemy import BigInteger, Date, DateTime, Numeric, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+# DB에는 DATE/DATETIME/숫자로 저장하고, 애플리케이션(크롤러, API 응답)에는 기존 문자열 형식을 그대로 제공하는 컬럼 타입.
+# 비교/필터에 문자열('20261019')을 넘겨도 바인딩 시 변환되므로 기존 쿼리 코드는 수정할 필요가 없습니다.
+
+_NON_DIGIT = re.compile(r"\D")
+
+
+def _digits(value):
+    return _NON_DIGIT.sub("", str(value))
+
+
+class YmdDate(TypeDecorator):
+    """'YYYYMMDD' 문자열 ↔ DATE"""
+    impl = Date
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, datetime):
+            return value.date() if value is not None else None
+        if isinstance(value, date):
+            return value
+        digits = _digits(value)
+        if not digits:
+            return None
+        return datetime.strptime(digits[:8], "%Y%m%d").date()
+
+    def process_literal_param(self, value, dialect):
+        value = self.process_bind_param(value, dialect)
+        return "NULL" if value is None else f"'{value.isoformat()}'"
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return value.strftime("%Y%m%d")
+
+    @staticmethod
+    def coerce_series(series):
+        """DataFrame 적재용 일괄 변환 (행 단위 파싱 없음)"""
+        digits = series.astype("string").str.replace(r"\D", "", regex=True).str[:8]
+        parsed = pd.to_datetime(digits, format="%Y%m%d", errors="coerce")
+        return parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+
+class YmdHmsDateTime(TypeDecorator):
+    """'YYYYMMDDHHMMSS' 문자열 ↔ DATETIME (8자리 날짜만 있으면 00시로 저장)"""
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        digits = _digits(value)
+        if not digits:
+            return None
+        return datetime.strptime(digits[:14].ljust(14, "0"), "%Y%m%d%H%M%S")
+
+    def process_literal_param(self, value, dialect):
+        value = self.process_bind_param(value, dialect)
+        return "NULL" if value is None else f"'{value.isoformat(sep=' ')}'"
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return value.strftime("%Y%m%d%H%M%S")
+
+    @staticmethod
+    def coerce_series(series):
+        digits = series.astype("string").str.replace(r"\D", "", regex=True).str[:14].str.pad(14, side="right", fillchar="0")
+        parsed = pd.to_datetime(digits, format="%Y%m%d%H%M%S", errors="coerce")
+        return parsed.astype(object).where(parsed.notna(), None).map(
+            lambda v: v.to_pydatetime() if v is not None else None
+        )
+
+
+class YearText(TypeDecorator):
+    """'YYYY' 문자열 ↔ SMALLINT"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        digits = _digits(value)
+        return int(digits) if digits else None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else f"{value:04d}"
+
+    @staticmethod
+    def coerce_series(series):
+        digits = series.astype("string").str.replace(r"\D", "", regex=True)
+        return pd.to_numeric(digits, errors="coerce").astype("Int64")
+
+
+class AmountText(TypeDecorator):
+    """천 단위 콤마 금액 문자열('82,500') ↔ BIGINT"""
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        text = re.sub(r"[^0-9-]", "", str(value))
+        return int(text) if text not in ("", "-") else None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else f"{value:,}"
+
+    @staticmethod
+    def coerce_series(series):
+        text = series.astype("string").str.replace(r"[^0-9-]", "", regex=True)
+        return pd.to_numeric(text, errors="coerce").astype("Int64")
+
+
+class DecimalText(TypeDecorator):
+    """숫자 문자열('12.3') ↔ NUMERIC (숫자가 아닌 값은 NULL)"""
+    impl = Numeric(12, 3)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, (int, float, Decimal)):
+            return value
+        try:
+            return Decimal(str(value).strip())
+        except InvalidOperation:
+            return None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        text = format(Decimal(value).normalize(), "f")
+        return "0" if text in ("-0", "") else text
+
+    @staticmethod
+    def coerce_series(series):
+        return pd.to_numeric(series.astype("string").str.strip(), errors="coerce")
+
+
+def numeric_type(column_type):
+    """집계(sum/min/max) 결과는 문자열 변환 없이 DB 숫자 타입 그대로 받기 위한 타입"""
+    return column_type.impl if isinstance(column_type, TypeDecorator) else column_type
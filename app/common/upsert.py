@@ -0,0 +1,29 @@
+from sqlalchemy import insert
+
+
+def insert_if_unseen(session, model, rows, conflict_columns, chunk_size=500):
+    """고유 인덱스(conflict_columns)에 이미 있는 행은 건너뛰고 새 행만 INSERT
+
+    반환값은 실제로 INSERT된 행 수입니다.
+    """
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        stmt = pg_insert(model).on_conflict_do_nothing(index_elements=conflict_columns)
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        stmt = sqlite_insert(model).on_conflict_do_nothing(index_elements=conflict_columns)
+    elif dialect in ("mysql", "mariadb"):
+        stmt = insert(model).prefix_with("IGNORE")
+    else:
+        raise NotImplementedError(f"insert_if_unseen: 지원하지 않는 DB dialect - {dialect}")
+
+    # 다중 VALUES 문으로 실행해야 rowcount가 실제 INSERT 건수가 됨
+    inserted = 0
+    for i in range(0, len(rows), chunk_size):
+        result = session.execute(stmt.values(rows[i:i + chunk_size]))
+        inserted += result.rowcount
+    return inserted
@@ -1,14 +1,78 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from .config import settings
+from .common.response_cache import track_table_writes
+from .common.db_pool import engine_options, async_url
+from .common.db_routing import ReplicaSet, RoutingSession
+import logging
 
-engine = create_engine(settings.DB_URL, connect_args={"check_same_thread": False} if settings.DB_URL.startswith("sqlite") else {})
+logger = logging.getLogger(__name__)
+
+# 풀 크기/대기 시간/재생성 주기/pre-ping은 settings.DB_POOL_* (app.common.db_pool)
+engine = create_engine(settings.DB_URL, **engine_options(settings.DB_URL))
+track_table_writes(engine)  # 테이블 쓰기 커밋 시 /api 응답 캐시 무효화
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base = declarative_base()
 
+# 읽기 복제본 (settings.DB_REPLICA_URLS) - 조회 API 세션(ReadSessionLocal)만 사용하고 크롤러 등 SessionLocal은 primary 전용
+replicas = ReplicaSet(
+    [create_engine(url, **engine_options(url)) for url in settings.DB_REPLICA_URLS],
+    max_lag=settings.DB_REPLICA_MAX_LAG, check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+) if settings.DB_REPLICA_URLS else None
+ReadSessionLocal = sessionmaker(bind=engine, class_=RoutingSession, replicas=replicas, autocommit=False, autoflush=False)
+
+def read_engine():
+    """세션 없이 커넥션을 직접 여는 조회(스트리밍/내보내기)용 엔진 - 사용 가능한 복제본, 없으면 primary"""
+    index = replicas.next_index() if replicas else None
+    return engine if index is None else replicas.engines[index]
+
+def create_async_db_engine(url):
+    """조회 API용 비동기 엔진 (DB_ASYNC_YN=N 이거나 비동기 드라이버가 없으면 None)"""
+    if settings.DB_ASYNC_YN != "Y":
+        return None
+    try:
+        return create_async_engine(async_url(url), **engine_options(url, is_async=True))
+    except ImportError as e:
+        logger.warning(f"[DB] 비동기 드라이버가 없어 동기 경로를 사용합니다: {e}")
+        return None
+
+async_engine = create_async_db_engine(settings.DB_URL)
+# 비동기 복제본 엔진은 동기 복제본과 같은 순서 (복제 지연 확인은 동기 엔진으로 공유)
+async_replica_engines = [create_async_db_engine(url) for url in settings.DB_REPLICA_URLS] if async_engine else []
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False, sync_session_class=RoutingSession,
+    replicas=replicas if async_replica_engines and all(async_replica_engines) else None,
+    replica_binds=[e.sync_engine for e in async_replica_engines if e is not None],
+) if async_engine else None
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def get_read_db():
+    """조회 API용 세션 (SELECT는 복제본으로 라우팅)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    """조회 API용 비동기 세션 (SELECT는 복제본으로 라우팅)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def upgrade_schema():
+    """Alembic 마이그레이션을 최신 버전(head)까지 적용 (alembic.ini는 프로젝트 루트)"""
+    from pathlib import Path
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(Path(__file__).resolve().parent.parent / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", settings.DB_URL.replace("%", "%%"))
+    config.attributes["configure_logger"] = False  # 애플리케이션 로깅 설정 유지
+    command.upgrade(config, "head")
@@ -1,18 +1,44 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from .db import Base, engine
+from .db import upgrade_schema, replicas
+from .service import scheduler
 from .routers import api, ui, collect
+from .common.response_cache import ResponseCacheMiddleware
+from .common.json_response import FastJSONResponse
+from .common.compression import CompressionMiddleware, PrecompressedStaticFiles, precompress_static
 
-# FastAPI 애플리케이션 인스턴스 생성
-app = FastAPI(title="Muse API (B-Option)")
 
-# DB 테이블 생성 (애플리케이션 시작 시)
-# 참고: 프로덕션 환경에서는 Alembic과 같은 마이그레이션 도구를 사용하는 것이 더 안전합니다.
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app):
+    # 크롤러 예약 실행 스케줄러 (SCHEDULER_YN=Y일 때만 시작, /api/schedule 로 확인)
+    scheduler.start()
+    # 읽기 복제본 지연 확인 스레드 (DB_REPLICA_URLS가 있을 때만)
+    if replicas:
+        replicas.start()
+    yield
+    scheduler.shutdown()
+    if replicas:
+        replicas.stop()
+
+
+# FastAPI 애플리케이션 인스턴스 생성 (기본 응답 직렬화는 orjson)
+app = FastAPI(title="Muse API (B-Option)", default_response_class=FastJSONResponse, lifespan=lifespan)
+
+# DB 스키마 마이그레이션 (애플리케이션 시작 시)
+# 테이블/인덱스 변경은 migrations/versions에 Alembic 리비전으로 추가합니다.
+upgrade_schema()
 
 # 정적 파일 마운트
 # 'static' 폴더의 파일들을 '/static' 경로로 제공합니다.
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# 시작 시 .gz/.br/.zst 압축본을 만들어 두고, 요청의 Accept-Encoding에 맞는 압축본을 보냅니다.
+precompress_static("static")
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
+
+# /api GET 응답 캐시 (ETag / 304 Not Modified, 테이블 쓰기 커밋 시 무효화)
+app.add_middleware(ResponseCacheMiddleware, routes=api.CACHE_ROUTES)
+
+# 응답 압축 (zstd / br / gzip 협상, 가장 바깥 미들웨어로 등록해 캐시된 응답도 압축)
+app.add_middleware(CompressionMiddleware)
 
 # API 라우터 포함
 app.include_router(api.router)
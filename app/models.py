@@ -1,36 +1,47 @@
-from sqlalchemy import Column, Integer, String, DateTime, BigInteger, Float
+from sqlalchemy import Column, Integer, String, DateTime, BigInteger, Float, Index
 from sqlalchemy.sql import func
 from .db import Base
+from .common.types import YmdDate, YmdHmsDateTime, YearText, AmountText, DecimalText
 
 # 201: Naver Finance Top 5
 class NaverFinance(Base):
     __tablename__ = "dbms_naver_finance"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     stock_cd = Column(String(20), index=True)
     stock_nm = Column(String(100))
     pre_price = Column(BigInteger)
     today_price = Column(BigInteger)
     trading_volume = Column(BigInteger)
-    ins_dt = Column(String(14), nullable=False, index=True)  # 14자리 문자열 YYYYMMDDHHMMSS
+    ins_dt = Column(YmdHmsDateTime, nullable=False, index=True)  # DATETIME, 조회 시 YYYYMMDDHHMMSS 문자열
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + ins_dt desc, id desc 정렬
+        Index("ix_naver_finance_strd_dt_ins_dt", "strd_dt", "ins_dt", "id"),
+    )
 
 # 202: EV Portal
 class EvTop(Base):
     __tablename__ = "dbms_ev_car_portal"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     sido_nm = Column(String(50))
     region = Column(String(100))
     receipt_way = Column(String(50))
     receipt_priority = Column(String(10))
     value = Column(Integer)
-    ins_dt = Column(String(14), nullable=False, index=True)  # 14자리 문자열 YYYYMMDDHHMMSS
+    ins_dt = Column(YmdHmsDateTime, nullable=False, index=True)  # DATETIME, 조회 시 YYYYMMDDHHMMSS 문자열
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + ins_dt desc, id desc 정렬
+        Index("ix_ev_car_portal_strd_dt_ins_dt", "strd_dt", "ins_dt", "id"),
+    )
 
 # 203: Global Market (FinanceDataReader)
 class MarketTop(Base):
     __tablename__ = "dbms_market_stock"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(8), index=True)
+    strd_dt = Column(YmdDate)
     market = Column(String(50))
     stock_day = Column(String(10))
     opening_price = Column(Float)
@@ -38,82 +49,175 @@ class MarketTop(Base):
     low_price = Column(Float)
     closing_price = Column(Float)
     volume = Column(BigInteger)
-    ins_dt = Column(String(20), nullable=False)
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_market_stock_strd_dt_id", "strd_dt", "id"),
+    )
+
+# 203-1: Market OHLCV time series (FinanceDataReader 일봉 누적 저장소)
+class MarketOhlcv(Base):
+    __tablename__ = "dbms_market_ohlcv"
+    id = Column(Integer, primary_key=True)
+    symbol = Column(String(20), nullable=False)
+    market = Column(String(50), nullable=False)
+    trade_dt = Column(YmdDate, nullable=False)  # 거래일
+    opening_price = Column(Float)
+    high_price = Column(Float)
+    low_price = Column(Float)
+    closing_price = Column(Float)
+    volume = Column(BigInteger)
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        # 심볼별 기간 조회 + 중복 방지
+        Index("ux_market_ohlcv_symbol_trade_dt", "symbol", "trade_dt", unique=True),
+    )
+
+# 203-2: Market / Stock technical indicators (dbms_market_stock, dbms_naver_finance 적재 후 계산)
+class MarketIndicator(Base):
+    __tablename__ = "dbms_market_indicator"
+    id = Column(Integer, primary_key=True)
+    source = Column(String(10), nullable=False)  # market: dbms_market_stock, stock: dbms_naver_finance
+    code = Column(String(50), nullable=False)    # market 표시명 또는 stock_cd
+    name = Column(String(100))
+    strd_dt = Column(YmdDate, nullable=False)
+    trade_dt = Column(YmdDate)                 # 지표 계산 기준 거래일
+    close_price = Column(Float)
+    change_rate = Column(Float)                  # 전 거래일 대비 등락률(%)
+    ma5 = Column(Float)
+    ma20 = Column(Float)
+    ma60 = Column(Float)
+    volatility20 = Column(Float)                 # 20거래일 일간 등락률 표준편차(%)
+    volume_zscore20 = Column(Float)              # 20거래일 거래량 z-score
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ux_market_indicator_source_code_strd_dt", "source", "code", "strd_dt", unique=True),
+        Index("ix_market_indicator_source_strd_dt", "source", "strd_dt"),
+    )
 
 # 204: Naver Blog crawl
 class BlogCrawl(Base):
     __tablename__ = "dbms_blog_keword"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     keword = Column(String(200))  # 원문 오타(keword) 유지
     title = Column(String(500))
     link = Column(String(1000))
-    ins_dt = Column(String(14), nullable=False, index=True)  # 14자리 문자열 YYYYMMDDHHMMSS
+    ins_dt = Column(YmdHmsDateTime, nullable=False, index=True)  # DATETIME, 조회 시 YYYYMMDDHHMMSS 문자열
+
+    __table_args__ = (
+        # 목록 조회(strd_dt 필터 + ins_dt desc, id desc 정렬)와 일자별 키워드 조회
+        Index("ix_blog_keword_strd_dt_ins_dt", "strd_dt", "ins_dt", "id"),
+        Index("ix_blog_keword_strd_dt_keword", "strd_dt", "keword"),
+        # 키워드별 게시글 중복 방지 (MySQL은 인덱스 키 길이 제한으로 prefix 사용)
+        Index("ux_blog_keword_link", "keword", "link", unique=True,
+              mysql_length={"keword": 191, "link": 512}),
+    )
+
+# 204-1: Naver Blog keyword registry
+class BlogKeyword(Base):
+    __tablename__ = "dbms_blog_keword_registry"
+    id = Column(Integer, primary_key=True)
+    keword = Column(String(200), nullable=False, unique=True)
+    use_yn = Column(String(1), nullable=False, default="Y")
+    newest_postdate = Column(YmdDate)  # 수집된 가장 최신 게시일 YYYYMMDD (조기 종료 기준)
+    strip_terms = Column(String(500))  # 제목 정제 시 제거할 단어 (콤마 구분)
+    upd_dt = Column(YmdHmsDateTime)
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
 
 # 205: YouTube comments
 class YoutubeComment(Base):
     __tablename__ = "dbms_youtube_keword"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     keword = Column(String(200))
     link = Column(String(1000))
     video_id = Column(String(50))
     main_text = Column(String(500))  # 댓글 내용 필드 추가
     comment_author = Column(String(200))
-    ins_dt = Column(String(14), nullable=False, index=True)
+    ins_dt = Column(YmdHmsDateTime, nullable=False, index=True)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + ins_dt desc, id desc 정렬, (strd_dt, keword) 건수 조회
+        Index("ix_youtube_keword_strd_dt_ins_dt", "strd_dt", "ins_dt", "id"),
+        Index("ix_youtube_keword_strd_dt_keword", "strd_dt", "keword"),
+    )
 
 # 206: Kakao AI Image
 class KakaoAIImage(Base):
     __tablename__ = "dbms_kakao_ai_image"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     suggest_word = Column(String(500))
 
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_kakao_ai_image_strd_dt_id", "strd_dt", "id"),
+    )
+
 # 207: Kakao Talk tokens
 class KakaoTalk(Base):
     __tablename__ = "dbms_kakao_talk"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     access_token = Column(String(2000))
     token_type = Column(String(50))
     refresh_token = Column(String(2000))
     scope = Column(String(500))
     upd_dt = Column(String(19))  # 문자열로 보유
-    ins_dt = Column(String(19))
+    ins_dt = Column(YmdHmsDateTime)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_kakao_talk_strd_dt_id", "strd_dt", "id"),
+    )
 
 # 208: Public apt trade
 class PublicAptTrade(Base):
     __tablename__ = "dbms_public_apt_trade"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(10), index=True)
+    strd_dt = Column(YmdDate)
     sgg_cd = Column(String(20))
     road_nm = Column(String(200))
     apt_nm = Column(String(200))
     excul_use_area = Column(Float)
-    deal_year = Column(String(4))
-    deal_amount = Column(String(50))
+    deal_year = Column(YearText)
+    deal_amount = Column(AmountText)  # 거래금액(만원), API 응답 형식 '82,500'으로 조회
     floor = Column(String(10))
     build_year = Column(String(4))
-    ins_dt = Column(String(19))
+    ins_dt = Column(YmdHmsDateTime)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_public_apt_trade_strd_dt_id", "strd_dt", "id"),
+    )
 
 # 209: KMA forecast
 class KmaForecast(Base):
     __tablename__ = "dbms_kma_neighborhood_forecast"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(8), index=True)
+    strd_dt = Column(YmdDate)
     strd_tm = Column(String(4))
     category = Column(String(20))
     nx = Column(Integer)
     ny = Column(Integer)
-    obsr_value = Column(String(20))
-    ins_dt = Column(String(19))
+    obsr_value = Column(DecimalText)
+    ins_dt = Column(YmdHmsDateTime)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_kma_forecast_strd_dt_id", "strd_dt", "id"),
+    )
 
 # 210: Jeju hourly visitor
 class JejuFloPop(Base):
     __tablename__ = "dbms_jeju_api_floating_population"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(8), index=True)
-    regist_dt = Column(String(14))
+    strd_dt = Column(YmdDate)
+    regist_dt = Column(String(14))  # 원본 형식(길이) 그대로 보존
     city = Column(String(50))
     emd = Column(String(50))
     gender = Column(String(10))
@@ -121,28 +225,115 @@ class JejuFloPop(Base):
     resd_pop = Column(Integer)
     work_pop = Column(Integer)
     visit_pop = Column(Integer)
-    ins_dt = Column(String(19))
+    ins_dt = Column(YmdHmsDateTime)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_jeju_flo_pop_strd_dt_id", "strd_dt", "id"),
+    )
 
 # 211: Seoul foreign population
 class SeoulForPop(Base):
     __tablename__ = "dbms_seoul_api_spop_forn_long_resd_jachi"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(8), index=True)
-    stdr_de_id = Column(String(8))
+    strd_dt = Column(YmdDate)
+    stdr_de_id = Column(YmdDate)
     tmzon_pd_se = Column(String(2))
     adstrd_code_se = Column(String(10))
     tot_lvpop_co = Column(Integer)
     china_staypop_co = Column(Integer)
     etc_staypop_co = Column(Integer)
-    ins_dt = Column(String(19))
+    ins_dt = Column(YmdHmsDateTime)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_seoul_for_pop_strd_dt_id", "strd_dt", "id"),
+    )
 
 # 212: Batch stats
 class ApiBatchStat(Base):
     __tablename__ = "api_batch_stat"
     id = Column(Integer, primary_key=True)
-    strd_dt = Column(String(8), index=True)
+    strd_dt = Column(YmdDate)
     api_nm = Column(String(100))
     data_gb = Column(String(50))
     data_cnt = Column(Integer)
     memo = Column(String(500))
-    ins_dt = Column(String(19))
+    ins_dt = Column(YmdHmsDateTime)
+
+    __table_args__ = (
+        # 목록 조회: strd_dt 필터 + id desc 정렬
+        Index("ix_api_batch_stat_strd_dt_id", "strd_dt", "id"),
+        # Airflow 배치 결과 삭제: (strd_dt, api_nm)
+        Index("ix_api_batch_stat_strd_dt_api_nm", "strd_dt", "api_nm"),
+    )
+
+# 214: Daily rollups (크롤러가 적재한 strd_dt 단위로 갱신되는 요약 테이블)
+class JejuFloPopDaily(Base):
+    __tablename__ = "dbms_rollup_jeju_flo_pop_daily"
+    id = Column(Integer, primary_key=True)
+    strd_dt = Column(YmdDate, nullable=False)
+    city = Column(String(50))
+    emd = Column(String(50))
+    resd_pop = Column(BigInteger)
+    work_pop = Column(BigInteger)
+    visit_pop = Column(BigInteger)
+    row_cnt = Column(Integer)
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rollup_jeju_flo_pop_daily_strd_dt", "strd_dt", "city", "emd"),
+    )
+
+class SeoulForPopDaily(Base):
+    __tablename__ = "dbms_rollup_seoul_for_pop_daily"
+    id = Column(Integer, primary_key=True)
+    strd_dt = Column(YmdDate, nullable=False)
+    adstrd_code_se = Column(String(10))
+    tot_lvpop_co = Column(BigInteger)
+    china_staypop_co = Column(BigInteger)
+    etc_staypop_co = Column(BigInteger)
+    row_cnt = Column(Integer)
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rollup_seoul_for_pop_daily_strd_dt", "strd_dt", "adstrd_code_se"),
+    )
+
+class EvSidoDaily(Base):
+    __tablename__ = "dbms_rollup_ev_sido_daily"
+    id = Column(Integer, primary_key=True)
+    strd_dt = Column(YmdDate, nullable=False)
+    sido_nm = Column(String(50))
+    value = Column(BigInteger)  # 출고잔여대수 합계
+    row_cnt = Column(Integer)
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rollup_ev_sido_daily_strd_dt", "strd_dt", "sido_nm"),
+    )
+
+class YoutubeKewordDaily(Base):
+    __tablename__ = "dbms_rollup_youtube_keword_daily"
+    id = Column(Integer, primary_key=True)
+    strd_dt = Column(YmdDate, nullable=False)
+    keword = Column(String(200))
+    video_cnt = Column(Integer)
+    row_cnt = Column(Integer)  # 댓글 수
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rollup_youtube_keword_daily_strd_dt", "strd_dt", "keword"),
+    )
+
+class BlogKewordDaily(Base):
+    __tablename__ = "dbms_rollup_blog_keword_daily"
+    id = Column(Integer, primary_key=True)
+    strd_dt = Column(YmdDate, nullable=False)
+    keword = Column(String(200))
+    row_cnt = Column(Integer)  # 게시글 수
+    ins_dt = Column(YmdHmsDateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rollup_blog_keword_daily_strd_dt", "strd_dt", "keword"),
+    )
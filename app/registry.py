@@ -0,0 +1,85 @@
+from app.models import (
+    NaverFinance, EvTop, MarketTop, BlogCrawl, BlogKeyword, YoutubeComment, KakaoAIImage, KakaoTalk,
+    PublicAptTrade, KmaForecast, JejuFloPop, SeoulForPop, ApiBatchStat
+)
+from app.schema import (
+    StockOut, EvOut, MarketOut, BlogOut, BlogKeywordOut, YoutubeCommentOut, KakaoAIImageOut, KakaoTalkOut,
+    PublicAptTradeOut, KmaForecastOut, JejuFloPopOut, SeoulForPopOut, ApiBatchStatOut
+)
+
+# 조회 API 모델 목록 (데이터셋 이름 → 설정)
+# app.routers.model_routes가 이 목록으로 목록/전체/스트림 GET 경로를 만들고,
+# 집계 허용 목록(app.service.aggregation), 내보내기 대상 테이블과 날짜 컬럼(app.service.arrow_export)도 여기서 만듭니다.
+#
+# model: ORM 모델, schema: 응답 스키마 (필드 순서 = 응답 컬럼, app.schema)
+# path: 기본 경로 (/api 이하), list: 페이징 목록 하위 경로, all: 전체 조회 하위 경로 (None이면 없음)
+# order_by: 내림차순 정렬 컬럼 (마지막은 유일 키 id, keyset 커서로 사용)
+# date_column: start_date/end_date 필터 컬럼 (None이면 날짜 필터 없음)
+# dimensions: 일치 조건 필터(?sido_nm=서울) / 집계 그룹으로 허용하는 컬럼, measures: 집계 가능한 수치 컬럼
+# export: Parquet/Arrow 내보내기(/api/export/{table}.{fmt}) 허용 여부
+MODEL_SPECS = {
+    # 201: Naver Finance Top 5
+    "stock": {"model": NaverFinance, "schema": StockOut, "path": "/stock", "list": "/top5", "all": "/all",
+              "order_by": ("ins_dt", "id"), "date_column": "strd_dt",
+              "dimensions": ["stock_cd", "stock_nm"], "measures": ["pre_price", "today_price", "trading_volume"]},
+    # 202: EV Top 10
+    "ev": {"model": EvTop, "schema": EvOut, "path": "/ev", "list": "/top10", "all": "/all",
+           "order_by": ("ins_dt", "id"), "date_column": "strd_dt",
+           "dimensions": ["sido_nm", "region", "receipt_way", "receipt_priority"], "measures": ["value"]},
+    # 203: Market Top 10
+    "market": {"model": MarketTop, "schema": MarketOut, "path": "/market", "list": "/top10", "all": "/all",
+               "order_by": ("id",), "date_column": "strd_dt", "dimensions": ["market"],
+               "measures": ["opening_price", "high_price", "low_price", "closing_price", "volume"]},
+    # 204: Naver Blog
+    "blog": {"model": BlogCrawl, "schema": BlogOut, "path": "/blog", "list": "/naver", "all": "/all",
+             "order_by": ("ins_dt", "id"), "date_column": "strd_dt", "dimensions": ["keword"], "measures": []},
+    # 204-2: Naver Blog keyword registry
+    "blog-keywords": {"model": BlogKeyword, "schema": BlogKeywordOut, "path": "/blog/keywords", "list": "",
+                      "all": None, "order_by": ("id",), "date_column": None, "dimensions": ["use_yn"],
+                      "measures": []},
+    # 205: YouTube comments
+    "youtube": {"model": YoutubeComment, "schema": YoutubeCommentOut, "path": "/youtube", "list": "/comments",
+                "all": "/all", "order_by": ("ins_dt", "id"), "date_column": "strd_dt",
+                "dimensions": ["keword", "video_id"], "measures": []},
+    # 206: Kakao AI Image
+    "kakao-ai-image": {"model": KakaoAIImage, "schema": KakaoAIImageOut, "path": "/kakao/ai-image", "list": "",
+                       "all": "/all", "order_by": ("id",), "date_column": "strd_dt", "dimensions": [],
+                       "measures": []},
+    # 207: Kakao Talk token (인증 토큰이 있어 내보내기 제외)
+    "kakao-talk": {"model": KakaoTalk, "schema": KakaoTalkOut, "path": "/kakao/talk", "list": "", "all": "/all",
+                   "order_by": ("id",), "date_column": "strd_dt", "dimensions": [], "measures": [],
+                   "export": False},
+    # 208: Public apt trade
+    "apt-trade": {"model": PublicAptTrade, "schema": PublicAptTradeOut, "path": "/public/apt-trade", "list": "",
+                  "all": "/all", "order_by": ("id",), "date_column": "strd_dt",
+                  "dimensions": ["sgg_cd", "apt_nm", "deal_year", "build_year"],
+                  "measures": ["excul_use_area", "deal_amount"]},
+    # 209: KMA forecast
+    "kma": {"model": KmaForecast, "schema": KmaForecastOut, "path": "/kma/forecast", "list": "", "all": "/all",
+            "order_by": ("id",), "date_column": "strd_dt", "dimensions": ["category", "strd_tm", "nx", "ny"],
+            "measures": ["obsr_value"]},
+    # 210: Jeju visitors
+    "jeju-flo-pop": {"model": JejuFloPop, "schema": JejuFloPopOut, "path": "/jeju/flo-pop", "list": "",
+                     "all": "/all", "order_by": ("id",), "date_column": "strd_dt",
+                     "dimensions": ["city", "emd", "gender", "age_group"],
+                     "measures": ["resd_pop", "work_pop", "visit_pop"]},
+    # 211: Seoul foreign pop
+    "seoul-for-pop": {"model": SeoulForPop, "schema": SeoulForPopOut, "path": "/seoul/for-pop", "list": "",
+                      "all": "/all", "order_by": ("id",), "date_column": "strd_dt",
+                      "dimensions": ["adstrd_code_se", "tmzon_pd_se"],
+                      "measures": ["tot_lvpop_co", "china_staypop_co", "etc_staypop_co"]},
+    # 212: Batch stats (배치 현황 화면은 기간과 무관하게 최근 기록을 보여주므로 날짜 필터 없음)
+    "batch-stats": {"model": ApiBatchStat, "schema": ApiBatchStatOut, "path": "/batch/stats", "list": "",
+                    "all": "/all", "order_by": ("id",), "date_column": None, "dimensions": ["api_nm", "data_gb"],
+                    "measures": ["data_cnt"]},
+}
+
+
+def output_columns(spec):
+    """응답 스키마 필드 순서대로 조회할 컬럼 속성"""
+    return [getattr(spec["model"], name) for name in spec["schema"].model_fields]
+
+
+def order_columns(spec):
+    return [getattr(spec["model"], name) for name in spec["order_by"]]
+
@@ -1,41 +1,78 @@
 
+import asyncio
+from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
-from ..db import get_db
-from ..models import (
-    NaverFinance, EvTop, MarketTop, BlogCrawl, YoutubeComment, KakaoAIImage, KakaoTalk,
-    PublicAptTrade, KmaForecast, JejuFloPop, SeoulForPop, ApiBatchStat
+from ..db import get_db, get_read_db, engine, async_engine, replicas
+from ..schema import (
+    AggregateOut, RollupOut, MarketOhlcvOut, MarketIndicatorList, MarketCalendarOut, ExportCatalog, ScheduleOut,
+    DbPoolOut, RetentionList
 )
 from app.service.finance_data_reader_parser import FinanceDataReaderParser
+from app.service.market_ohlcv_store import MarketOhlcvStore
+from app.service.market_indicator_builder import MarketIndicatorBuilder
+from app.service.aggregation import AGGREGATES, aggregate
+from app.service.rollup import ROLLUPS, refresh_rollup, query_rollup
+from app.service.retention import RETENTION_POLICIES, apply_retention, retention_status
+from app.common.response_cache import response_cache
+from app.common.db_pool import pool_status
+from app.common.rate_governor import governor
+from app.common.resilience import breakers_status
+from app.common.json_response import FastJSONResponse, frame_response
+from app.service.arrow_export import FORMATS, DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, exportable_tables, export_catalog, stream_export
+from app.service.model_query import date_range
+from app.routers.model_routes import register_all, cache_routes
+from app.common.trading_calendar import is_trading_day, last_trading_day, previous_trading_day
 from app.service.naver_finance_crawler import NaverFinanceCrawler
 from app.service.ev_car_portal_crawler import EvCarPortalCrawler
 from app.service.naver_blog_crawler import NaverBlogCrawler
+from app.service.blog_keyword_registry import BlogKeywordRegistry
 from app.service.youtube_comment_crawler import YoutubeCommentCrawler
 from app.service.kakao_talk_crawler import KakaoTalkCrawler
 from app.service.airflow_runner import AirflowRunner
+from app.service import scheduler
 from app.service.seoul_public_data_crawler import SeoulPublicDataCrawler
 from app.service.jeju_public_data_crawler import JejuPublicDataCrawler
 from app.service.kma_public_data_crawler import KmaPublicDataCrawler
 
 router = APIRouter(prefix="/api", tags=["api"])
 
+# 응답 캐시 대상 GET 경로 → 조회 테이블 (하위 경로 포함, 예: /api/market/ohlcv?symbol=...)
+# 크롤러 등이 해당 테이블에 쓰기를 커밋하면 캐시된 응답이 무효화됩니다. (app.common.response_cache)
+CACHE_ROUTES = {
+    **cache_routes(),
+    "/api/market/ohlcv": ["dbms_market_ohlcv"],
+    "/api/market/indicators": ["dbms_market_indicator"],
+}
+CACHE_ROUTES.update({f"/api/aggregate/{name}": [spec["model"].__tablename__] for name, spec in AGGREGATES.items()})
+CACHE_ROUTES.update({f"/api/rollup/{name}": [spec["target"].__tablename__] for name, spec in ROLLUPS.items()})
+
+class BlogBatchRequest(BaseModel):
+    keywords: list[str]
+    quantity: int = 100
+
+class BlogKeywordRequest(BaseModel):
+    keywords: list[str]
+    use_yn: str = "Y"
+
 @router.post("/run/naver-finance-crawler")
 async def run_naver_finance_crawler(request: Request):
     """네이버 금융 크롤링 실행"""
     try:
         crawler = NaverFinanceCrawler()
-        data_list = crawler.run()
+        data_list = await asyncio.to_thread(crawler.run)  # 동기 HTTP/DB 작업은 스레드에서 (이벤트 루프 차단 방지)
         
         # ins_dt가 이제 문자열이므로 직렬화 처리 불필요
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "네이버 금융 크롤링 완료", 
             "count": len(data_list), 
             "data": data_list
         })
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "네이버 금융 크롤링 실행 중 오류 발생", "details": str(e)}
         )
@@ -45,16 +82,16 @@ async def run_ev_car_portal_crawler(request: Request):
     """EV 포털 크롤링 실행"""
     try:
         crawler = EvCarPortalCrawler()
-        data_list = crawler.run()
+        data_list = await asyncio.to_thread(crawler.run)
         
         # ins_dt가 이제 문자열이므로 직렬화 처리 불필요
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "EV 포털 크롤링 완료", 
             "count": len(data_list), 
             "data": data_list
         })
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "EV 포털 크롤링 실행 중 오류 발생", "details": str(e)}
         )
@@ -62,46 +99,140 @@ async def run_ev_car_portal_crawler(request: Request):
 @router.post("/run/finance-data-reader")
 async def run_finance_data_reader(request: Request):
     parser = FinanceDataReaderParser()
-    df = parser.get_data()
-    df['stock_day'] = df['stock_day'].astype(str)  # Timestamp -> str 변환
-    parser.save_to_dbms_market_stock(df)
-    # 결과 row 수 반환
-    return JSONResponse({"rows": df.to_dict(orient="records")})
+
+    def load():
+        df = parser.get_data()
+        df['stock_day'] = df['stock_day'].astype(str)  # Timestamp -> str 변환
+        parser.save_to_dbms_market_stock(df)
+        return df
+
+    df = await asyncio.to_thread(load)
+    # 결과 행 반환 (df.to_dict 대신 DataFrame에서 바로 JSON 인코딩)
+    return frame_response(df)
+
+@router.post("/run/market-ohlcv-loader")
+def run_market_ohlcv_loader():
+    """시세 저장소 누락 거래일 적재 (이미 저장된 거래일은 조회하지 않음)"""
+    try:
+        result = MarketOhlcvStore().load_missing()
+        return {"message": "시세 저장소 적재 완료", **result}
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": "시세 저장소 적재 중 오류 발생", "details": str(e)}
+        )
+
+@router.post("/run/market-indicators")
+def run_market_indicators(
+    source: str = Query("market", pattern="^(market|stock)$"),
+    strd_dt: str = Query(None, description="재계산할 수집일 (YYYYMMDD, 기본: 오늘)")
+):
+    """기술적 지표 재계산 (과거 수집일 백필용)"""
+    try:
+        strd_dt = (strd_dt or date.today().strftime('%Y%m%d')).replace('-', '')[:8]
+        count = MarketIndicatorBuilder().build(source, strd_dt)
+        return {"message": "지표 계산 완료", "source": source, "strd_dt": strd_dt, "count": count}
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": "지표 계산 중 오류 발생", "details": str(e)}
+        )
+
+@router.post("/run/rollup-refresh")
+def run_rollup_refresh(
+    name: str = Query(None, description="요약 이름 (생략 시 전체)"),
+    start_date: str = Query(..., description="갱신 시작일 (YYYY-MM-DD)"),
+    end_date: str = Query(None, description="갱신 종료일 (YYYY-MM-DD)")
+):
+    """요약 테이블 재계산 (과거 수집일 백필용)"""
+    names = [name] if name else list(ROLLUPS)
+    if name and name not in ROLLUPS:
+        return FastJSONResponse(status_code=400, content={"error": f"지원하지 않는 요약: {name}", "details": list(ROLLUPS)})
+    try:
+        start = datetime.strptime(start_date.replace('-', '')[:8], '%Y%m%d').date()
+        end = datetime.strptime(end_date.replace('-', '')[:8], '%Y%m%d').date() if end_date else start
+        result = {}
+        for offset in range((end - start).days + 1):
+            strd_dt = (start + timedelta(days=offset)).strftime('%Y%m%d')
+            for rollup_name in names:
+                result.setdefault(rollup_name, 0)
+                result[rollup_name] += refresh_rollup(rollup_name, strd_dt)
+        return {"message": "요약 갱신 완료", "result": result}
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": "요약 갱신 중 오류 발생", "details": str(e)}
+        )
+
+@router.post("/run/retention")
+def run_retention(
+    name: str = Query(None, description="보관 정책 이름 (생략 시 전체)"),
+    dry_run: bool = Query(False, description="정리 대상만 조회")
+):
+    """보관 기간이 지난 데이터 정리 (Parquet 아카이브 후 파티션 DROP / strd_dt 단위 DELETE)"""
+    if name and name not in RETENTION_POLICIES:
+        return FastJSONResponse(status_code=400, content={"error": f"지원하지 않는 보관 정책: {name}", "details": list(RETENTION_POLICIES)})
+    try:
+        names = [name] if name else list(RETENTION_POLICIES)
+        return {"message": "보관 기간 정리 완료", "result": [apply_retention(n, dry_run=dry_run) for n in names]}
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": "보관 기간 정리 중 오류 발생", "details": str(e)}
+        )
 
 @router.post("/run/naver-blog-crawler")
 async def run_naver_blog_crawler(request: Request):
-    """네이버 블로그 검색 크롤링 실행"""
+    """네이버 블로그 검색 크롤링 실행 (키워드 등록부 기준)"""
     try:
         crawler = NaverBlogCrawler()
-        data_list = crawler.run()
+        data_list = await crawler.run_registry()
         
         # ins_dt가 이제 문자열이므로 직렬화 처리 불필요
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "네이버 블로그 검색 완료", 
             "count": len(data_list), 
             "data": data_list
         })
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "네이버 블로그 검색 실행 중 오류 발생", "details": str(e)}
         )
 
+@router.post("/run/naver-blog-batch")
+async def run_naver_blog_batch(request: BlogBatchRequest):
+    """네이버 블로그 키워드 배치 검색 (동시 호출)"""
+    try:
+        crawler = NaverBlogCrawler()
+        result = await crawler.run_keywords(request.keywords, request.quantity)
+        
+        return FastJSONResponse({
+            "message": "네이버 블로그 키워드 배치 검색 완료",
+            "keywords": len(request.keywords),
+            "count": {keyword: len(rows) for keyword, rows in result.items()}
+        })
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": "네이버 블로그 키워드 배치 검색 중 오류 발생", "details": str(e)}
+        )
+
 @router.post("/run/youtube-comment-crawler")
 async def run_youtube_comment_crawler(request: Request):
     """유튜브 댓글 검색 크롤링 실행"""
     try:
         crawler = YoutubeCommentCrawler()
-        data_list = crawler.run()
+        data_list = await asyncio.to_thread(crawler.run)
         
         # ins_dt가 문자열이므로 직렬화 처리 불필요
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "유튜브 댓글 검색 완료", 
             "count": len(data_list), 
             "data": data_list
         })
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "유튜브 댓글 검색 실행 중 오류 발생", "details": str(e)}
         )
@@ -112,16 +243,16 @@ async def run_kakao_talk_crawler(request: Request):
     try:
         import time
         crawler = KakaoTalkCrawler()
-        result = crawler.run_crawl_kakao_talk()
+        result = await asyncio.to_thread(crawler.run_crawl_kakao_talk)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "카카오톡 API 실행 완료",
             "result": result,
             "timestamp": time.strftime('%Y%m%d%H%M%S')
         })
         
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "카카오톡 API 실행 중 오류 발생", "details": str(e)}
         )
@@ -132,16 +263,16 @@ async def run_seoul_public_data_crawler(request: Request):
     try:
         import time
         crawler = SeoulPublicDataCrawler()
-        result = crawler.run_seoul_api_crawler()
+        result = await asyncio.to_thread(crawler.run_seoul_api_crawler)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "서울 공공데이터 크롤러 실행 완료",
             "result": result,
             "timestamp": time.strftime('%Y%m%d%H%M%S')
         })
         
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "서울 공공데이터 크롤러 실행 중 오류 발생", "details": str(e)}
         )
@@ -152,16 +283,16 @@ async def run_kma_public_data_crawler(request: Request):
     try:
         import time
         crawler = KmaPublicDataCrawler()
-        result = crawler.run_kma_api_crawler()
+        result = await asyncio.to_thread(crawler.run_kma_api_crawler)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "기상청 공공데이터 크롤러 실행 완료",
             "result": result,
             "timestamp": time.strftime('%Y%m%d%H%M%S')
         })
         
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "기상청 공공데이터 크롤러 실행 중 오류 발생", "details": str(e)}
         )
@@ -172,16 +303,16 @@ async def run_jeju_public_data_crawler(request: Request):
     try:
         import time
         crawler = JejuPublicDataCrawler()
-        result = crawler.run_jeju_api_crawler()
+        result = await asyncio.to_thread(crawler.run_jeju_api_crawler)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "제주 공공데이터 크롤러 실행 완료",
             "result": result,
             "timestamp": time.strftime('%Y%m%d%H%M%S')
         })
         
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "제주 공공데이터 크롤러 실행 중 오류 발생", "details": str(e)}
         )
@@ -192,16 +323,16 @@ async def run_airflow_bash_operator(request: Request):
     try:
         import time
         runner = AirflowRunner()
-        result = runner.run_bash_operator_dag()
+        result = await asyncio.to_thread(runner.run_bash_operator_dag)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "message": "Airflow DAG 실행 완료",
             "result": result,
             "timestamp": time.strftime('%Y%m%d%H%M%S')
         })
         
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "Airflow DAG 실행 중 오류 발생", "details": str(e)}
         )
@@ -214,12 +345,70 @@ def check_airflow_status():
         status = runner.check_docker_status()
         return status
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": "Airflow 상태 확인 중 오류 발생", "details": str(e)}
         )
 
 # DB 연결 테스트 엔드포인트
+# 외부 호출 제한 현황 (소스별 동시 호출 수, 일일 할당량 사용량, 속도 제한으로 기다린 시간)
+@router.get("/rate-limits")
+def rate_limits():
+    return governor.status()
+
+# 업스트림별 서킷 브레이커 상태 (closed / open / half_open, 연속 실패 수, 차단한 호출 수)
+@router.get("/circuits")
+def circuits():
+    return breakers_status()
+
+# 내장 스케줄러: 작업별 cron / 다음 실행 시각 / 최근 실행 결과, 즉시 실행 / 일시 정지 / 재개 / cron 변경
+@router.get("/schedule", response_model=ScheduleOut, response_model_exclude_unset=True)
+def schedule_status():
+    return scheduler.schedule_status()
+
+def _schedule_job(job_id):
+    """스케줄러가 꺼져 있거나 없는 작업이면 오류 응답"""
+    if scheduler.scheduler is None:
+        return FastJSONResponse(status_code=503, content={"error": "스케줄러가 실행 중이 아닙니다", "details": "SCHEDULER_YN=Y 설정 필요"})
+    if job_id not in scheduler.SCHEDULED_JOBS:
+        return FastJSONResponse(status_code=404, content={"error": f"등록되지 않은 작업: {job_id}", "details": list(scheduler.SCHEDULED_JOBS)})
+    return None
+
+@router.post("/schedule/{job_id}/run")
+def schedule_run(job_id: str):
+    error = _schedule_job(job_id)
+    if error:
+        return error
+    scheduler.run_now(job_id)
+    return {"message": "작업 실행 요청 완료", "id": job_id}
+
+@router.post("/schedule/{job_id}/pause")
+def schedule_pause(job_id: str):
+    error = _schedule_job(job_id)
+    if error:
+        return error
+    scheduler.scheduler.pause_job(job_id)
+    return {"message": "작업 일시 정지", "id": job_id}
+
+@router.post("/schedule/{job_id}/resume")
+def schedule_resume(job_id: str):
+    error = _schedule_job(job_id)
+    if error:
+        return error
+    scheduler.scheduler.resume_job(job_id)
+    return {"message": "작업 재개", "id": job_id}
+
+@router.post("/schedule/{job_id}/reschedule")
+def schedule_reschedule(job_id: str, cron: str = Query(..., description="crontab 형식 (분 시 일 월 요일)")):
+    error = _schedule_job(job_id)
+    if error:
+        return error
+    try:
+        scheduler.set_cron(job_id, cron)
+    except ValueError as e:
+        return FastJSONResponse(status_code=400, content={"error": "잘못된 cron 형식", "details": str(e)})
+    return {"message": "작업 일정 변경", "id": job_id, "cron": cron}
+
 @router.get("/db/test")
 def db_test(db: Session = Depends(get_db)):
     try:
@@ -229,454 +418,157 @@ def db_test(db: Session = Depends(get_db)):
     except Exception as e:
         return {"db_connection": "fail", "error": str(e)}
 
-# 공통 페이징 파라미터
-def paging(
-    limit: int = Query(50, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+# DB 커넥션 풀 현황 (사용 중/초과 커넥션 수, 커넥션 대기 시간)
+@router.get("/db/pool", response_model=DbPoolOut, response_model_exclude_unset=True)
+def db_pool():
+    status = pool_status(engine)
+    if async_engine is not None:
+        status["async"] = pool_status(async_engine.sync_engine)
+    if replicas is not None:
+        status["replicas"] = [
+            {**replica, **pool_status(e)} for replica, e in zip(replicas.status(), replicas.engines)
+        ]
+    return status
+
+# 201~212: 목록 / 전체 / 스트림 조회 (app.registry.MODEL_SPECS 설정으로 경로 생성)
+register_all(router)
+
+# 203-4: Market / Stock 기술적 지표 (등락률, 이동평균, 변동성, 거래량 z-score)
+@router.get("/market/indicators", response_model=MarketIndicatorList)
+def market_indicators(
+    source: str = Query("market", pattern="^(market|stock)$", description="market: 글로벌 지수, stock: 네이버 금융 종목"),
+    code: str = Query(None, description="market 표시명(KOSPI) 또는 종목코드(005930)"),
     start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
     end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)")
 ):
-    return {"limit": limit, "offset": offset, "start_date": start_date, "end_date": end_date}
-
-@router.get("/stock/top5")
-def stock_top5(
+    start_dt = start_date.replace('-', '')[:8] if start_date else None
+    end_dt = end_date.replace('-', '')[:8] if end_date else start_dt
+    return {"items": MarketIndicatorBuilder().query(source, code, start_dt, end_dt)}
+
+# 203-3: Market OHLCV 기간 시계열 (차트용)
+@router.get("/market/ohlcv", response_model=MarketOhlcvOut)
+def market_ohlcv(
+    symbol: str = Query(..., description="심볼(KS11) 또는 시장명(KOSPI)"),
+    start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)")
+):
+    start_dt = start_date.replace('-', '')[:8] if start_date else None
+    end_dt = end_date.replace('-', '')[:8] if end_date else None
+    return MarketOhlcvStore().query(symbol, start_dt, end_dt)
+
+# 203-2: 거래소 거래일 조회
+@router.get("/market/calendar", response_model=MarketCalendarOut)
+def market_calendar(
+    market: str = Query("KRX", description="거래소 (KRX, NYSE)"),
+    base_date: str = Query(None, alias="date", description="기준일 (YYYY-MM-DD), 기본값 오늘")
+):
+    try:
+        as_of = datetime.strptime(base_date.replace('-', '')[:8], '%Y%m%d').date() if base_date else date.today()
+    except ValueError:
+        return FastJSONResponse(status_code=400, content={"error": "date는 YYYY-MM-DD 형식이어야 합니다"})
+    market = market.upper()
+    return {
+        "market": market,
+        "date": as_of.strftime('%Y%m%d'),
+        "is_trading_day": is_trading_day(market, as_of),
+        "last_trading_day": last_trading_day(market, as_of).strftime('%Y%m%d'),
+        "previous_trading_day": previous_trading_day(market, as_of).strftime('%Y%m%d'),
+    }
+
+# 204-3: Naver Blog keyword registry 등록/사용여부 변경
+@router.post("/blog/keywords")
+def register_blog_keywords(request: BlogKeywordRequest):
+    registry = BlogKeywordRegistry()
+    if request.use_yn == "Y":
+        inserted = registry.register(request.keywords)
+        updated = registry.set_use_yn(request.keywords, "Y")
+        return {"inserted": inserted, "updated": updated}
+    updated = registry.set_use_yn(request.keywords, request.use_yn)
+    return {"inserted": 0, "updated": updated}
+
+# 213: 집계 API - 허용된 컬럼만 GROUP BY/집계 (전체 데이터를 내려받아 화면에서 합산하지 않도록)
+@router.get("/aggregate")
+def aggregate_datasets():
+    return {
+        dataset: {"dimensions": spec["dimensions"], "measures": spec["measures"]}
+        for dataset, spec in AGGREGATES.items()
+    }
+
+@router.get("/aggregate/{dataset}", response_model=AggregateOut)
+def aggregate_dataset(
+    dataset: str,
+    group_by: str = Query(None, description="그룹 컬럼 (콤마 구분, 예: emd,gender)"),
+    metrics: str = Query("count", description="집계 지표 (예: sum:visit_pop,avg:visit_pop,count)"),
+    bucket: str = Query("day", description="기간 단위 (day, week, month, none)"),
+    start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_read_db)
+):
+    start_dt = start_date.replace('-', '')[:8] if start_date else None
+    end_dt = end_date.replace('-', '')[:8] if end_date else None
+    try:
+        items = aggregate(
+            db, dataset, group_by=group_by, metrics=metrics, bucket=bucket,
+            start_dt=start_dt, end_dt=end_dt, limit=limit
+        )
+    except ValueError as e:
+        return FastJSONResponse(status_code=400, content={"error": "잘못된 집계 요청", "details": str(e)})
+    return {"dataset": dataset, "bucket": bucket, "group_by": group_by, "metrics": metrics, "items": items}
+
+# 214: 일별 요약 테이블 조회 (크롤러 적재 시 strd_dt 단위로 갱신)
+@router.get("/rollup/{name}", response_model=RollupOut)
+def rollup(
+    name: str,
+    request: Request,
+    start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
+    db: Session = Depends(get_read_db)
+):
+    if name not in ROLLUPS:
+        return FastJSONResponse(status_code=400, content={"error": f"지원하지 않는 요약: {name}", "details": list(ROLLUPS)})
+    start_dt = start_date.replace('-', '')[:8] if start_date else None
+    end_dt = end_date.replace('-', '')[:8] if end_date else None
+    # 그룹 컬럼(emd, sido_nm, keword 등)은 쿼리 파라미터로 필터링
+    filters = {col: request.query_params.get(col) for col in ROLLUPS[name]["group_by"]}
+    return {"name": name, "items": query_rollup(db, name, start_dt, end_dt, filters)}
+
+# 215: 보관 기간 정책/파티션 현황
+@router.get("/retention", response_model=RetentionList)
+def retention():
+    return {"items": [retention_status(name) for name in RETENTION_POLICIES]}
+
+# 216: 응답 캐시 현황 / 전체 비우기
+@router.get("/cache")
+def cache_stats():
+    return response_cache.stats()
+
+@router.post("/cache/clear")
+def cache_clear():
+    response_cache.backend.clear()
+    return {"message": "응답 캐시 삭제 완료"}
+
+# 217: 분석용 컬럼형 내보내기 (Parquet / Arrow IPC stream, DB 커서에서 chunk 단위로 스트리밍)
+@router.get("/export", response_model=ExportCatalog)
+def export_tables():
+    return {"items": export_catalog()}
+
+@router.get("/export/{table}.{fmt}")
+def export_table(
+    table: str,
+    fmt: str,
     start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
     end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)"),
-    p: dict = Depends(paging),
-    db: Session = Depends(get_db)
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1000, le=MAX_CHUNK_SIZE, description="배치(row group) 행 수")
 ):
-    q = db.query(NaverFinance).order_by(NaverFinance.ins_dt.desc(), NaverFinance.id.desc())
-
-    # 날짜 between 필터링
-    if start_date and end_date:
-        try:
-            # DB는 strd_dt가 8자리(YYYYMMDD)임
-            start_dt = start_date.replace('-', '')[:8]
-            end_dt = end_date.replace('-', '')[:8]
-            if start_dt == end_dt:
-                q = q.filter(NaverFinance.strd_dt == start_dt)
-            else:
-                q = q.filter(NaverFinance.strd_dt >= start_dt, NaverFinance.strd_dt <= end_dt)
-        except Exception as e:
-            pass
-    elif start_date:
-        try:
-            start_dt = start_date.replace('-', '')[:8]
-            q = q.filter(NaverFinance.strd_dt == start_dt)
-        except Exception as e:
-            pass
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [
-        {
-            "strd_dt": r.strd_dt,
-            "stock_cd": r.stock_cd,
-            "stock_nm": r.stock_nm,
-            "pre_price": r.pre_price,
-            "today_price": r.today_price,
-            "trading_volume": r.trading_volume,
-            "ins_dt": r.ins_dt,
-        }
-        for r in rows
-    ]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [
-        {
-            "strd_dt": r.strd_dt,
-            "stock_cd": r.stock_cd,
-            "stock_nm": r.stock_nm,
-            "pre_price": r.pre_price,
-            "today_price": r.today_price,
-            "trading_volume": r.trading_volume,
-            "ins_dt": r.ins_dt,
-        }
-        for r in rows
-    ]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 201-1: Naver Finance Top 5 (All)
-@router.get("/stock/all")
-def stock_all(db: Session = Depends(get_db)):
-    rows = db.query(NaverFinance).order_by(NaverFinance.ins_dt.desc(), NaverFinance.id.desc()).all()
-    items = [
-        {
-            "strd_dt": r.strd_dt,
-            "stock_cd": r.stock_cd,
-            "stock_nm": r.stock_nm,
-            "pre_price": r.pre_price,
-            "today_price": r.today_price,
-            "trading_volume": r.trading_volume,
-            "ins_dt": r.ins_dt,
-        }
-        for r in rows
-    ]
-    return {"items": items}
-
-# 202: EV Top 10
-@router.get("/ev/top10")
-def ev_top10(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(EvTop).order_by(EvTop.ins_dt.desc(), EvTop.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(EvTop.strd_dt == start_dt)
-        else:
-            q = q.filter(EvTop.strd_dt >= start_dt, EvTop.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(EvTop.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, sido_nm=r.sido_nm, region=r.region, receipt_way=r.receipt_way,
-        receipt_priority=r.receipt_priority, value=r.value, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 202-1: EV Top 10 (All)
-@router.get("/ev/all")
-def ev_all(db: Session = Depends(get_db)):
-    rows = db.query(EvTop).order_by(EvTop.ins_dt.desc(), EvTop.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, sido_nm=r.sido_nm, region=r.region, receipt_way=r.receipt_way,
-        receipt_priority=r.receipt_priority, value=r.value, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 203: Market Top 10
-@router.get("/market/top10")
-def market_top10(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(MarketTop).order_by(MarketTop.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(MarketTop.strd_dt == start_dt)
-        else:
-            q = q.filter(MarketTop.strd_dt >= start_dt, MarketTop.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(MarketTop.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, market=r.market, stock_day=r.stock_day, opening_price=r.opening_price,
-        high_price=r.high_price, low_price=r.low_price, closing_price=r.closing_price, volume=r.volume
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 203-1: Market Top 10 (All)
-@router.get("/market/all")
-def market_all(db: Session = Depends(get_db)):
-    rows = db.query(MarketTop).order_by(MarketTop.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, market=r.market, stock_day=r.stock_day, opening_price=r.opening_price,
-        high_price=r.high_price, low_price=r.low_price, closing_price=r.closing_price, volume=r.volume
-    ) for r in rows]
-    return {"items": items}
-
-# 204: Naver Blog
-@router.get("/blog/naver")
-def blog_naver(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(BlogCrawl).order_by(BlogCrawl.ins_dt.desc(), BlogCrawl.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(BlogCrawl.strd_dt == start_dt)
-        else:
-            q = q.filter(BlogCrawl.strd_dt >= start_dt, BlogCrawl.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(BlogCrawl.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, keword=r.keword, title=r.title, link=r.link,
-        ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 204-1: Naver Blog (All)
-@router.get("/blog/all")
-def blog_all(db: Session = Depends(get_db)):
-    rows = db.query(BlogCrawl).order_by(BlogCrawl.ins_dt.desc(), BlogCrawl.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, keword=r.keword, title=r.title, link=r.link,
-        ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 205: YouTube comments
-@router.get("/youtube/comments")
-def youtube_comments(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(YoutubeComment).order_by(YoutubeComment.ins_dt.desc(), YoutubeComment.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(YoutubeComment.strd_dt == start_dt)
-        else:
-            q = q.filter(YoutubeComment.strd_dt >= start_dt, YoutubeComment.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(YoutubeComment.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, keword=r.keword, link=r.link, video_id=r.video_id,
-        comment_author=r.comment_author,
-        ins_dt=r.ins_dt.isoformat() if getattr(r, "ins_dt", None) and hasattr(r.ins_dt, "isoformat") else r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 205-1: YouTube comments (All)
-@router.get("/youtube/all")
-def youtube_all(db: Session = Depends(get_db)):
-    rows = db.query(YoutubeComment).order_by(YoutubeComment.ins_dt.desc(), YoutubeComment.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, keword=r.keword, link=r.link, video_id=r.video_id,
-        comment_author=r.comment_author,
-        ins_dt=r.ins_dt.isoformat() if getattr(r, "ins_dt", None) and hasattr(r.ins_dt, "isoformat") else r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 206: Kakao AI Image
-@router.get("/kakao/ai-image")
-def kakao_ai_image(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(KakaoAIImage).order_by(KakaoAIImage.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(KakaoAIImage.strd_dt == start_dt)
-        else:
-            q = q.filter(KakaoAIImage.strd_dt >= start_dt, KakaoAIImage.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(KakaoAIImage.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(strd_dt=r.strd_dt, suggest_word=r.suggest_word) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 206-1: Kakao AI Image (All)
-@router.get("/kakao/ai-image/all")
-def kakao_ai_image_all(db: Session = Depends(get_db)):
-    rows = db.query(KakaoAIImage).order_by(KakaoAIImage.id.desc()).all()
-    items = [dict(strd_dt=r.strd_dt, suggest_word=r.suggest_word) for r in rows]
-    return {"items": items}
-
-# 207: Kakao Talk token
-@router.get("/kakao/talk")
-def kakao_talk(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(KakaoTalk).order_by(KakaoTalk.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(KakaoTalk.strd_dt == start_dt)
-        else:
-            q = q.filter(KakaoTalk.strd_dt >= start_dt, KakaoTalk.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(KakaoTalk.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, access_token=r.access_token, token_type=r.token_type,
-        refresh_token=r.refresh_token, scope=r.scope, upd_dt=r.upd_dt, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 207-1: Kakao Talk token (All)
-@router.get("/kakao/talk/all")
-def kakao_talk_all(db: Session = Depends(get_db)):
-    rows = db.query(KakaoTalk).order_by(KakaoTalk.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, access_token=r.access_token, token_type=r.token_type,
-        refresh_token=r.refresh_token, scope=r.scope, upd_dt=r.upd_dt, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 208: Public apt trade
-@router.get("/public/apt-trade")
-def public_apt_trade(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(PublicAptTrade).order_by(PublicAptTrade.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(PublicAptTrade.strd_dt == start_dt)
-        else:
-            q = q.filter(PublicAptTrade.strd_dt >= start_dt, PublicAptTrade.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(PublicAptTrade.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, sgg_cd=r.sgg_cd, road_nm=r.road_nm, apt_nm=r.apt_nm,
-        excul_use_area=r.excul_use_area, deal_year=r.deal_year, deal_amount=r.deal_amount,
-        floor=r.floor, build_year=r.build_year, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 208-1: Public apt trade (All)
-@router.get("/public/apt-trade/all")
-def public_apt_trade_all(db: Session = Depends(get_db)):
-    rows = db.query(PublicAptTrade).order_by(PublicAptTrade.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, sgg_cd=r.sgg_cd, road_nm=r.road_nm, apt_nm=r.apt_nm,
-        excul_use_area=r.excul_use_area, deal_year=r.deal_year, deal_amount=r.deal_amount,
-        floor=r.floor, build_year=r.build_year, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 209: KMA forecast
-@router.get("/kma/forecast")
-def kma_forecast(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(KmaForecast).order_by(KmaForecast.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(KmaForecast.strd_dt == start_dt)
-        else:
-            q = q.filter(KmaForecast.strd_dt >= start_dt, KmaForecast.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(KmaForecast.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, strd_tm=r.strd_tm, category=r.category,
-        nx=r.nx, ny=r.ny, obsr_value=r.obsr_value, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 209-1: KMA forecast (All)
-@router.get("/kma/forecast/all")
-def kma_forecast_all(db: Session = Depends(get_db)):
-    rows = db.query(KmaForecast).order_by(KmaForecast.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, strd_tm=r.strd_tm, category=r.category,
-        nx=r.nx, ny=r.ny, obsr_value=r.obsr_value, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 210: Jeju visitors
-@router.get("/jeju/flo-pop")
-def jeju_flo_pop(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(JejuFloPop).order_by(JejuFloPop.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(JejuFloPop.strd_dt == start_dt)
-        else:
-            q = q.filter(JejuFloPop.strd_dt >= start_dt, JejuFloPop.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(JejuFloPop.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, regist_dt=r.regist_dt, city=r.city, emd=r.emd,
-        gender=r.gender, age_group=r.age_group, resd_pop=r.resd_pop,
-        work_pop=r.work_pop, visit_pop=r.visit_pop, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 210-1: Jeju visitors (All)
-@router.get("/jeju/flo-pop/all")
-def jeju_flo_pop_all(db: Session = Depends(get_db)):
-    rows = db.query(JejuFloPop).order_by(JejuFloPop.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, regist_dt=r.regist_dt, city=r.city, emd=r.emd,
-        gender=r.gender, age_group=r.age_group, resd_pop=r.resd_pop,
-        work_pop=r.work_pop, visit_pop=r.visit_pop, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 211: Seoul foreign pop
-@router.get("/seoul/for-pop")
-def seoul_for_pop(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    start_date: str = p.get('start_date') if 'start_date' in p else None
-    end_date: str = p.get('end_date') if 'end_date' in p else None
-    q = db.query(SeoulForPop).order_by(SeoulForPop.id.desc())
-    if start_date and end_date:
-        start_dt = start_date.replace('-', '')[:8]
-        end_dt = end_date.replace('-', '')[:8]
-        if start_dt == end_dt:
-            q = q.filter(SeoulForPop.strd_dt == start_dt)
-        else:
-            q = q.filter(SeoulForPop.strd_dt >= start_dt, SeoulForPop.strd_dt <= end_dt)
-    elif start_date:
-        start_dt = start_date.replace('-', '')[:8]
-        q = q.filter(SeoulForPop.strd_dt == start_dt)
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, stdr_de_id=r.stdr_de_id, tmzon_pd_se=r.tmzon_pd_se,
-        adstrd_code_se=r.adstrd_code_se, tot_lvpop_co=r.tot_lvpop_co,
-        china_staypop_co=r.china_staypop_co, etc_staypop_co=r.etc_staypop_co,
-        ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 211-1: Seoul foreign pop (All)
-@router.get("/seoul/for-pop/all")
-def seoul_for_pop_all(db: Session = Depends(get_db)):
-    rows = db.query(SeoulForPop).order_by(SeoulForPop.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, stdr_de_id=r.stdr_de_id, tmzon_pd_se=r.tmzon_pd_se,
-        adstrd_code_se=r.adstrd_code_se, tot_lvpop_co=r.tot_lvpop_co,
-        china_staypop_co=r.china_staypop_co, etc_staypop_co=r.etc_staypop_co,
-        ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
-
-# 212: Batch stats
-@router.get("/batch/stats")
-def api_batch_stats(p: dict = Depends(paging), db: Session = Depends(get_db)):
-    q = db.query(ApiBatchStat).order_by(ApiBatchStat.id.desc())
-    total = q.count()
-    rows = q.limit(p["limit"]).offset(p["offset"]).all()
-    items = [dict(
-        strd_dt=r.strd_dt, api_nm=r.api_nm, data_gb=r.data_gb,
-        data_cnt=r.data_cnt, memo=r.memo, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"meta": {"total": total, "limit": p["limit"], "offset": p["offset"]}, "items": items}
-
-# 212-1: Batch stats (All)
-@router.get("/batch/stats/all")
-def api_batch_stats_all(db: Session = Depends(get_db)):
-    rows = db.query(ApiBatchStat).order_by(ApiBatchStat.id.desc()).all()
-    items = [dict(
-        strd_dt=r.strd_dt, api_nm=r.api_nm, data_gb=r.data_gb,
-        data_cnt=r.data_cnt, memo=r.memo, ins_dt=r.ins_dt
-    ) for r in rows]
-    return {"items": items}
\ No newline at end of file
+    tables = exportable_tables()  # 등록 모델(app.registry) 기준
+    if table not in tables:
+        return FastJSONResponse(status_code=404, content={"error": f"내보낼 수 없는 테이블: {table}", "details": list(tables)})
+    if fmt not in FORMATS:
+        return FastJSONResponse(status_code=400, content={"error": f"지원하지 않는 형식: {fmt}", "details": list(FORMATS)})
+    start_dt, end_dt = date_range(start_date, end_date)  # 시작일만 있으면 해당 일자 하루
+    return StreamingResponse(
+        stream_export(tables[table], fmt, start_dt, end_dt, chunk_size),
+        media_type=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{table}.{fmt}"'}
+    )
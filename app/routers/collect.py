@@ -4,6 +4,7 @@ from ..db import get_db
 from ..models import YoutubeComment  # YoutubeKeword → YoutubeComment로 변경
 from ..service.youtube_comment_crawler import YoutubeCommentCrawler
 from pydantic import BaseModel
+import asyncio
 import time
 
 class YoutubeCommentRequest(BaseModel):
@@ -24,14 +25,15 @@ async def collect_youtube_comments(
         crawler = YoutubeCommentCrawler()
         
         # run_crawl_google_youtube_comment 메서드 사용
-        crawler.run_crawl_google_youtube_comment(request.keyword)
+        # 동기 API 호출/DB 작업은 스레드에서 실행 (이벤트 루프 차단 방지)
+        await asyncio.to_thread(crawler.run_crawl_google_youtube_comment, request.keyword)
         
         # 수집된 댓글 개수 확인
         strd_dt = time.strftime('%Y%m%d')
-        comment_count = db.query(YoutubeComment).filter(
+        comment_count = await asyncio.to_thread(db.query(YoutubeComment).filter(
             YoutubeComment.strd_dt == strd_dt,
             YoutubeComment.keword == request.keyword
-        ).count()
+        ).count)
         
         return {
             "message": f"YouTube 댓글 {comment_count}개를 수집했습니다.",
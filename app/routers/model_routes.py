@@ -0,0 +1,119 @@
+from fastapi import Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..db import get_read_db, get_async_db, async_engine
+from ..schema import ListPage, ListAll
+from app.registry import MODEL_SPECS
+from app.common.json_response import FastJSONResponse, rows_response
+from app.service.model_query import (
+    date_range, list_page, all_rows, list_page_async, all_rows_async, iter_ndjson
+)
+
+# 등록 모델(app.registry.MODEL_SPECS)별 조회 GET 경로 생성
+#   {path}{list}          페이징 목록 (offset 또는 cursor)
+#   {path}{all}           전체 조회
+#   (목록/전체 조회는 비동기 엔진이 있으면 AsyncSession으로 이벤트 루프에서 처리, 없으면 스레드풀의 동기 Session)
+#   {path}/stream         전체 조회 JSON Lines 스트리밍 (서버 측 커서)
+#   (Parquet / Arrow IPC 내보내기는 /api/export/{table}.{fmt} 한 곳에서 같은 모델 설정으로 처리, app.service.arrow_export)
+
+
+# 공통 페이징 파라미터
+def paging(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor: str = Query(None, description="이전 응답 meta.next_cursor (지정 시 offset 무시)"),
+    start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)")
+):
+    return {"limit": limit, "offset": offset, "cursor": cursor, "start_date": start_date, "end_date": end_date}
+
+
+def _filters(spec, request):
+    # dimensions 컬럼은 쿼리 파라미터로 일치 조건 필터링 (예: ?sido_nm=서울)
+    return {name: request.query_params.get(name) for name in spec["dimensions"]}
+
+
+def _list_error(e):
+    return FastJSONResponse(status_code=400, content={"error": "잘못된 목록 요청", "details": str(e)})
+
+
+def sync_handlers(spec):
+    def list_items(request: Request, p: dict = Depends(paging), db: Session = Depends(get_read_db)):
+        start_dt, end_dt = date_range(p["start_date"], p["end_date"])
+        try:
+            rows, columns, meta = list_page(
+                db, spec, p["limit"], p["offset"], start_dt, end_dt, _filters(spec, request), p["cursor"]
+            )
+        except ValueError as e:
+            return _list_error(e)
+        return rows_response(rows, columns, meta=meta)
+
+    def list_all(db: Session = Depends(get_read_db)):
+        return rows_response(*all_rows(db, spec))
+
+    return list_items, list_all
+
+
+def async_handlers(spec):
+    async def list_items(request: Request, p: dict = Depends(paging), db: AsyncSession = Depends(get_async_db)):
+        start_dt, end_dt = date_range(p["start_date"], p["end_date"])
+        try:
+            rows, columns, meta = await list_page_async(
+                db, spec, p["limit"], p["offset"], start_dt, end_dt, _filters(spec, request), p["cursor"]
+            )
+        except ValueError as e:
+            return _list_error(e)
+        return rows_response(rows, columns, meta=meta)
+
+    async def list_all(db: AsyncSession = Depends(get_async_db)):
+        return rows_response(*await all_rows_async(db, spec))
+
+    return list_items, list_all
+
+
+def register_model_routes(router, name, spec, use_async=None):
+    # response_model은 문서/클라이언트용 선언 - 행 튜플을 직렬화한 Response를 반환하므로 행 단위 검증은 생략됨
+    schema = spec["schema"]
+    base = spec["path"]
+    use_async = async_engine is not None if use_async is None else use_async
+    list_items, list_all = async_handlers(spec) if use_async else sync_handlers(spec)
+
+    def stream(
+        request: Request,
+        start_date: str = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+        end_date: str = Query(None, description="조회 종료일 (YYYY-MM-DD)")
+    ):
+        start_dt, end_dt = date_range(start_date, end_date)
+        return StreamingResponse(
+            iter_ndjson(spec, start_dt, end_dt, _filters(spec, request)), media_type="application/x-ndjson"
+        )
+
+    # /{path}/stream 을 목록 경로보다 먼저 등록 (목록 경로가 {path}와 같은 경우 대비)
+    router.add_api_route(f"{base}/stream", stream, methods=["GET"], name=f"{name}_stream",
+                         response_class=StreamingResponse)
+    router.add_api_route(f"{base}{spec['list']}", list_items, methods=["GET"], name=f"{name}_list",
+                         response_model=ListPage[schema])
+    if spec["all"]:
+        router.add_api_route(f"{base}{spec['all']}", list_all, methods=["GET"], name=f"{name}_all",
+                             response_model=ListAll[schema])
+
+
+def register_all(router, use_async=None):
+    for name, spec in MODEL_SPECS.items():
+        register_model_routes(router, name, spec, use_async)
+
+
+def cache_routes():
+    """응답 캐시 대상 GET 경로 → 조회 테이블
+
+    스트림 경로는 None(캐시 제외)으로 등록해 목록 경로의 하위 경로로 매칭되지 않도록 합니다.
+    """
+    routes = {}
+    for spec in MODEL_SPECS.values():
+        tables = [spec["model"].__tablename__]
+        routes[f"/api{spec['path']}{spec['list']}"] = tables
+        if spec["all"]:
+            routes[f"/api{spec['path']}{spec['all']}"] = tables
+        routes[f"/api{spec['path']}/stream"] = None
+    return routes
@@ -1,15 +1,27 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
 
 # 공통: 리스트 응답 형태
 class PageMeta(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # 다음 페이지 keyset 커서 (마지막 페이지면 None)
 
 class Page(BaseModel):
     meta: PageMeta
 
+# 목록 API 응답 (response_model 선언용, 행 스키마를 타입 인자로 지정: ListPage[EvOut])
+# 목록 엔드포인트는 DB 행을 직렬화한 Response를 직접 반환하므로 FastAPI가 행마다 검증하지 않습니다.
+class ListPage(BaseModel, Generic[T]):
+    meta: PageMeta
+    items: list[T]
+
+class ListAll(BaseModel, Generic[T]):
+    items: list[T]
+
 # 201
 class StockOut(BaseModel):
     strd_dt: Optional[str] = None
@@ -24,4 +36,251 @@ class StockList(BaseModel):
     meta: PageMeta
     items: list[StockOut]
 
-# 나머지도 필요시 동일 패턴으로 정의(간단 시에는 dict 반환도 허용)
+# 이하 응답 스키마의 필드 순서가 목록 API 응답 컬럼(순서 포함)이 됩니다. (app.registry)
+
+# 202
+class EvOut(BaseModel):
+    strd_dt: Optional[str] = None
+    sido_nm: Optional[str] = None
+    region: Optional[str] = None
+    receipt_way: Optional[str] = None
+    receipt_priority: Optional[str] = None
+    value: Optional[int] = None
+    ins_dt: Optional[str] = None
+
+# 203
+class MarketOut(BaseModel):
+    strd_dt: Optional[str] = None
+    market: Optional[str] = None
+    stock_day: Optional[str] = None
+    opening_price: Optional[float] = None
+    high_price: Optional[float] = None
+    low_price: Optional[float] = None
+    closing_price: Optional[float] = None
+    volume: Optional[int] = None
+
+# 204
+class BlogOut(BaseModel):
+    strd_dt: Optional[str] = None
+    keword: Optional[str] = None
+    title: Optional[str] = None
+    link: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 204-2
+class BlogKeywordOut(BaseModel):
+    keword: Optional[str] = None
+    use_yn: Optional[str] = None
+    newest_postdate: Optional[str] = None
+    upd_dt: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 205
+class YoutubeCommentOut(BaseModel):
+    strd_dt: Optional[str] = None
+    keword: Optional[str] = None
+    link: Optional[str] = None
+    video_id: Optional[str] = None
+    comment_author: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 206
+class KakaoAIImageOut(BaseModel):
+    strd_dt: Optional[str] = None
+    suggest_word: Optional[str] = None
+
+# 207
+class KakaoTalkOut(BaseModel):
+    strd_dt: Optional[str] = None
+    access_token: Optional[str] = None
+    token_type: Optional[str] = None
+    refresh_token: Optional[str] = None
+    scope: Optional[str] = None
+    upd_dt: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 208
+class PublicAptTradeOut(BaseModel):
+    strd_dt: Optional[str] = None
+    sgg_cd: Optional[str] = None
+    road_nm: Optional[str] = None
+    apt_nm: Optional[str] = None
+    excul_use_area: Optional[float] = None
+    deal_year: Optional[str] = None
+    deal_amount: Optional[str] = None  # '82,500' 형식
+    floor: Optional[str] = None
+    build_year: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 209
+class KmaForecastOut(BaseModel):
+    strd_dt: Optional[str] = None
+    strd_tm: Optional[str] = None
+    category: Optional[str] = None
+    nx: Optional[int] = None
+    ny: Optional[int] = None
+    obsr_value: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 210
+class JejuFloPopOut(BaseModel):
+    strd_dt: Optional[str] = None
+    regist_dt: Optional[str] = None
+    city: Optional[str] = None
+    emd: Optional[str] = None
+    gender: Optional[str] = None
+    age_group: Optional[str] = None
+    resd_pop: Optional[int] = None
+    work_pop: Optional[int] = None
+    visit_pop: Optional[int] = None
+    ins_dt: Optional[str] = None
+
+# 211
+class SeoulForPopOut(BaseModel):
+    strd_dt: Optional[str] = None
+    stdr_de_id: Optional[str] = None
+    tmzon_pd_se: Optional[str] = None
+    adstrd_code_se: Optional[str] = None
+    tot_lvpop_co: Optional[int] = None
+    china_staypop_co: Optional[int] = None
+    etc_staypop_co: Optional[int] = None
+    ins_dt: Optional[str] = None
+
+# 212
+class ApiBatchStatOut(BaseModel):
+    strd_dt: Optional[str] = None
+    api_nm: Optional[str] = None
+    data_gb: Optional[str] = None
+    data_cnt: Optional[int] = None
+    memo: Optional[str] = None
+    ins_dt: Optional[str] = None
+
+# 이하 목록 API 외 조회 경로의 응답 스키마 (app.routers.api의 response_model)
+
+# 203-2: 거래소 거래일
+class MarketCalendarOut(BaseModel):
+    market: str
+    date: str
+    is_trading_day: bool
+    last_trading_day: str
+    previous_trading_day: str
+
+# 203-3: OHLCV 시계열 (컬럼별 배열, dates와 같은 순서)
+class MarketOhlcvOut(BaseModel):
+    symbol: str
+    count: int
+    dates: list[str]
+    opening_price: list[Optional[float]]
+    high_price: list[Optional[float]]
+    low_price: list[Optional[float]]
+    closing_price: list[Optional[float]]
+    volume: list[Optional[int]]
+
+# 203-4: 기술적 지표
+class MarketIndicatorOut(BaseModel):
+    strd_dt: Optional[str] = None
+    trade_dt: Optional[str] = None
+    code: Optional[str] = None
+    name: Optional[str] = None
+    close_price: Optional[float] = None
+    change_rate: Optional[float] = None
+    ma5: Optional[float] = None
+    ma20: Optional[float] = None
+    ma60: Optional[float] = None
+    volatility20: Optional[float] = None
+    volume_zscore20: Optional[float] = None
+
+class MarketIndicatorList(BaseModel):
+    items: list[MarketIndicatorOut]
+
+# 213: 집계 (행 컬럼은 group_by/metrics 요청에 따라 달라짐: bucket, 그룹 컬럼..., 지표...)
+class AggregateOut(BaseModel):
+    dataset: str
+    bucket: str
+    group_by: Optional[str] = None
+    metrics: str
+    items: list[dict[str, Any]]
+
+# 214: 일별 요약 (행 컬럼은 요약 테이블별 group_by + 지표)
+class RollupOut(BaseModel):
+    name: str
+    items: list[dict[str, Any]]
+
+# 215: 보관 기간 정책/파티션
+class RetentionPartitionOut(BaseModel):
+    name: str
+    start: str
+    end: str
+
+class RetentionOut(BaseModel):
+    name: str
+    table: str
+    days: int
+    cutoff: Optional[str] = None
+    partitions: list[RetentionPartitionOut]
+
+class RetentionList(BaseModel):
+    items: list[RetentionOut]
+
+# DB 커넥션 풀 (/db/pool, QueuePool 항목/대기 통계는 풀 종류에 따라 없을 수 있음)
+class PoolStatusOut(BaseModel):
+    pool: str
+    status: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout: Optional[float] = None
+    recycle: Optional[int] = None
+    pre_ping: Optional[bool] = None
+    checkouts: Optional[int] = None
+    waits: Optional[int] = None
+    timeouts: Optional[int] = None
+    avg_wait_ms: Optional[float] = None
+    max_wait_ms: Optional[float] = None
+
+class ReplicaPoolStatusOut(PoolStatusOut):
+    url: str
+    lag: float
+    healthy: bool
+    checked: bool
+
+class DbPoolOut(PoolStatusOut):
+    async_pool: Optional[PoolStatusOut] = Field(None, alias="async")
+    replicas: Optional[list[ReplicaPoolStatusOut]] = None
+
+# 217: 내보내기 가능 테이블
+class ExportTableOut(BaseModel):
+    table: str
+    date_column: Optional[str] = None
+    columns: dict[str, str]
+    formats: list[str]
+
+class ExportCatalog(BaseModel):
+    items: list[ExportTableOut]
+
+# 스케줄러 작업 (/schedule, last_* / status / result 등 실행 기록 항목은 실행된 작업에만 있음)
+class ScheduledJobOut(BaseModel):
+    id: str
+    description: str
+    trigger: Optional[str] = None
+    next_run_time: Optional[str] = None
+    paused: bool
+    running: int
+    status: Optional[str] = None
+    error: Optional[str] = None
+    result: Any = None
+    last_start: Optional[str] = None
+    last_end: Optional[str] = None
+    duration: Optional[float] = None
+    last_skipped: Optional[str] = None
+    last_missed: Optional[str] = None
+
+class ScheduleOut(BaseModel):
+    running: bool
+    timezone: str
+    jitter: int
+    max_instances: int
+    misfire_grace_time: int
+    jobs: list[ScheduledJobOut]
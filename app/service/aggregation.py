@@ -0,0 +1,113 @@
+from app.registry import MODEL_SPECS
+from sqlalchemy import func, select
+from decimal import Decimal
+from app.common.types import numeric_type
+
+# 집계 허용 목록: 데이터셋별 그룹 컬럼(dimensions)과 집계 가능한 수치 컬럼(measures)
+# app.registry의 모델 설정에서 strd_dt가 있고 그룹/집계 컬럼이 지정된 데이터셋만 사용합니다.
+# 목록에 없는 컬럼은 SQL에 들어가지 않습니다.
+AGGREGATES = {
+    name: {"model": spec["model"], "dimensions": spec["dimensions"], "measures": spec["measures"]}
+    for name, spec in MODEL_SPECS.items()
+    if hasattr(spec["model"], "strd_dt") and (spec["dimensions"] or spec["measures"])
+}
+
+METRIC_FUNCS = {"sum": func.sum, "avg": func.avg, "min": func.min, "max": func.max, "count": func.count}
+BUCKETS = ("day", "week", "month", "none")
+MAX_LIMIT = 10000
+
+
+def split_param(value):
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def bucket_expr(column, bucket, dialect):
+    """strd_dt(DATE)를 집계 구간 라벨(YYYYMMDD / YYYYMM)로 변환하는 SQL 식
+
+    week는 해당 주 월요일 날짜를 라벨로 사용하며, 날짜 함수가 DB마다 달라 dialect별로 분기합니다.
+    """
+    if bucket == "day":
+        return column  # YmdDate 타입이 YYYYMMDD 문자열로 변환
+    if dialect == "mysql":
+        if bucket == "month":
+            return func.date_format(column, "%Y%m")
+        return func.date_format(func.subdate(column, func.weekday(column)), "%Y%m%d")
+    if dialect == "postgresql":
+        if bucket == "month":
+            return func.to_char(column, "YYYYMM")
+        return func.to_char(func.date_trunc("week", column), "YYYYMMDD")
+    if bucket == "month":
+        return func.strftime("%Y%m", column)
+    # sqlite: 'weekday 0'은 다음 일요일로 이동하므로 6일을 빼서 월요일로 맞춤
+    return func.strftime("%Y%m%d", column, "weekday 0", "-6 days")
+
+
+def build_aggregate(dataset, group_by=None, metrics=None, bucket="day", start_dt=None, end_dt=None,
+                    limit=1000, dialect="mysql"):
+    """허용 목록을 검증하고 GROUP BY 집계 SELECT 문과 결과 컬럼명을 반환
+
+    metrics: "sum:visit_pop,avg:visit_pop,count" 형식 (count는 컬럼 없이 행 수)
+    """
+    spec = AGGREGATES.get(dataset)
+    if spec is None:
+        raise ValueError(f"지원하지 않는 데이터셋: {dataset} (가능: {', '.join(AGGREGATES)})")
+    if bucket not in BUCKETS:
+        raise ValueError(f"지원하지 않는 bucket: {bucket} (가능: {', '.join(BUCKETS)})")
+
+    model = spec["model"]
+    group_cols = split_param(group_by)
+    invalid = [c for c in group_cols if c not in spec["dimensions"]]
+    if invalid:
+        raise ValueError(f"group_by 허용 컬럼이 아님: {invalid} (가능: {spec['dimensions']})")
+
+    group_exprs, labels = [], []
+    if bucket != "none":
+        group_exprs.append(bucket_expr(model.strd_dt, bucket, dialect).label("bucket"))
+        labels.append("bucket")
+    for col in group_cols:
+        group_exprs.append(getattr(model, col))
+        labels.append(col)
+
+    columns = list(group_exprs)
+    for metric in split_param(metrics) or ["count"]:
+        fn, _, col = metric.partition(":")
+        if fn not in METRIC_FUNCS:
+            raise ValueError(f"지원하지 않는 집계 함수: {fn} (가능: {', '.join(METRIC_FUNCS)})")
+        if fn == "count" and not col:
+            columns.append(func.count().label("count"))
+            labels.append("count")
+            continue
+        if col not in spec["measures"]:
+            raise ValueError(f"집계 허용 컬럼이 아님: {col} (가능: {spec['measures']})")
+        label = f"{fn}_{col}"
+        column = getattr(model, col)
+        if fn == "count":
+            columns.append(func.count(column).label(label))
+        else:
+            columns.append(METRIC_FUNCS[fn](column, type_=numeric_type(column.type)).label(label))
+        labels.append(label)
+
+    stmt = select(*columns)
+    if start_dt:
+        stmt = stmt.where(model.strd_dt >= start_dt)
+    if end_dt:
+        stmt = stmt.where(model.strd_dt <= end_dt)
+    if group_exprs:
+        stmt = stmt.group_by(*group_exprs).order_by(*group_exprs)
+    stmt = stmt.limit(min(max(int(limit), 1), MAX_LIMIT))
+    return stmt, labels
+
+
+def aggregate(db, dataset, **kwargs):
+    """집계 실행 - 결과는 {bucket, 그룹 컬럼..., 지표...} 행 목록"""
+    dialect = db.get_bind().dialect.name
+    stmt, labels = build_aggregate(dataset, dialect=dialect, **kwargs)
+    rows = db.execute(stmt).all()
+    items = []
+    for row in rows:
+        item = dict(zip(labels, row))
+        for key, value in item.items():
+            if isinstance(value, Decimal):
+                item[key] = float(value)  # Decimal(avg 결과) → JSON 직렬화 가능한 float
+        items.append(item)
+    return items
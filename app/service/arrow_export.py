@@ -0,0 +1,146 @@
+from app.db import read_engine
+from app.registry import MODEL_SPECS
+from app.common.types import numeric_type
+from app.service.model_query import apply_filters
+from sqlalchemy import (
+    BigInteger, Boolean, Date, DateTime, Float, Integer, Numeric, SmallInteger, select, type_coerce
+)
+import pyarrow as pa
+import pyarrow.parquet as pq
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 분석용 컬럼형 내보내기 (Parquet / Arrow IPC stream)
+# DB 커서에서 chunk_size 행씩 읽어 RecordBatch를 만들고 바로 응답으로 흘려보냅니다. (전체 결과를 메모리에 올리지 않음)
+# 날짜/숫자 컬럼은 API 문자열 형식('20261019', '82,500')이 아닌 DB 타입(date32, timestamp, int64, decimal) 그대로 내보냅니다.
+
+FORMATS = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+# 내보내기 대상은 등록 모델(app.registry.MODEL_SPECS) 기준이며, 날짜 필터 컬럼도 모델 설정의 date_column을 사용합니다.
+# 인증 토큰이 저장된 테이블 등 모델 설정에서 export=False 인 테이블은 제외합니다.
+DEFAULT_CHUNK_SIZE = 50000
+MAX_CHUNK_SIZE = 500000
+
+
+def exportable_tables():
+    """테이블명 → 모델 설정 (등록 모델 중 export=False 제외)"""
+    specs = {spec["model"].__tablename__: spec for spec in MODEL_SPECS.values() if spec.get("export", True)}
+    return dict(sorted(specs.items()))
+
+
+def arrow_type(column_type):
+    """SQLAlchemy 컬럼 타입 → Arrow 타입 (TypeDecorator는 DB 저장 타입 기준)"""
+    column_type = numeric_type(column_type)
+    if isinstance(column_type, SmallInteger):
+        return pa.int16()
+    if isinstance(column_type, (Integer, BigInteger)):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric):
+        if column_type.precision:
+            return pa.decimal128(column_type.precision, column_type.scale or 0)
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    return pa.string()
+
+
+def date_column(spec):
+    return spec["model"].__table__.columns[spec["date_column"]] if spec["date_column"] else None
+
+
+def build_export_query(spec, start_dt=None, end_dt=None):
+    """내보내기 SELECT 문과 Arrow 스키마 (TypeDecorator 변환 없이 DB 타입 그대로 조회)"""
+    model = spec["model"]
+    columns = list(model.__table__.columns)
+    stmt = select(*[type_coerce(c, numeric_type(c.type)).label(c.name) for c in columns])
+    # 날짜 조건은 목록/스트림 조회와 같은 규칙 (start_dt == end_dt면 하루, app.service.model_query.date_range)
+    stmt = apply_filters(stmt, spec, start_dt, end_dt)
+    key = date_column(spec)
+    stmt = stmt.order_by(*([key] if key is not None else []), *model.__table__.primary_key.columns)
+    schema = pa.schema([pa.field(c.name, arrow_type(c.type)) for c in columns])
+    return stmt, schema
+
+
+def iter_record_batches(stmt, schema, chunk_size=DEFAULT_CHUNK_SIZE):
+    """서버 측 커서(stream_results)로 chunk_size 행씩 읽어 RecordBatch 생성 (읽기 복제본이 있으면 복제본에서)"""
+    with read_engine().connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        for rows in result.partitions(chunk_size):
+            arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _ChunkSink:
+    """Arrow/Parquet writer가 쓴 바이트를 모아 두었다가 응답 chunk로 내보내는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def stream_export(spec, fmt, start_dt=None, end_dt=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parquet(chunk당 row group 1개) 또는 Arrow IPC stream 바이트를 chunk 단위로 생성"""
+    stmt, schema = build_export_query(spec, start_dt, end_dt)
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    total = 0
+    try:
+        for batch in iter_record_batches(stmt, schema, chunk_size):
+            if fmt == "parquet":
+                writer.write_batch(batch, row_group_size=chunk_size)
+            else:
+                writer.write_batch(batch)
+            total += batch.num_rows
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+    logger.info(f"[내보내기] {spec['model'].__tablename__}.{fmt} {total}건 (기간 {start_dt}~{end_dt})")
+
+
+def export_catalog():
+    """내보내기 가능한 테이블/컬럼/Arrow 타입 목록"""
+    items = []
+    for table, spec in exportable_tables().items():
+        items.append({
+            "table": table,
+            "date_column": spec["date_column"],
+            "columns": {c.name: str(arrow_type(c.type)) for c in spec["model"].__table__.columns},
+            "formats": [f"/api/export/{table}.{fmt}" for fmt in FORMATS],
+        })
+    return items
@@ -0,0 +1,96 @@
+import time
+import logging
+from app.db import SessionLocal
+from app.models import BlogKeyword
+from app.common.upsert import insert_if_unseen
+
+logger = logging.getLogger(__name__)
+
+
+class BlogKeywordRegistry:
+    """네이버 블로그 모니터링 키워드 등록부"""
+
+    def register(self, keywords, strip_terms=None):
+        """키워드 등록 (이미 있는 키워드는 건너뜀)
+
+        strip_terms: {keyword: [제거할 단어, ...]} - 제목 정제 시 사용
+        """
+        ins_dt = time.strftime('%Y%m%d%H%M%S')
+        strip_terms = strip_terms or {}
+        rows = [
+            {
+                "keword": keyword.strip(),
+                "use_yn": "Y",
+                "strip_terms": ",".join(strip_terms.get(keyword, [])) or None,
+                "ins_dt": ins_dt
+            }
+            for keyword in dict.fromkeys(keywords) if keyword and keyword.strip()
+        ]
+        session = SessionLocal()
+        try:
+            inserted = insert_if_unseen(session, BlogKeyword, rows, ["keword"])
+            session.commit()
+            logger.info(f"[블로그 키워드] {len(rows)}개 중 {inserted}개 신규 등록")
+            return inserted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[블로그 키워드] 등록 오류: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def set_use_yn(self, keywords, use_yn):
+        """키워드 사용 여부 변경"""
+        session = SessionLocal()
+        try:
+            updated = session.query(BlogKeyword).filter(BlogKeyword.keword.in_(keywords)).update(
+                {"use_yn": use_yn, "upd_dt": time.strftime('%Y%m%d%H%M%S')},
+                synchronize_session=False
+            )
+            session.commit()
+            return updated
+        finally:
+            session.close()
+
+    def active_keywords(self):
+        """사용 중인 키워드와 마지막 수집 게시일 {keyword: newest_postdate}"""
+        session = SessionLocal()
+        try:
+            rows = session.query(BlogKeyword.keword, BlogKeyword.newest_postdate).filter(
+                BlogKeyword.use_yn == "Y"
+            ).order_by(BlogKeyword.id).all()
+            return {keyword: newest_postdate for keyword, newest_postdate in rows}
+        finally:
+            session.close()
+
+    def strip_terms(self):
+        """키워드별 제거 단어 {keyword: [term, ...]}"""
+        session = SessionLocal()
+        try:
+            rows = session.query(BlogKeyword.keword, BlogKeyword.strip_terms).all()
+            return {
+                keyword: [t.strip() for t in terms.split(",") if t.strip()]
+                for keyword, terms in rows if terms
+            }
+        finally:
+            session.close()
+
+    def update_newest_postdate(self, newest_by_keyword):
+        """키워드별 최신 게시일 갱신 (기존 값보다 새로운 경우만)"""
+        if not newest_by_keyword:
+            return
+        upd_dt = time.strftime('%Y%m%d%H%M%S')
+        session = SessionLocal()
+        try:
+            for keyword, postdate in newest_by_keyword.items():
+                session.query(BlogKeyword).filter(
+                    BlogKeyword.keword == keyword,
+                    (BlogKeyword.newest_postdate.is_(None)) | (BlogKeyword.newest_postdate < postdate)
+                ).update({"newest_postdate": postdate, "upd_dt": upd_dt}, synchronize_session=False)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[블로그 키워드] 최신 게시일 갱신 오류: {e}")
+            raise e
+        finally:
+            session.close()
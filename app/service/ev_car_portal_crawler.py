@@ -1,5 +1,7 @@
 from app.db import SessionLocal
 from app.models import EvTop
+from app.service.rollup import refresh_after_save
+from app.common.rate_governor import governor
 from bs4 import BeautifulSoup
 import time
 import logging
@@ -55,7 +57,8 @@ class EvCarPortalCrawler:
             self.setup_driver()
             
             print(f"[EV 포털 크롤링] 페이지 로딩 중: {self.url}")
-            self.driver.get(self.url)
+            with governor.limit(self.url):
+                self.driver.get(self.url)
             
             # 페이지 로딩 대기
             WebDriverWait(self.driver, 10).until(
@@ -298,6 +301,7 @@ class EvCarPortalCrawler:
 
             session.commit()
             print(f"[EV 포털 크롤링] 총 {len(data_list)}개 데이터 저장 완료")
+            refresh_after_save(EvTop.__tablename__, [data['strd_dt'] for data in data_list])
             
         except Exception as e:
             session.rollback()
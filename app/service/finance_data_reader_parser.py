@@ -1,118 +1,135 @@
-from app.db import SessionLocal
 from app.models import MarketTop
+from app.config import settings
+from app.common.trading_calendar import HOLIDAYS, reference_trading_day
+from app.common.df_loader import replace_partition
+from app.common.rate_governor import governor
+from app.common import resilience
+from app.service.market_indicator_builder import MarketIndicatorBuilder
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import time
 import datetime
 from datetime import date, timedelta
 
+def retryable(error):
+    """DataReader 오류 중 접속/서버 오류만 재시도 (잘못된 심볼 등 ValueError/KeyError는 재시도해도 같은 결과이고 서킷도 열지 않음)"""
+    response = getattr(error, "response", None)
+    if response is not None and getattr(response, "status_code", None) is not None:
+        return response.status_code in resilience.RETRY_STATUSES
+    return isinstance(error, OSError)  # requests/urllib 접속 오류, timeout
+
+
+EXPECTED_COLS = ['strd_dt', 'market', 'stock_day', 'opening_price', 'high_price', 'low_price', 'closing_price', 'volume']
+
+
+def parse_market_symbols(value):
+    """'symbol:표시명:거래소,...' 설정값을 [{symbol, market, exchange}] 목록으로 변환"""
+    symbols = []
+    for entry in value.split(","):
+        parts = [p.strip() for p in entry.split(":")]
+        if not parts[0]:
+            continue
+        symbol = parts[0]
+        market = parts[1] if len(parts) > 1 and parts[1] else symbol
+        exchange = parts[2].upper() if len(parts) > 2 and parts[2] else "ETC"
+        symbols.append({"symbol": symbol, "market": market, "exchange": exchange})
+    return symbols
+
 
 class FinanceDataReaderParser():
+    def __init__(self, symbols=None, max_workers=None, max_attempts=None, lookback_days=5):
+        self.symbols = symbols or parse_market_symbols(settings.MARKET_SYMBOLS)
+        self.max_workers = max_workers or settings.MARKET_FETCH_WORKERS
+        # 심볼별 조회 정책: 휴장일 테이블이 없는 거래소는 후보 영업일 구간을 한 번에 조회하고,
+        # 빈 결과면 구간을 넓혀 최대 max_attempts번 조회 (접속 오류 재시도/서킷 브레이커는 resilience.call)
+        self.max_attempts = max_attempts or settings.MARKET_FETCH_MAX_ATTEMPTS
+        self.lookback_days = lookback_days
+
+
     def save_to_dbms_market_stock(self, df):
-        print("[DB 적재] 함수 진입: save_to_dbms_market_stock 호출됨")
-        session = SessionLocal()
-        try:
-            # DataFrame에서 strd_dt 값 추출 (모든 row가 동일한 strd_dt라고 가정)
-            if not df.empty:
-                strd_dt_value = df.iloc[0]['strd_dt']
-                print(f"[DB 적재] 삭제 대상 strd_dt: {strd_dt_value}")
-                # 기존 데이터 삭제
-                session.query(MarketTop).filter(MarketTop.strd_dt == strd_dt_value).delete()
-                session.commit()
-            # 새 데이터 적재
-            for _, row in df.iterrows():
-                print(f"[DB 적재] 저장 row: {row.to_dict()}")
-                obj = MarketTop(
-                    strd_dt=row['strd_dt'],
-                    market=row['market'],
-                    stock_day=row['stock_day'],
-                    opening_price=row['opening_price'],
-                    high_price=row['high_price'],
-                    low_price=row['low_price'],
-                    closing_price=row['closing_price'],
-                    volume=row['volume'],
-                    ins_dt=row['ins_dt']
-                )
-                session.add(obj)
-            session.commit()
-        finally:
-            session.close()
+        """strd_dt 단위로 기존 데이터를 교체하여 적재 (삭제+다건 INSERT를 한 트랜잭션으로 처리)"""
+        count = replace_partition(df, MarketTop, key_col='strd_dt')
+        print(f"[DB 적재] dbms_market_stock {count}건 저장")
+        for strd_dt in df['strd_dt'].dropna().unique():
+            MarketIndicatorBuilder().build_after_save('market', strd_dt)
+        return count
+
+    def target_date(self, exchange, today):
+        """거래소별 조회 기준일 (한국: 오늘 이전 최근 거래일, 미국/기타: 전일 이전 최근 거래일)"""
+        return reference_trading_day(exchange, today)
+
+    def normalize(self, df_src, market_name, strd_dt):
+        """FinanceDataReader 결과를 표준 스키마로 변환"""
+        df_local = df_src.reset_index()
+        if 'Date' in df_local.columns:
+            date_col = 'Date'
+        else:
+            date_col = df_local.columns[0]
+        standardized = pd.DataFrame()
+        standardized['stock_day'] = df_local[date_col]
+        for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
+            if col in df_local.columns:
+                standardized[col] = df_local[col]
+            else:
+                standardized[col] = pd.NA
+        standardized.insert(0, 'market', market_name)
+        standardized.insert(0, 'strd_dt', strd_dt)
+        return standardized
+
+    def fetch_symbol(self, fdr, spec, target, strd_dt):
+        """심볼 하나 조회
+
+        휴장일 테이블이 있는 거래소(KRX/NYSE)는 기준 거래일 하루만 한 번 조회합니다.
+        그 외 거래소는 후보 영업일(target 이전 lookback_days)을 하나의 구간 요청으로 조회하여
+        가장 최근 거래일 1건을 사용합니다. 빈 결과면 구간을 두 배로 넓혀 다시 조회합니다.
+        DataReader 호출은 resilience.call("finance-data-reader")로 접속 오류만 백오프 재시도하고,
+        서킷이 열려 있거나 재시도할 수 없는 오류(잘못된 심볼 등)면 바로 포기합니다.
+        """
+        symbol, market_name = spec['symbol'], spec['market']
+        lookback = 0 if spec['exchange'] in HOLIDAYS else self.lookback_days
+        for attempt in range(self.max_attempts):
+            start = target - timedelta(days=lookback)
+
+            def read():
+                with governor.limit("finance-data-reader"):
+                    return fdr.DataReader(symbol, start.strftime('%Y%m%d'), target.strftime('%Y%m%d'))
+
+            try:
+                df = resilience.call("finance-data-reader", read, retryable=retryable)
+            except Exception as e:
+                print(f"[실패] {market_name}({symbol}) 데이터 조회 실패 ({start}~{target}): {e}")
+                return None
+            if df is not None and not df.empty:
+                df = df.sort_index().tail(1)
+                print(f"[성공] {market_name}({symbol}) 데이터 조회 성공 - 날짜: {df.index[-1]}")
+                return self.normalize(df, market_name, strd_dt)
+            print(f"[재시도 {attempt+1}/{self.max_attempts}] {market_name}({symbol}) {start}~{target} 데이터 없음")
+            lookback = lookback * 2 or self.lookback_days
+
+        print(f"[실패] {market_name}({symbol}) 모든 재시도 실패")
+        return None
 
     def get_data(self):
         # import inside the function so import-time failures don't crash the app
         import FinanceDataReader as fdr
 
-        # 영업일 찾기 함수
-        def get_business_date(target_date, days_back=0):
-            current_date = target_date - timedelta(days=days_back)
-            # 주말인 경우 금요일로 조정
-            while current_date.weekday() >= 5:  # 5=토요일, 6=일요일
-                current_date -= timedelta(days=1)
-            return current_date.strftime('%Y%m%d')
-
         today = date.today()
         strd_dt = time.strftime('%Y%m%d')
         ins_dt = time.strftime('%Y%m%d%H%M%S')
-        
-        # 한국 시장용 영업일 (오늘이 주말이면 금요일)
-        kr_business_date = get_business_date(today)
-        # 미국 시장용 영업일 (어제가 주말이면 그 전 금요일)
-        us_business_date = get_business_date(today, 1)
-
-        # Helper to normalize a dataframe into a standard schema
-        def normalize(df_src, market_name):
-            df_local = df_src.copy()
-            df_local = df_local.reset_index()
-            if 'Date' in df_local.columns:
-                date_col = 'Date'
-            else:
-                date_col = df_local.columns[0]
-            standardized = pd.DataFrame()
-            standardized['stock_day'] = df_local[date_col]
-            for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                if col in df_local.columns:
-                    standardized[col] = df_local[col]
-                else:
-                    standardized[col] = pd.NA
-            standardized.insert(0, 'market', market_name)
-            standardized.insert(0, 'strd_dt', strd_dt)
-            return standardized
-
-        # 각 데이터 소스를 개별적으로 처리하여 오류 시 이전 영업일 시도
-        def safe_data_reader(symbol, start_date, end_date=None, market_name='', max_retry=5):
-            for i in range(max_retry):
-                try:
-                    current_date = datetime.datetime.strptime(start_date, '%Y%m%d').date()
-                    # i일 전 영업일로 조정
-                    retry_date = get_business_date(current_date, i)
-                    
-                    if end_date is None:
-                        df = fdr.DataReader(symbol, retry_date)
-                    else:
-                        retry_end_date = retry_date  # 한국 시장은 시작일=종료일
-                        df = fdr.DataReader(symbol, retry_date, retry_end_date)
-                    
-                    if not df.empty:
-                        print(f"[성공] {market_name}({symbol}) 데이터 조회 성공 - 날짜: {retry_date}")
-                        return normalize(df, market_name)
-                except Exception as e:
-                    print(f"[재시도 {i+1}/{max_retry}] {market_name}({symbol}) 데이터 조회 실패 ({retry_date}): {e}")
-                    continue
-            
-            # 모든 재시도 실패 시 빈 DataFrame 반환
-            print(f"[실패] {market_name}({symbol}) 모든 재시도 실패")
-            empty_df = pd.DataFrame(columns=['strd_dt', 'market', 'stock_day', 'Open', 'High', 'Low', 'Close', 'Volume'])
-            empty_df['strd_dt'] = strd_dt
-            empty_df['market'] = market_name
-            return empty_df
-
-        df_kospi = safe_data_reader('KS11', kr_business_date, kr_business_date, 'KOSPI')
-        df_kosdaq = safe_data_reader('KQ11', kr_business_date, kr_business_date, 'KOSDAQ')
-        df_nasdaq = safe_data_reader('IXIC', us_business_date, None, 'NASDAQ')
-        df_sp500 = safe_data_reader('S&P500', us_business_date, None, 'S&P500')
-        df_dji = safe_data_reader('DJI', us_business_date, None, 'DowJones')
-
-        dfs = [df_kospi, df_kosdaq, df_nasdaq, df_sp500, df_dji]
-        dfs = [df for df in dfs if not df.empty and not df.isna().all().all()]
+
+        # 심볼별 조회를 스레드 풀에서 동시에 실행 (전체 소요시간 ≈ 가장 느린 심볼 1개)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch_symbol, fdr, spec, self.target_date(spec['exchange'], today), strd_dt)
+                for spec in self.symbols
+            ]
+            dfs = [future.result() for future in futures]
+
+        dfs = [df for df in dfs if df is not None and not df.empty and not df.isna().all().all()]
+        if not dfs:
+            self.df = pd.DataFrame(columns=EXPECTED_COLS + ['ins_dt'])
+            return self.df
+
         df_total = pd.concat(dfs, ignore_index=True)
         df_total.replace({pd.NaT: datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}, inplace=True)
         df_total = df_total.infer_objects(copy=False)
@@ -125,12 +142,10 @@ class FinanceDataReaderParser():
             'Volume': 'volume'
         }
         df_total = df_total.rename(columns=rename_map)
-        expected_cols = ['strd_dt', 'market', 'stock_day', 'opening_price', 'high_price', 'low_price', 'closing_price', 'volume']
-        for c in expected_cols:
+        for c in EXPECTED_COLS:
             if c not in df_total.columns:
                 df_total[c] = pd.NA
-        df = df_total[expected_cols].copy()
+        df = df_total[EXPECTED_COLS].copy()
         df['ins_dt'] = ins_dt
         self.df = df
         return self.df
-        # ...existing code...
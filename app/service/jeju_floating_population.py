@@ -7,6 +7,7 @@ from datetime import date, timedelta, datetime
 from app.config import settings
 from app.common.common_func import save_data
 from app.common.logger import get_logger
+from app.common import http_client
 # from dbms.models.api_models import JejuApiFloatingPopulation
 
 logger = get_logger(__name__)
@@ -31,7 +32,7 @@ def api_call(start_dt: str, end_dt: str, emd_list: list[str]):
             api_url = f"{base_url}/{api_key}?startDate={start_dt}&endDate={end_dt}&emd={query}"
             logger.info(f"Calling Jeju API for emd='{emd}', date='{start_dt}~{end_dt}'")
 
-            response = requests.get(api_url, timeout=30)
+            response = http_client.get(api_url, timeout=30)
             response.raise_for_status()  # 200 OK가 아니면 예외 발생
 
             contents = response.json()
@@ -1,14 +1,15 @@
 import pandas as pd
 import requests
 import json
-import urllib
 import time
 import logging
 from urllib.parse import quote
 from datetime import date, timedelta
 from app.db import SessionLocal
 from app.models import JejuFloPop
+from app.service.rollup import refresh_after_save
 from app.config import settings
+from app.common import http_client
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -45,8 +46,9 @@ class JejuPublicDataCrawler:
             logger.info(f"[제주공공데이터] API 호출: {api_url}")
             
             # API 호출
-            weburl = urllib.request.urlopen(api_url)
-            data = weburl.read()
+            response = http_client.get(api_url)
+            response.raise_for_status()
+            data = response.content
             
             # JSON 파싱
             contents = json.loads(data)
@@ -176,6 +178,7 @@ class JejuPublicDataCrawler:
             
             session.commit()
             logger.info(f"[제주공공데이터] 데이터베이스 저장 완료 - {len(records)}건")
+            refresh_after_save(JejuFloPop.__tablename__, self.strd_dt)
             return len(records)
             
         except Exception as e:
@@ -1,11 +1,11 @@
 import pendulum
 import json
-import requests
 import time
 import logging
 from app.db import SessionLocal
 from app.models import KakaoTalk
 from app.config import settings
+from app.common import http_client
 
 REDIRECT_URL = 'https://example.com/oauth'
 logging.basicConfig(level=logging.DEBUG)
@@ -36,7 +36,7 @@ class KakaoTalkCrawler:
                 "refresh_token": refresh_token
             }
             
-            response = requests.post(url, data=data)
+            response = http_client.post(url, data=data)
             rslt = response.json()
             
             new_access_token = rslt.get('access_token')
@@ -58,83 +58,74 @@ class KakaoTalkCrawler:
             return self.kakao_tokens
 
     def send_kakao_msg(self, talk_title: str, content: dict):
-        """카카오톡 메시지 전송"""
+        """카카오톡 메시지 전송
+
+        429·접속 실패 재시도와 장애 시 차단은 공용 HTTP 클라이언트가 처리하고,
+        여기서는 토큰 만료(401)일 때만 토큰을 갱신해 한 번 더 보냅니다. (5xx는 중복 전송을 막기 위해 재전송하지 않음)
+        """
         logger.info(f"[카카오 API] 메시지 전송 시작 - 제목: {talk_title}")
-        
-        try_tokens = {}
-        try_cnt = 0
-        try_tokens_exits = 0
-        
-        while True:
-            # Access 토큰 설정
-            if try_tokens_exits == 0:
-                tokens = self.kakao_tokens
-            else:
-                tokens = try_tokens
-                
-            access_token = tokens.get('access_token')
-            content_lst = []
-            button_lst = []
 
-            # 메시지 내용 구성
-            for title, msg in content.items():
-                content_lst.append({
-                    'title': f'{title}',
-                    'description': f'{msg}',
-                    'image_url': '',
-                    'image_width': 40,
-                    'image_height': 40,
-                    'link': {
-                        'web_url': '',
-                        'mobile_web_url': ''
-                    }
-                })
-                button_lst.append({
-                    'title': '',
-                    'link': {
-                        'web_url': '',
-                        'mobile_web_url': ''
-                    }
-                })
-
-            list_data = {
-                'object_type': 'list',
-                'header_title': f'{talk_title}',
-                'header_link': {
+        content_lst = []
+        button_lst = []
+
+        # 메시지 내용 구성
+        for title, msg in content.items():
+            content_lst.append({
+                'title': f'{title}',
+                'description': f'{msg}',
+                'image_url': '',
+                'image_width': 40,
+                'image_height': 40,
+                'link': {
                     'web_url': '',
-                    'mobile_web_url': '',
-                    'android_execution_params': 'main',
-                    'ios_execution_params': 'main'
-                },
-                'contents': content_lst,
-                'buttons': button_lst
-            }
+                    'mobile_web_url': ''
+                }
+            })
+            button_lst.append({
+                'title': '',
+                'link': {
+                    'web_url': '',
+                    'mobile_web_url': ''
+                }
+            })
 
-            # 메시지 전송
-            send_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+        list_data = {
+            'object_type': 'list',
+            'header_title': f'{talk_title}',
+            'header_link': {
+                'web_url': '',
+                'mobile_web_url': '',
+                'android_execution_params': 'main',
+                'ios_execution_params': 'main'
+            },
+            'contents': content_lst,
+            'buttons': button_lst
+        }
+
+        # 메시지 전송
+        send_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+        data = {'template_object': json.dumps(list_data)}
+        tokens = self.kakao_tokens
+
+        for try_cnt in range(1, 3):
             headers = {
-                "Authorization": f'Bearer {access_token}'
+                "Authorization": f"Bearer {tokens.get('access_token')}"
             }
-            data = {'template_object': json.dumps(list_data)}
-            response = requests.post(send_url, headers=headers, data=data)
-            
+            response = http_client.post(send_url, headers=headers, data=data)
             logger.info(f'[카카오 API] 시도 횟수: {try_cnt}, 응답 상태: {response.status_code}')
-            try_cnt += 1
-
-            if response.status_code == 200:  # 성공
-                logger.info('[카카오 API] 메시지 전송 성공')
-                return response.status_code, self.kakao_tokens
-            elif response.status_code == 400:  # Bad Request
-                logger.warning('[카카오 API] 잘못된 요청')
-                return response.status_code, self.kakao_tokens
-            elif response.status_code == 401 and try_cnt <= 2:  # 토큰 만료
+
+            if response.status_code == 401 and try_cnt == 1:  # 토큰 만료
                 logger.info('[카카오 API] 토큰 갱신 중...')
-                try_tokens = self._refresh_token_to_variable()
-                try_tokens_exits = 1
-            elif response.status_code != 200 and try_cnt >= 3:  # 3회 시도 실패
-                logger.error(f'[카카오 API] 메시지 전송 실패 - 상태코드: {response.status_code}')
-                return response.status_code, self.kakao_tokens
-        
+                tokens = self._refresh_token_to_variable()
+                continue
+            break
+
+        if response.status_code == 200:  # 성공
+            logger.info('[카카오 API] 메시지 전송 성공')
+        elif response.status_code == 400:  # Bad Request
+            logger.warning('[카카오 API] 잘못된 요청')
+        else:
+            logger.error(f'[카카오 API] 메시지 전송 실패 - 상태코드: {response.status_code}')
         return response.status_code, self.kakao_tokens
 
     def save_to_db(self, tokens):
@@ -1,13 +1,12 @@
 import json
-import requests
 import pandas as pd
 import time
 import logging
-from urllib.request import urlopen
 from datetime import date, timedelta
 from app.db import SessionLocal
 from app.models import KmaForecast
 from app.config import settings
+from app.common import http_client
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -52,9 +51,9 @@ class KmaPublicDataCrawler:
             logger.info(f"[기상청공공데이터] API 호출: {api_url}")
             
             # API 호출
-            with urlopen(api_url) as response:
-                html_bytes = response.read()
-                html = html_bytes.decode('utf-8')
+            response = http_client.get(api_url)
+            response.raise_for_status()
+            html = response.content.decode('utf-8')
             
             # JSON 파싱
             json_object = json.loads(html)
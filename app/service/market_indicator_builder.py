@@ -0,0 +1,149 @@
+from app.db import SessionLocal
+from app.models import MarketTop, NaverFinance, MarketIndicator
+from app.common.df_loader import replace_partition
+from datetime import datetime, timedelta
+from sqlalchemy import select
+import numpy as np
+import pandas as pd
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 60일 이동평균 + 전일 대비 등락률 계산에 필요한 거래일(약 61일)을 포함하는 달력일 수
+HISTORY_DAYS = 130
+MA_WINDOWS = (5, 20, 60)
+STAT_WINDOW = 20
+
+INDICATOR_COLS = ['close_price', 'change_rate', 'ma5', 'ma20', 'ma60', 'volatility20', 'volume_zscore20']
+
+
+def compute_indicators(df):
+    """code별 거래일 시계열(code, trade_dt, close_price, volume[, pre_price])에 지표 컬럼 추가
+
+    모든 계산은 groupby + rolling 벡터 연산으로 처리하며, 윈도우가 다 차지 않은 구간은 NULL입니다.
+    """
+    df = df.sort_values(['code', 'trade_dt']).reset_index(drop=True)
+    close = df.groupby('code', sort=False)['close_price']
+
+    change = close.pct_change(fill_method=None) * 100
+    if 'pre_price' in df.columns:
+        # 전일가가 함께 수집된 경우(네이버 금융) 첫 거래일도 등락률 계산 가능
+        pre = df['pre_price'].replace(0, np.nan)
+        change = change.fillna((df['close_price'] - pre) / pre * 100)
+    df['change_rate'] = change
+
+    for window in MA_WINDOWS:
+        df[f'ma{window}'] = close.transform(lambda s: s.rolling(window, min_periods=window).mean())
+
+    df['volatility20'] = df.groupby('code', sort=False)['change_rate'].transform(
+        lambda s: s.rolling(STAT_WINDOW, min_periods=STAT_WINDOW).std()
+    )
+
+    volume = df.groupby('code', sort=False)['volume']
+    mean = volume.transform(lambda s: s.rolling(STAT_WINDOW, min_periods=STAT_WINDOW).mean())
+    std = volume.transform(lambda s: s.rolling(STAT_WINDOW, min_periods=STAT_WINDOW).std())
+    df['volume_zscore20'] = (df['volume'] - mean) / std.replace(0, np.nan)
+
+    df[INDICATOR_COLS] = df[INDICATOR_COLS].replace([np.inf, -np.inf], np.nan).round(4)
+    return df
+
+
+class MarketIndicatorBuilder:
+    """dbms_market_stock / dbms_naver_finance 적재 후 기술적 지표를 계산하여 dbms_market_indicator에 저장"""
+
+    def history_start(self, strd_dt):
+        start = datetime.strptime(strd_dt, '%Y%m%d').date() - timedelta(days=HISTORY_DAYS)
+        return start.strftime('%Y%m%d')
+
+    def load_market_series(self, strd_dt):
+        """dbms_market_stock → (code, name, strd_dt, trade_dt, close_price, volume)
+
+        strd_dt는 수집일, stock_day가 실제 거래일이므로 같은 거래일이 여러 번 수집된 경우 최신 수집분만 사용합니다.
+        """
+        session = SessionLocal()
+        try:
+            rows = session.execute(
+                select(MarketTop.market, MarketTop.strd_dt, MarketTop.stock_day,
+                       MarketTop.closing_price, MarketTop.volume)
+                .where(MarketTop.strd_dt >= self.history_start(strd_dt), MarketTop.strd_dt <= strd_dt)
+            ).all()
+        finally:
+            session.close()
+
+        df = pd.DataFrame(rows, columns=['code', 'strd_dt', 'stock_day', 'close_price', 'volume'])
+        df['name'] = df['code']
+        df['trade_dt'] = df['stock_day'].astype(str).str[:10].str.replace('-', '', regex=False)
+        df = df.sort_values('strd_dt')
+        # 지표는 거래일 기준으로 계산 후 수집일(strd_dt)에 다시 매핑
+        series = df.drop_duplicates(['code', 'trade_dt'], keep='last')
+        return df[['code', 'strd_dt', 'trade_dt']], series
+
+    def load_stock_series(self, strd_dt):
+        """dbms_naver_finance → (code, name, strd_dt, trade_dt, close_price, volume, pre_price)"""
+        session = SessionLocal()
+        try:
+            rows = session.execute(
+                select(NaverFinance.stock_cd, NaverFinance.stock_nm, NaverFinance.strd_dt,
+                       NaverFinance.today_price, NaverFinance.trading_volume, NaverFinance.pre_price,
+                       NaverFinance.ins_dt)
+                .where(NaverFinance.strd_dt >= self.history_start(strd_dt), NaverFinance.strd_dt <= strd_dt)
+            ).all()
+        finally:
+            session.close()
+
+        df = pd.DataFrame(rows, columns=['code', 'name', 'strd_dt', 'close_price', 'volume', 'pre_price', 'ins_dt'])
+        df['trade_dt'] = df['strd_dt']
+        series = df.sort_values('ins_dt').drop_duplicates(['code', 'trade_dt'], keep='last').drop(columns='ins_dt')
+        return df[['code', 'strd_dt', 'trade_dt']].drop_duplicates(), series
+
+    def build(self, source, strd_dt):
+        """source('market' | 'stock')의 strd_dt 수집분에 대한 지표를 계산하여 교체 저장"""
+        loader = self.load_market_series if source == 'market' else self.load_stock_series
+        collected, series = loader(strd_dt)
+        if series.empty:
+            logger.info(f"[지표 계산] {source} {strd_dt}: 원본 데이터 없음")
+            return 0
+
+        series = series.astype({'close_price': 'float64', 'volume': 'float64'})
+        if 'pre_price' in series.columns:
+            series['pre_price'] = series['pre_price'].astype('float64')
+        indicators = compute_indicators(series)
+
+        target = collected[collected['strd_dt'] == strd_dt]
+        result = target.merge(
+            indicators[['code', 'name', 'trade_dt'] + INDICATOR_COLS], on=['code', 'trade_dt'], how='inner'
+        )
+        result['source'] = source
+        result['ins_dt'] = time.strftime('%Y%m%d%H%M%S')
+        count = replace_partition(result, MarketIndicator, key_col='strd_dt', scope={'source': source})
+        logger.info(f"[지표 계산] {source} {strd_dt}: {count}건 저장")
+        return count
+
+    def build_after_save(self, source, strd_dt):
+        """적재 직후 호출용 - 지표 계산 실패가 원본 적재를 실패시키지 않도록 로그만 남김"""
+        try:
+            return self.build(source, strd_dt)
+        except Exception as e:
+            logger.error(f"[지표 계산] {source} {strd_dt} 계산 실패: {e}")
+            return 0
+
+    def query(self, source, code=None, start_dt=None, end_dt=None):
+        """저장된 지표 조회"""
+        session = SessionLocal()
+        try:
+            q = session.query(MarketIndicator).filter(MarketIndicator.source == source)
+            if code:
+                q = q.filter(MarketIndicator.code == code)
+            if start_dt:
+                q = q.filter(MarketIndicator.strd_dt >= start_dt)
+            if end_dt:
+                q = q.filter(MarketIndicator.strd_dt <= end_dt)
+            rows = q.order_by(MarketIndicator.strd_dt.desc(), MarketIndicator.code).all()
+            return [
+                dict(strd_dt=r.strd_dt, trade_dt=r.trade_dt, code=r.code, name=r.name,
+                     **{col: getattr(r, col) for col in INDICATOR_COLS})
+                for r in rows
+            ]
+        finally:
+            session.close()
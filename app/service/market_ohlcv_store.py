@@ -0,0 +1,145 @@
+from app.db import SessionLocal
+from app.models import MarketOhlcv
+from app.config import settings
+from app.common.upsert import insert_if_unseen
+from app.common.trading_calendar import last_completed_trading_day
+from app.common.rate_governor import governor
+from app.common import resilience
+from app.service.finance_data_reader_parser import parse_market_symbols, retryable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+import pandas as pd
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['opening_price', 'high_price', 'low_price', 'closing_price', 'volume']
+
+
+class MarketOhlcvStore:
+    """FinanceDataReader 일봉을 로컬 테이블(dbms_market_ohlcv)에 누적하고 기간 조회를 제공"""
+
+    def __init__(self, symbols=None, history_start="20150101", max_workers=None):
+        self.symbols = symbols or parse_market_symbols(settings.MARKET_SYMBOLS)
+        self.history_start = history_start
+        self.max_workers = max_workers or settings.MARKET_FETCH_WORKERS
+
+    def latest_trade_dates(self):
+        """심볼별 저장된 마지막 거래일 {symbol: 'YYYYMMDD'}"""
+        session = SessionLocal()
+        try:
+            rows = session.execute(
+                select(MarketOhlcv.symbol, func.max(MarketOhlcv.trade_dt)).group_by(MarketOhlcv.symbol)
+            ).all()
+            return {symbol: trade_dt for symbol, trade_dt in rows}
+        finally:
+            session.close()
+
+    def missing_range(self, spec, latest, now=None):
+        """저장되지 않은 구간 (start, end) - 최신이면 None
+
+        저장한 일봉은 다시 갱신하지 않으므로(DO NOTHING) 장중 값이 저장되지 않도록 장 마감이 끝난 거래일까지만 조회합니다.
+        """
+        end = last_completed_trading_day(spec['exchange'], now)
+        if latest:
+            start = datetime.strptime(latest, '%Y%m%d').date() + timedelta(days=1)
+        else:
+            start = datetime.strptime(self.history_start, '%Y%m%d').date()
+        if start > end:
+            return None
+        return start, end
+
+    def fetch(self, fdr, spec, start, end):
+        """누락 구간 전체를 한 번의 DataReader 호출로 조회 (접속 오류만 백오프 후 재시도)"""
+        def read():
+            with governor.limit("finance-data-reader"):
+                return fdr.DataReader(spec['symbol'], start.strftime('%Y%m%d'), end.strftime('%Y%m%d'))
+
+        df = resilience.call("finance-data-reader", read, retryable=retryable)
+        if df is None or df.empty:
+            return []
+
+        df = df.sort_index()
+        ins_dt = time.strftime('%Y%m%d%H%M%S')
+        frame = pd.DataFrame({
+            'symbol': spec['symbol'],
+            'market': spec['market'],
+            'trade_dt': pd.to_datetime(df.index).strftime('%Y%m%d'),
+        })
+        for col, src in zip(OHLCV_COLUMNS, ['Open', 'High', 'Low', 'Close', 'Volume']):
+            values = df[src].to_numpy() if src in df.columns else None
+            frame[col] = values
+        frame['volume'] = frame['volume'].fillna(0).astype('int64')
+        frame['ins_dt'] = ins_dt
+        frame = frame.astype(object).where(frame.notna(), None)
+        return frame.to_dict('records')
+
+    def load_missing(self, now=None):
+        """심볼별 누락 거래일만 조회하여 적재 (이미 최신인 심볼은 네트워크 호출 없음)"""
+        import FinanceDataReader as fdr
+
+        latest = self.latest_trade_dates()
+        jobs = []
+        for spec in self.symbols:
+            missing = self.missing_range(spec, latest.get(spec['symbol']), now)
+            if missing:
+                jobs.append((spec, *missing))
+            else:
+                logger.info(f"[시세 저장소] {spec['market']}({spec['symbol']}) 최신 상태 - 조회 생략")
+
+        def fetch_job(job):
+            spec, start, end = job
+            try:
+                rows = self.fetch(fdr, spec, start, end)
+                logger.info(f"[시세 저장소] {spec['market']}({spec['symbol']}) {start}~{end}: {len(rows)}건 조회")
+                return rows
+            except Exception as e:
+                logger.error(f"[시세 저장소] {spec['market']}({spec['symbol']}) 조회 실패: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(fetch_job, jobs))
+
+        rows = [row for result in results for row in result]
+        session = SessionLocal()
+        try:
+            inserted = insert_if_unseen(session, MarketOhlcv, rows, ['symbol', 'trade_dt'])
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[시세 저장소] 데이터베이스 저장 오류: {e}")
+            raise e
+        finally:
+            session.close()
+
+        return {"symbols": len(self.symbols), "fetched_symbols": len(jobs), "inserted": inserted}
+
+    def resolve_symbol(self, key):
+        """market 표시명(KOSPI 등)도 심볼로 변환"""
+        for spec in self.symbols:
+            if key in (spec['symbol'], spec['market']):
+                return spec['symbol']
+        return key
+
+    def query(self, symbol, start_dt=None, end_dt=None):
+        """심볼의 기간 시계열을 차트용 컬럼 배열로 반환 ((symbol, trade_dt) 인덱스 범위 스캔)"""
+        symbol = self.resolve_symbol(symbol)
+        session = SessionLocal()
+        try:
+            stmt = select(
+                MarketOhlcv.trade_dt, *[getattr(MarketOhlcv, col) for col in OHLCV_COLUMNS]
+            ).where(MarketOhlcv.symbol == symbol)
+            if start_dt:
+                stmt = stmt.where(MarketOhlcv.trade_dt >= start_dt)
+            if end_dt:
+                stmt = stmt.where(MarketOhlcv.trade_dt <= end_dt)
+            rows = session.execute(stmt.order_by(MarketOhlcv.trade_dt)).all()
+        finally:
+            session.close()
+
+        columns = list(zip(*rows)) if rows else [[] for _ in range(len(OHLCV_COLUMNS) + 1)]
+        series = {"symbol": symbol, "count": len(rows), "dates": list(columns[0])}
+        series.update({col: list(values) for col, values in zip(OHLCV_COLUMNS, columns[1:])})
+        return series
@@ -0,0 +1,182 @@
+import base64
+import orjson
+import logging
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.types import TypeDecorator
+from app.db import read_engine
+from app.registry import output_columns, order_columns
+from app.common.json_response import dumps
+
+logger = logging.getLogger(__name__)
+
+# 등록 모델(app.registry) 공통 조회: 날짜/일치 조건 필터, 정렬, offset 또는 keyset(cursor) 페이징, 스트리밍
+# 응답 컬럼만 SELECT 하고(ORM 객체 생성 없음) 행 튜플을 그대로 JSON으로 직렬화합니다.
+
+STREAM_CHUNK_SIZE = 5000
+
+
+def date_range(start_date, end_date):
+    """start_date/end_date(YYYY-MM-DD) → (start_dt, end_dt) YYYYMMDD
+
+    시작일만 있으면 해당 일자 하루, 종료일만 있으면 필터 없음
+    """
+    if not start_date:
+        return None, None
+    start_dt = start_date.replace('-', '')[:8]
+    end_dt = end_date.replace('-', '')[:8] if end_date else start_dt
+    return start_dt, end_dt
+
+
+def apply_filters(stmt, spec, start_dt=None, end_dt=None, filters=None):
+    """날짜 범위(date_column)와 dimensions 컬럼 일치 조건 추가 (허용 목록에 없는 키는 무시)"""
+    model = spec["model"]
+    if spec["date_column"] and start_dt:
+        column = getattr(model, spec["date_column"])
+        if start_dt == end_dt:
+            stmt = stmt.where(column == start_dt)
+        else:
+            stmt = stmt.where(column >= start_dt, column <= end_dt)
+    for name, value in (filters or {}).items():
+        if name in spec["dimensions"] and value is not None:
+            stmt = stmt.where(getattr(model, name) == value)
+    return stmt
+
+
+def order_clause(spec, dialect):
+    # keyset 조건은 NULL을 가장 작은 값으로 보므로 PostgreSQL(DESC 시 NULL 우선)도 NULL을 마지막으로 맞춤
+    if dialect == "postgresql":
+        return [c.desc().nulls_last() for c in order_columns(spec)]
+    return [c.desc() for c in order_columns(spec)]
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(dumps(list(values))).decode().rstrip("=")
+
+
+def _cursor_value_ok(column, value):
+    """커서 값이 정렬 컬럼에 바인딩할 수 있는 타입인지 (문자열 변환 타입은 실제 변환으로 확인)"""
+    if value is None:
+        return True
+    column_type = column.type
+    if isinstance(column_type, TypeDecorator):
+        try:
+            return column_type.process_bind_param(value, None) is not None
+        except (TypeError, ValueError, ArithmeticError):
+            return False
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        return True
+    if isinstance(value, bool):
+        return python_type is bool
+    if python_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, python_type)
+
+
+def decode_cursor(cursor, columns):
+    """encode_cursor 값 → 정렬 컬럼(columns)별 값 목록 (형식이나 값 타입이 맞지 않으면 ValueError)"""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError(f"잘못된 cursor: {cursor}") from e
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError(f"잘못된 cursor: {cursor}")
+    for column, value in zip(columns, values):
+        if not _cursor_value_ok(column, value):
+            raise ValueError(f"잘못된 cursor: {cursor} ({column.key} 값 {value!r})")
+    return values
+
+
+def keyset_condition(columns, values):
+    """(c1, c2, ..., id) 내림차순에서 커서 행 다음 행들의 조건 (NULL은 가장 작은 값)"""
+    column, value = columns[0], values[0]
+    if len(columns) == 1:
+        return column < value
+    rest = keyset_condition(columns[1:], values[1:])
+    if value is None:
+        return and_(column.is_(None), rest)
+    return or_(column < value, column.is_(None), and_(column == value, rest))
+
+
+def _select(spec):
+    """응답 컬럼 + (응답에 없는) 정렬 컬럼 SELECT 문, 정렬 컬럼의 결과 위치"""
+    columns = output_columns(spec)
+    keys = order_columns(spec)
+    names = [c.key for c in columns]
+    extra = [k for k in keys if k.key not in names]
+    positions = [names.index(k.key) if k.key in names else len(columns) + extra.index(k) for k in keys]
+    return select(*columns, *extra), columns, positions
+
+
+def build_list(spec, limit, offset=0, start_dt=None, end_dt=None, filters=None, cursor=None, dialect=None):
+    """페이징 목록 SELECT 문 → (건수 SELECT, 목록 SELECT, 응답 컬럼, 정렬 컬럼 위치, offset)
+
+    cursor가 있으면 OFFSET 대신 직전 페이지 마지막 행의 정렬 키 이후부터 조회 (깊은 페이지도 인덱스 범위 탐색)
+    """
+    stmt, columns, positions = _select(spec)
+    stmt = apply_filters(stmt, spec, start_dt, end_dt, filters)
+    count_stmt = apply_filters(select(func.count()).select_from(spec["model"]), spec, start_dt, end_dt, filters)
+    if cursor:
+        values = decode_cursor(cursor, order_columns(spec))
+        stmt = stmt.where(keyset_condition(order_columns(spec), values))
+        offset = 0
+    stmt = stmt.order_by(*order_clause(spec, dialect)).limit(limit).offset(offset)
+    return count_stmt, stmt, columns, positions, offset
+
+
+def page_meta(rows, positions, total, limit, offset):
+    next_cursor = encode_cursor(rows[-1][p] for p in positions) if len(rows) == limit else None
+    return {"total": total, "limit": limit, "offset": offset, "next_cursor": next_cursor}
+
+
+def list_page(db, spec, limit, offset=0, start_dt=None, end_dt=None, filters=None, cursor=None):
+    """페이징 목록 조회 → (행, 응답 컬럼, meta)"""
+    count_stmt, stmt, columns, positions, offset = build_list(
+        spec, limit, offset, start_dt, end_dt, filters, cursor, db.get_bind().dialect.name
+    )
+    total = db.execute(count_stmt).scalar()
+    rows = db.execute(stmt).all()
+    return rows, columns, page_meta(rows, positions, total, limit, offset)
+
+
+async def list_page_async(db, spec, limit, offset=0, start_dt=None, end_dt=None, filters=None, cursor=None):
+    """list_page의 AsyncSession 버전"""
+    count_stmt, stmt, columns, positions, offset = build_list(
+        spec, limit, offset, start_dt, end_dt, filters, cursor, db.get_bind().dialect.name
+    )
+    total = (await db.execute(count_stmt)).scalar()
+    rows = (await db.execute(stmt)).all()
+    return rows, columns, page_meta(rows, positions, total, limit, offset)
+
+
+def build_all(spec, dialect=None):
+    stmt, columns, _ = _select(spec)
+    return stmt.order_by(*order_clause(spec, dialect)), columns
+
+
+def all_rows(db, spec):
+    """전체 조회 → (행, 응답 컬럼)"""
+    stmt, columns = build_all(spec, db.get_bind().dialect.name)
+    return db.execute(stmt).all(), columns
+
+
+async def all_rows_async(db, spec):
+    """all_rows의 AsyncSession 버전"""
+    stmt, columns = build_all(spec, db.get_bind().dialect.name)
+    return (await db.execute(stmt)).all(), columns
+
+
+def iter_ndjson(spec, start_dt=None, end_dt=None, filters=None, chunk_size=STREAM_CHUNK_SIZE):
+    """서버 측 커서로 chunk_size 행씩 읽어 JSON Lines(한 줄에 한 행) 바이트 생성"""
+    stmt, columns, _ = _select(spec)
+    stmt = apply_filters(stmt, spec, start_dt, end_dt, filters)
+    keys = [c.key for c in columns]
+    total = 0
+    with read_engine().connect() as conn:
+        stmt = stmt.order_by(*order_clause(spec, conn.dialect.name))
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        for rows in result.partitions(chunk_size):
+            total += len(rows)
+            yield b"".join(dumps(dict(zip(keys, row))) + b"\n" for row in rows)
+    logger.info(f"[스트림] {spec['model'].__tablename__} {total}건 (기간 {start_dt}~{end_dt})")
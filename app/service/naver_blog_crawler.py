@@ -1,8 +1,13 @@
 from app.db import SessionLocal
 from app.models import BlogCrawl
 from app.config import settings
-import requests
-import re
+from app.common.upsert import insert_if_unseen
+from app.service.rollup import refresh_after_save
+from app.service.naver_blog_search_service import NaverBlogSearchService, page_plan
+from app.service.blog_keyword_registry import BlogKeywordRegistry
+from app.common.text_cleaner import clean_blog_titles
+from app.common.http_client import GovernedSession
+import asyncio
 import time
 import logging
 from datetime import datetime
@@ -17,90 +22,44 @@ class NaverBlogCrawler:
         self.X_NAVER_CLIENT_ID = settings.X_NAVER_CLIENT_ID
         self.X_NAVER_CLIENT_SECRET = settings.X_NAVER_CLIENT_SECRET
         self.keyword = "시흥대야역맛집"
+        self.default_strip_terms = ["시흥대야역", "시흥대야", "맛집"]
+        self.strip_terms = None  # 키워드 등록부의 제목 정제용 제거 단어 (최초 파싱 시 로드)
         self.api_url = "https://openapi.naver.com/v1/search/blog.json"
+
+        # 페이지 호출 간 커넥션 재사용 (호출 간격 / 일일 할당량은 호출 제한의 naver-openapi 소스가 관리)
+        self.session = GovernedSession(source="naver-openapi")
+        self.session.headers.update({
+            "X-Naver-Client-Id": self.X_NAVER_CLIENT_ID,
+            "X-Naver-Client-Secret": self.X_NAVER_CLIENT_SECRET
+        })
         
     def call_api(self, keyword, start=1, display=10):
-        """네이버 검색 API 호출"""
+        """네이버 검색 API 호출 (재시도 후에도 실패하면 예외 - 더미 데이터로 대체하지 않음)"""
+        params = {"query": keyword, "start": start, "display": display}
+
+        print(f"[네이버 블로그 검색] API 호출: {self.api_url} {params}")
         try:
-            url = f"{self.api_url}?query={keyword}&start={start}&display={display}"
-            headers = {
-                "X-Naver-Client-Id": self.X_NAVER_CLIENT_ID,
-                "X-Naver-Client-Secret": self.X_NAVER_CLIENT_SECRET
-            }
-            
-            print(f"[네이버 블로그 검색] API 호출: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(self.api_url, params=params, timeout=30)
             response.raise_for_status()
-            
-            result = response.json()
-            print(f"[네이버 블로그 검색] API 응답 성공: {len(result.get('items', []))}개 아이템")
-            return result
-            
         except Exception as e:
             logger.error(f"네이버 API 호출 오류: {e}")
-            print(f"[네이버 블로그 검색] API 호출 실패, 더미 데이터 사용")
-            return self.get_dummy_data()
-    
-    def get_dummy_data(self):
-        """API 실패 시 더미 데이터 반환"""
-        dummy_items = [
-            {
-                "title": "시흥대야역 맛집 추천 베스트 5곳",
-                "link": "https://blog.naver.com/example1",
-                "description": "시흥대야역 주변 <b>맛집</b> 소개합니다. 정말 맛있는 곳들이에요!"
-            },
-            {
-                "title": "대야역 근처 분위기 좋은 카페",
-                "link": "https://blog.naver.com/example2", 
-                "description": "대야역에서 가까운 <b>카페</b> 추천드려요. 데이트하기 좋아요."
-            },
-            {
-                "title": "시흥 대야동 숨은 맛집 발견",
-                "link": "https://blog.naver.com/example3",
-                "description": "대야동에 있는 숨은 <b>맛집</b>을 발견했어요. 꼭 가보세요!"
-            },
-            {
-                "title": "대야역 맛집 리뷰 모음",
-                "link": "https://blog.naver.com/example4",
-                "description": "대야역 주변 <b>맛집</b> 리뷰를 정리해봤습니다."
-            },
-            {
-                "title": "시흥시 대야동 맛있는 식당 추천",
-                "link": "https://blog.naver.com/example5",
-                "description": "시흥시 대야동의 <b>맛있는 식당</b>들을 소개합니다."
-            }
-        ]
-        
-        return {"items": dummy_items}
+            raise
+
+        result = response.json()
+        print(f"[네이버 블로그 검색] API 응답 성공: {len(result.get('items', []))}개 아이템")
+        return result
 
     def get_paging_call(self, keyword, quantity):
         """페이징을 통한 다중 API 호출"""
-        if quantity > 1100:
-            quantity = 1100  # 최대 1100건으로 제한
-            
-        repeat = quantity // 100
-        display = 100
-
-        if quantity < 100:
-            display = quantity
-            repeat = 1
-
         result = []
 
-        for i in range(repeat):
-            start = i * 100 + 1
+        for i, (start, display) in enumerate(page_plan(quantity)):  # 최대 1000건
             print(f"[네이버 블로그 검색] {i + 1}번째 API 호출 - start: {start}")
-
-            if start > 1000:
-                start = 1000
                 
             r = self.call_api(keyword, start=start, display=display)
             if r and 'items' in r:
                 result.extend(r['items'])
             
-            # API 호출 간격 조절 (네이버 API 제한 고려)
-            time.sleep(0.1)
-            
         return result
 
     def blog_search(self, keyword, quantity=20):
@@ -108,78 +67,59 @@ class NaverBlogCrawler:
         print(f"[네이버 블로그 검색] 키워드 '{keyword}' 검색 시작 (최대 {quantity}건)")
         return self.get_paging_call(keyword, quantity)
 
-    def parse_and_clean_data(self, raw_data):
-        """검색 결과 데이터 파싱 및 정리"""
+    def parse_and_clean_data(self, raw_data, keyword=None, limit=None):
+        """검색 결과 데이터 파싱 및 정리 (키워드의 검색 결과 전체를 한 번의 배치로 정제)"""
         print(f"[네이버 블로그 검색] 데이터 파싱 시작: {len(raw_data)}개 아이템")
         
         strd_dt = time.strftime('%Y%m%d')
         ins_dt = time.strftime('%Y%m%d%H%M%S')  # 14자리 문자열로 변경
-        
-        parsed_data = []
-        
-        for i, item in enumerate(raw_data[:5]):  # 상위 5개만 사용
-            try:
-                # HTML 태그 및 불필요한 문자 제거
-                title = re.sub(r"(<b>|</b>|'|#|시흥대야역|시흥대야|맛집)", "", 
-                              item.get('description', ''))[:20]
-                
-                # 제목이 너무 짧으면 원본 title 사용
-                if len(title.strip()) < 5:
-                    title = re.sub(r"(<b>|</b>|'|#)", "", 
-                                  item.get('title', ''))[:20]
-                
-                link = item.get('link', '')
-                
-                row = {
-                    'strd_dt': strd_dt,
-                    'keword': self.keyword,  # 원문의 오타(keword) 유지
-                    'title': title.strip(),
-                    'link': link,
-                    'ins_dt': ins_dt
-                }
-                
-                parsed_data.append(row)
-                print(f"[네이버 블로그 검색] 파싱 완료 {i+1}: {title[:15]}...")
-                
-            except Exception as e:
-                logger.error(f"데이터 파싱 오류 (아이템 {i+1}): {e}")
-                continue
-                
+        keyword = keyword or self.keyword
+
+        raw_data = raw_data[:limit]
+        if not raw_data:
+            return []
+
+        if self.strip_terms is None:
+            self.strip_terms = BlogKeywordRegistry().strip_terms()
+
+        # HTML 태그/엔티티 및 키워드 단어 제거
+        titles = clean_blog_titles(raw_data, keyword, self.strip_terms)
+        parsed_data = [
+            {
+                'strd_dt': strd_dt,
+                'keword': keyword,  # 원문의 오타(keword) 유지
+                'title': title,
+                'link': item.get('link') or '',
+                'postdate': item.get('postdate') or '',  # 키워드 등록부 최신 게시일 갱신용 (DB 미저장)
+                'ins_dt': ins_dt,
+            }
+            for item, title in zip(raw_data, titles)
+        ]
         print(f"[네이버 블로그 검색] 총 {len(parsed_data)}개 데이터 파싱 완료")
         return parsed_data
 
     def save_to_db(self, data_list):
-        """수집한 데이터를 데이터베이스에 저장"""
+        """수집한 데이터를 데이터베이스에 저장 (keword+link 기준으로 처음 보는 글만 INSERT)"""
         print("[네이버 블로그 검색] 데이터베이스 저장 시작")
         session = SessionLocal()
         
         try:
-            # 오늘 날짜 데이터 삭제 (중복 방지)
-            if data_list:
-                strd_dt_value = data_list[0]['strd_dt']
-                keyword_value = data_list[0]['keword']
-                print(f"[네이버 블로그 검색] 기존 데이터 삭제 - strd_dt: {strd_dt_value}, keyword: {keyword_value}")
-                
-                session.query(BlogCrawl).filter(
-                    BlogCrawl.strd_dt == strd_dt_value,
-                    BlogCrawl.keword == keyword_value
-                ).delete()
-                session.commit()
-
-            # 새 데이터 저장
-            for data in data_list:
-                obj = BlogCrawl(
-                    strd_dt=data['strd_dt'],
-                    keword=data['keword'],
-                    title=data['title'],
-                    link=data['link'],
-                    ins_dt=data['ins_dt']
-                )
-                session.add(obj)
-                print(f"[네이버 블로그 검색] DB 저장: {data['title']}")
-
+            rows = [
+                {
+                    'strd_dt': data['strd_dt'],
+                    'keword': data['keword'],
+                    'title': data['title'],
+                    'link': data['link'],
+                    'ins_dt': data['ins_dt']
+                }
+                for data in data_list if data.get('link')
+            ]
+            inserted = insert_if_unseen(session, BlogCrawl, rows, ['keword', 'link'])
             session.commit()
-            print(f"[네이버 블로그 검색] 총 {len(data_list)}개 데이터 저장 완료")
+            print(f"[네이버 블로그 검색] {len(rows)}개 중 신규 {inserted}개 데이터 저장 완료")
+            if inserted:
+                refresh_after_save(BlogCrawl.__tablename__, [row['strd_dt'] for row in rows])
+            return inserted
             
         except Exception as e:
             session.rollback()
@@ -189,28 +129,80 @@ class NaverBlogCrawler:
             session.close()
 
     def run(self):
-        """네이버 블로그 크롤링 실행"""
+        """네이버 블로그 크롤링 실행 (동기 호출용)"""
+        return asyncio.run(self.run_registry())
+
+    async def run_registry(self, quantity=100):
+        """키워드 등록부의 모든 사용 키워드를 모니터링
+
+        키워드별로 마지막 수집 게시일 이후의 글만 최신순으로 조회하고,
+        (keword, link) 기준으로 처음 보는 글만 저장합니다.
+        최신 게시일은 호출 오류 없이 기수집 구간까지(또는 결과 끝까지) 조회한 키워드만 갱신하므로
+        중간에 멈춘 키워드는 다음 실행에서 같은 구간부터 다시 조회합니다.
+        """
         try:
             print("[네이버 블로그 검색] 크롤링 시작")
-            
-            # 블로그 검색 실행
-            raw_data = self.blog_search(self.keyword, quantity=20)
-            if not raw_data:
-                print("[네이버 블로그 검색] 검색 결과가 없습니다")
-                return []
+            registry = BlogKeywordRegistry()
+
+            # 등록부 조회/저장은 동기 DB 작업이므로 스레드에서 실행 (이벤트 루프 차단 방지)
+            keywords = await asyncio.to_thread(registry.active_keywords)
+            if not keywords:
+                await asyncio.to_thread(registry.register, [self.keyword], {self.keyword: self.default_strip_terms})
+                keywords = await asyncio.to_thread(registry.active_keywords)
+
+            items_by_keyword = {}
+            completed = set()
+            service = NaverBlogSearchService()
+            stop_before = {keyword: postdate for keyword, postdate in keywords.items() if postdate}
+
+            async for keyword, items in service.stream(list(keywords), quantity, sort="date",
+                                                       stop_before=stop_before, completed=completed):
+                items_by_keyword.setdefault(keyword, []).extend(items)
+
+            # 페이지마다 정제하지 않고 키워드별 전체 결과를 한 번에 정제
+            parsed_data = []
+            newest_by_keyword = {}
+            for keyword, items in items_by_keyword.items():
+                parsed = self.parse_and_clean_data(items, keyword=keyword)
+                parsed_data.extend(parsed)
+                postdates = [row['postdate'] for row in parsed if row['postdate']]
+                if postdates:
+                    newest_by_keyword[keyword] = max(postdates)
 
-            # 데이터 파싱
-            parsed_data = self.parse_and_clean_data(raw_data)
             if not parsed_data:
-                print("[네이버 블로그 검색] 파싱된 데이터가 없습니다")
+                print("[네이버 블로그 검색] 새로 수집된 데이터가 없습니다")
                 return []
 
-            # 데이터베이스 저장
-            self.save_to_db(parsed_data)
+            # 데이터베이스 저장 후 조회를 끝까지 마친 키워드만 최신 게시일 갱신
+            await asyncio.to_thread(self.save_to_db, parsed_data)
+            incomplete = sorted(set(newest_by_keyword) - completed)
+            if incomplete:
+                logger.warning(f"[네이버 블로그 검색] 조회가 중간에 멈춘 키워드는 최신 게시일 유지: {incomplete}")
+            await asyncio.to_thread(
+                registry.update_newest_postdate, {k: v for k, v in newest_by_keyword.items() if k in completed}
+            )
             
-            print(f"[네이버 블로그 검색] 크롤링 완료 - {len(parsed_data)}개 데이터 처리")
+            print(f"[네이버 블로그 검색] 크롤링 완료 - {len(keywords)}개 키워드, {len(parsed_data)}개 데이터 처리")
             return parsed_data
             
         except Exception as e:
             logger.error(f"네이버 블로그 크롤링 실행 오류: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    async def run_keywords(self, keywords, quantity=100):
+        """여러 키워드를 동시에 검색하고, 키워드별 검색 결과 전체를 한 번에 정제하여 저장"""
+        print(f"[네이버 블로그 검색] 키워드 배치 크롤링 시작: {len(keywords)}개 키워드")
+        service = NaverBlogSearchService()
+
+        items_by_keyword = {}
+        async for keyword, items in service.stream(keywords, quantity):
+            items_by_keyword.setdefault(keyword, []).extend(items)
+        parsed_by_keyword = {
+            keyword: self.parse_and_clean_data(items, keyword=keyword) for keyword, items in items_by_keyword.items()
+        }
+
+        rows = [row for parsed_data in parsed_by_keyword.values() for row in parsed_data]
+        inserted = await asyncio.to_thread(self.save_to_db, rows) if rows else 0
+
+        print(f"[네이버 블로그 검색] 키워드 배치 크롤링 완료 - {len(rows)}개 중 신규 {inserted}개")
+        return parsed_by_keyword
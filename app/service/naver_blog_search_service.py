@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import httpx
+from app.config import settings
+from app.common.http_client import GovernedAsyncTransport
+
+logger = logging.getLogger(__name__)
+
+NAVER_BLOG_API_URL = "https://openapi.naver.com/v1/search/blog.json"
+MAX_DISPLAY = 100   # 네이버 검색 API display 최대값
+MAX_START = 1000    # 네이버 검색 API start 최대값
+
+_DONE = object()
+
+
+def page_plan(quantity):
+    """요청 건수를 (start, display) 페이지 목록으로 변환"""
+    quantity = max(0, min(quantity, MAX_START))
+    pages = []
+    start = 1
+    while start <= quantity:
+        display = min(MAX_DISPLAY, quantity - start + 1)
+        pages.append((start, display))
+        start += display
+    return pages
+
+
+class NaverBlogSearchService:
+    """여러 키워드/페이지를 하나의 커넥션 풀로 동시에 조회하는 네이버 블로그 검색 서비스
+
+    초당 호출 수 / 일일 할당량은 호출 제한(naver-openapi 소스)이 다른 크롤러의 네이버 API 호출과 함께 관리합니다.
+    """
+
+    def __init__(self, max_connections=None, timeout=10):
+        self.api_url = NAVER_BLOG_API_URL
+        self.headers = {
+            "X-Naver-Client-Id": settings.X_NAVER_CLIENT_ID,
+            "X-Naver-Client-Secret": settings.X_NAVER_CLIENT_SECRET
+        }
+        self.max_connections = max_connections or settings.NAVER_SEARCH_MAX_CONNECTIONS
+        self.timeout = timeout
+
+    def _client(self):
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections
+        )
+        transport = GovernedAsyncTransport(source="naver-openapi", limits=limits)
+        return httpx.AsyncClient(headers=self.headers, transport=transport, timeout=self.timeout)
+
+    async def fetch_page(self, client, keyword, start=1, display=MAX_DISPLAY, sort="sim"):
+        """검색 결과 한 페이지 조회 (query string은 httpx가 URL 인코딩)"""
+        params = {"query": keyword, "start": start, "display": display, "sort": sort}
+        response = await client.get(self.api_url, params=params)
+        response.raise_for_status()
+        return response.json().get("items", [])
+
+    async def _search_keyword(self, client, queue, keyword, quantity, sort):
+        """키워드 하나의 모든 페이지를 동시에 조회하여 완료되는 순서대로 큐에 전달 (모든 페이지 조회 성공 여부 반환)"""
+        async def fetch(start, display):
+            try:
+                items = await self.fetch_page(client, keyword, start, display, sort)
+                await queue.put((keyword, items))
+                return True
+            except Exception as e:
+                logger.error(f"[네이버 블로그 검색] '{keyword}' start={start} 호출 실패: {e}")
+                return False
+
+        try:
+            return all(await asyncio.gather(*(fetch(start, display) for start, display in page_plan(quantity))))
+        finally:
+            await queue.put(_DONE)
+
+    async def _search_keyword_until(self, client, queue, keyword, quantity, stop_before):
+        """최신순으로 페이지를 차례로 조회하다가 이미 수집한 게시일(stop_before)보다 오래된 글을 만나면 중단
+
+        기수집 구간(stop_before)에 도달했거나 검색 결과가 끝났으면 True,
+        호출 실패 또는 quantity 제한으로 중간에 멈췄으면 False를 반환합니다.
+        """
+        try:
+            for start, display in page_plan(quantity):
+                try:
+                    items = await self.fetch_page(client, keyword, start, display, sort="date")
+                except Exception as e:
+                    logger.error(f"[네이버 블로그 검색] '{keyword}' start={start} 호출 실패: {e}")
+                    return False
+
+                fresh = [item for item in items if item.get("postdate", "") >= stop_before]
+                if fresh:
+                    await queue.put((keyword, fresh))
+                if len(fresh) < len(items) or len(items) < display:
+                    logger.info(f"[네이버 블로그 검색] '{keyword}' start={start}에서 기수집 구간 도달, 페이징 중단")
+                    return True
+            logger.warning(f"[네이버 블로그 검색] '{keyword}' {quantity}건 제한으로 기수집 구간까지 조회하지 못함")
+            return False
+        finally:
+            await queue.put(_DONE)
+
+    async def stream(self, keywords, quantity=100, sort="sim", stop_before=None, completed=None):
+        """키워드 배치를 동시에 조회하며 (keyword, items) 페이지 단위로 결과를 흘려보냄
+
+        stop_before에 {keyword: 'YYYYMMDD'}를 주면 해당 키워드는 최신순으로 조회하며
+        그 날짜보다 오래된 게시글이 나오는 시점에 페이징을 멈춥니다.
+        completed에 set을 주면 호출 오류 없이 조회를 마친 키워드를 담습니다
+        (stop_before가 있는 키워드는 기수집 구간 도달 또는 결과 끝까지 조회한 경우만).
+        """
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            return
+        stop_before = stop_before or {}
+
+        queue = asyncio.Queue()
+
+        def search(keyword):
+            if stop_before.get(keyword):
+                return self._search_keyword_until(client, queue, keyword, quantity, stop_before[keyword])
+            return self._search_keyword(client, queue, keyword, quantity, sort)
+
+        async with self._client() as client:
+            tasks = [asyncio.create_task(search(keyword)) for keyword in keywords]
+            pending = len(tasks)
+            try:
+                while pending:
+                    item = await queue.get()
+                    if item is _DONE:
+                        pending -= 1
+                        continue
+                    yield item
+                if completed is not None:
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    completed.update(
+                        keyword for keyword, task in zip(keywords, tasks)
+                        if not task.cancelled() and task.exception() is None and task.result()
+                    )
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def search_batch(self, keywords, quantity=100, sort="sim"):
+        """키워드 배치 검색 결과를 {keyword: items} 형태로 반환"""
+        results = {keyword: [] for keyword in keywords}
+        async for keyword, items in self.stream(keywords, quantity, sort):
+            results[keyword].extend(items)
+        return results
+
+    def run_batch(self, keywords, quantity=100, sort="sim"):
+        """동기 코드에서 키워드 배치 검색 실행"""
+        return asyncio.run(self.search_batch(keywords, quantity, sort))
@@ -1,10 +1,12 @@
 from app.db import SessionLocal
 from app.models import NaverFinance
+from app.service.market_indicator_builder import MarketIndicatorBuilder
+from app.common.trading_calendar import is_trading_day, last_trading_day
 import time
-import requests
 import logging
+from app.common import http_client
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, date
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -23,7 +25,7 @@ class NaverFinanceCrawler:
         """네이버 금융에서 주식 데이터 크롤링"""
         url = f"https://finance.naver.com/item/main.naver?code={code}"
         try:
-            res = requests.get(url)
+            res = http_client.get(url)
             res.raise_for_status()
             bsobj = BeautifulSoup(res.text, "html.parser")
             return bsobj
@@ -91,8 +93,6 @@ class NaverFinanceCrawler:
                     logger.warning(f"[네이버 크롤링] {code} 파싱 실패")
             
                 logger.warning(f"[네이버 크롤링] {code} 크롤링 실패")
-            
-            time.sleep(0.5)  # 서버 부하 방지
 
         logger.info(f"[네이버 크롤링] 총 {len(results)}개 종목 데이터 수집 완료")
         return results
@@ -126,6 +126,9 @@ class NaverFinanceCrawler:
 
             session.commit()
             logger.info(f"[네이버 크롤링] 총 {len(data_list)}개 데이터 저장 완료")
+
+            if data_list:
+                MarketIndicatorBuilder().build_after_save('stock', strd_dt_value)
             
         except Exception as e:
             session.rollback()
@@ -134,9 +137,14 @@ class NaverFinanceCrawler:
         finally:
             session.close()
 
-    def run(self):
-        """네이버 금융 크롤링 실행"""
+    def run(self, force=False):
+        """네이버 금융 크롤링 실행 (KRX 휴장일에는 시세가 바뀌지 않으므로 건너뜀)"""
         try:
+            today = date.today()
+            if not force and not is_trading_day("KRX", today):
+                logger.info(f"[네이버 크롤링] {today} KRX 휴장일 - 최근 거래일 {last_trading_day('KRX', today)} 데이터 유지, 수집 건너뜀")
+                return []
+
             data_list = self.get_stock_data()
             if data_list:
                 self.save_to_db(data_list)
@@ -0,0 +1,207 @@
+from app.db import engine
+from app.config import settings
+from app.common.response_cache import response_cache
+from app.models import YoutubeComment, KmaForecast, JejuFloPop
+from sqlalchemy import select, text
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import pandas as pd
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 보관 기간 정책 (이름 → 모델, 보관 일수)
+# MySQL/PostgreSQL에서는 strd_dt 월 단위 RANGE 파티션(마이그레이션 0004)을 통째로 DROP 하고,
+# 파티션 경계에 걸친 날짜와 SQLite 등 파티션이 없는 DB는 strd_dt 단위 DELETE로 정리합니다.
+RETENTION_POLICIES = {
+    "youtube-keword": {"model": YoutubeComment, "days": settings.RETENTION_DAYS_YOUTUBE_KEWORD},
+    "kma-forecast": {"model": KmaForecast, "days": settings.RETENTION_DAYS_KMA_FORECAST},
+    "jeju-flo-pop": {"model": JejuFloPop, "days": settings.RETENTION_DAYS_JEJU_FLO_POP},
+}
+
+# 파티션 이름: MySQL p202610 / PostgreSQL {테이블}_p202610 (기본 파티션 pmax / {테이블}_pdefault)
+_PARTITION_MONTH = re.compile(r"p(\d{6})$")
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def cutoff_date(days, today=None):
+    """보관 기준일 - 이 날짜 미만(strd_dt < cutoff)이 정리 대상"""
+    return (today or date.today()) - timedelta(days=days)
+
+
+def list_partitions(conn, table):
+    """월 파티션 목록 [(파티션명, 시작일, 종료일(미포함))] - 파티션이 없으면 빈 목록"""
+    dialect = conn.dialect.name
+    if dialect == "mysql":
+        names = conn.execute(text(
+            "SELECT partition_name FROM information_schema.partitions "
+            "WHERE table_schema = DATABASE() AND table_name = :table AND partition_name IS NOT NULL"
+        ), {"table": table}).scalars().all()
+    elif dialect == "postgresql":
+        names = conn.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ), {"table": table}).scalars().all()
+    else:
+        return []
+
+    partitions = []
+    for name in names:
+        matched = _PARTITION_MONTH.search(name)
+        if not matched:
+            continue  # pmax / pdefault
+        start = datetime.strptime(matched.group(1), "%Y%m").date()
+        partitions.append((name, start, add_months(start, 1)))
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def ensure_partitions(conn, table, months_ahead=None):
+    """이번 달부터 months_ahead개월 뒤까지의 월 파티션을 미리 생성 (이미 있으면 건너뜀)"""
+    months_ahead = settings.RETENTION_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    partitions = list_partitions(conn, table)
+    if not partitions:
+        return []
+    existing = {start for _, start, _ in partitions}
+    created = []
+    this_month = month_start(date.today())
+    for offset in range(months_ahead + 1):
+        start = add_months(this_month, offset)
+        if start in existing or start < partitions[-1][1]:
+            continue
+        end = add_months(start, 1)
+        if conn.dialect.name == "mysql":
+            conn.execute(text(
+                f"ALTER TABLE {table} REORGANIZE PARTITION pmax INTO ("
+                f"PARTITION p{start:%Y%m} VALUES LESS THAN ('{end.isoformat()}'), "
+                f"PARTITION pmax VALUES LESS THAN (MAXVALUE))"
+            ))
+            created.append(f"p{start:%Y%m}")
+        else:
+            name = f"{table}_p{start:%Y%m}"
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            created.append(name)
+    if created:
+        logger.info(f"[보관 정책] {table} 파티션 생성: {created}")
+    return created
+
+
+def archive_rows(conn, model, start, end):
+    """strd_dt가 [start, end) 범위인 행을 월별 Parquet 파일로 보관
+
+    같은 달 파일이 이미 있으면 id 기준으로 합쳐 다시 쓰므로(압축/중복 제거) 재실행해도 안전합니다.
+    """
+    if settings.RETENTION_ARCHIVE_YN != "Y":
+        return []
+    table = model.__tablename__
+    query = select(model.__table__).where(model.strd_dt >= start, model.strd_dt < end)
+    df = pd.read_sql(query, conn)
+    if df.empty:
+        return []
+
+    archive_dir = Path(settings.RETENTION_ARCHIVE_DIR) / table
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for month, chunk in df.groupby(df["strd_dt"].str[:6]):
+        path = archive_dir / f"{table}_{month}.parquet"
+        if path.exists():
+            chunk = pd.concat([pd.read_parquet(path), chunk], ignore_index=True)
+            chunk = chunk.drop_duplicates(subset=["id"], keep="last")
+        chunk.sort_values(["strd_dt", "id"]).to_parquet(path, index=False, compression="zstd")
+        files.append(str(path))
+    logger.info(f"[보관 정책] {table} {start}~{end} {len(df)}건 아카이브: {files}")
+    return files
+
+
+def drop_partition(conn, table, name):
+    """파티션 DROP (텍스트 DDL이라 쓰기 추적(track_table_writes)에 잡히지 않으므로 커밋 후 response_cache.invalidate 필요)"""
+    if conn.dialect.name == "mysql":
+        conn.execute(text(f"ALTER TABLE {table} DROP PARTITION {name}"))
+    else:
+        conn.execute(text(f"DROP TABLE {name}"))
+
+
+def apply_retention(name, today=None, dry_run=False):
+    """보관 기간이 지난 데이터 정리 (아카이브 → 파티션 DROP → 남은 날짜 DELETE → 다음 달 파티션 생성)"""
+    policy = RETENTION_POLICIES[name]
+    model, days = policy["model"], policy["days"]
+    table = model.__tablename__
+    result = {"name": name, "table": table, "days": days, "dropped_partitions": [], "deleted_rows": 0,
+              "archived_files": [], "created_partitions": []}
+    if days <= 0:
+        return result
+    cutoff = cutoff_date(days, today)
+    result["cutoff"] = cutoff.strftime("%Y%m%d")
+
+    with engine.connect() as conn:
+        partitions = list_partitions(conn, table)
+        expired_partitions = [p for p in partitions if p[2] <= cutoff]
+        expired_days = conn.execute(
+            select(model.strd_dt).where(model.strd_dt < cutoff).distinct().order_by(model.strd_dt)
+        ).scalars().all()
+    if dry_run:
+        result["dropped_partitions"] = [p[0] for p in expired_partitions]
+        result["expired_days"] = expired_days
+        return result
+
+    # 1) 기간이 모두 지난 월 파티션: 아카이브 후 DROP (행 단위 삭제 없음)
+    for partition, start, end in expired_partitions:
+        with engine.begin() as conn:
+            result["archived_files"] += archive_rows(conn, model, start, end)
+            drop_partition(conn, table, partition)
+        response_cache.invalidate(table)
+        result["dropped_partitions"].append(partition)
+        logger.info(f"[보관 정책] {table} 파티션 삭제: {partition}")
+
+    # 2) 경계 파티션/비파티션 테이블: 남은 만료 날짜를 월 단위로 묶어 월마다 한 번 아카이브(Parquet 파일당 쓰기 1회)하고,
+    #    같은 트랜잭션에서 strd_dt 하루 단위로 DELETE (인덱스 선두 컬럼 조건)
+    dropped_until = max((p[2] for p in expired_partitions), default=None)
+    days_by_month = {}
+    for strd_dt in expired_days:
+        day = datetime.strptime(strd_dt, "%Y%m%d").date()
+        if dropped_until and day < dropped_until:
+            continue
+        days_by_month.setdefault(month_start(day), []).append(strd_dt)
+    for month, strd_dts in days_by_month.items():
+        with engine.begin() as conn:
+            result["archived_files"] += archive_rows(conn, model, month, min(add_months(month, 1), cutoff))
+            for strd_dt in strd_dts:
+                result["deleted_rows"] += conn.execute(
+                    model.__table__.delete().where(model.strd_dt == strd_dt)
+                ).rowcount
+
+    with engine.begin() as conn:
+        result["created_partitions"] = ensure_partitions(conn, table)
+    result["archived_files"] = sorted(set(result["archived_files"]))
+    logger.info(
+        f"[보관 정책] {table} 기준일 {result['cutoff']} 정리 완료: 파티션 {len(result['dropped_partitions'])}개, "
+        f"{result['deleted_rows']}건 삭제"
+    )
+    return result
+
+
+def retention_status(name, today=None):
+    """정책/기준일/파티션 현황 조회"""
+    policy = RETENTION_POLICIES[name]
+    model, days = policy["model"], policy["days"]
+    with engine.connect() as conn:
+        partitions = list_partitions(conn, model.__tablename__)
+    return {
+        "name": name, "table": model.__tablename__, "days": days,
+        "cutoff": cutoff_date(days, today).strftime("%Y%m%d") if days > 0 else None,
+        "partitions": [{"name": p[0], "start": p[1].strftime("%Y%m%d"), "end": p[2].strftime("%Y%m%d")}
+                       for p in partitions],
+    }
@@ -0,0 +1,97 @@
+from app.db import engine
+from app.models import (
+    JejuFloPop, SeoulForPop, EvTop, YoutubeComment, BlogCrawl,
+    JejuFloPopDaily, SeoulForPopDaily, EvSidoDaily, YoutubeKewordDaily, BlogKewordDaily
+)
+from sqlalchemy import distinct, func, literal, select
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 요약 테이블 정의 (이름 → 요약 모델, 원본 모델, 그룹 컬럼, 합계 컬럼, 추가 집계식)
+# 요약 테이블은 원본과 같은 strd_dt 파티션 단위로만 다시 계산합니다.
+ROLLUPS = {
+    "jeju-flo-pop-daily": {
+        "target": JejuFloPopDaily, "source": JejuFloPop,
+        "group_by": ["city", "emd"], "sums": ["resd_pop", "work_pop", "visit_pop"],
+    },
+    "seoul-for-pop-daily": {
+        "target": SeoulForPopDaily, "source": SeoulForPop,
+        "group_by": ["adstrd_code_se"], "sums": ["tot_lvpop_co", "china_staypop_co", "etc_staypop_co"],
+    },
+    "ev-sido-daily": {
+        "target": EvSidoDaily, "source": EvTop,
+        "group_by": ["sido_nm"], "sums": ["value"],
+    },
+    "youtube-keword-daily": {
+        "target": YoutubeKewordDaily, "source": YoutubeComment,
+        "group_by": ["keword"], "sums": [],
+        "extra": {"video_cnt": lambda src: func.count(distinct(src.video_id))},
+    },
+    "blog-keword-daily": {
+        "target": BlogKewordDaily, "source": BlogCrawl,
+        "group_by": ["keword"], "sums": [],
+    },
+}
+
+
+def rollups_for(source_table):
+    """원본 테이블명에 연결된 요약 이름 목록"""
+    return [name for name, spec in ROLLUPS.items() if spec["source"].__tablename__ == source_table]
+
+
+def refresh_rollup(name, strd_dt):
+    """요약 하나의 strd_dt 파티션을 원본 GROUP BY 결과로 교체 (DELETE + INSERT ... SELECT, 한 트랜잭션)"""
+    spec = ROLLUPS[name]
+    target, source = spec["target"], spec["source"]
+    ins_dt = time.strftime('%Y%m%d%H%M%S')
+
+    columns = {"strd_dt": literal(strd_dt, type_=target.strd_dt.type)}
+    columns.update({col: getattr(source, col) for col in spec["group_by"]})
+    columns.update({col: func.sum(getattr(source, col)) for col in spec["sums"]})
+    columns.update({col: expr(source) for col, expr in spec.get("extra", {}).items()})
+    columns["row_cnt"] = func.count()
+    columns["ins_dt"] = literal(ins_dt, type_=target.ins_dt.type)
+
+    query = (
+        select(*[expr.label(col) for col, expr in columns.items()])
+        .where(source.strd_dt == strd_dt)
+        .group_by(*[getattr(source, col) for col in spec["group_by"]])
+    )
+    with engine.begin() as conn:
+        conn.execute(target.__table__.delete().where(target.strd_dt == strd_dt))
+        inserted = conn.execute(target.__table__.insert().from_select(list(columns), query)).rowcount
+    logger.info(f"[요약 갱신] {name} strd_dt={strd_dt}: {inserted}건")
+    return inserted
+
+
+def refresh_after_save(source_table, strd_dts):
+    """크롤러 적재 직후 호출 - 연결된 요약을 적재된 strd_dt만 갱신 (실패는 로그만 남기고 원본 적재는 유지)"""
+    if isinstance(strd_dts, str):
+        strd_dts = [strd_dts]
+    result = {}
+    for name in rollups_for(source_table):
+        for strd_dt in dict.fromkeys(strd_dts):
+            try:
+                result[(name, strd_dt)] = refresh_rollup(name, strd_dt)
+            except Exception as e:
+                logger.error(f"[요약 갱신] {name} strd_dt={strd_dt} 갱신 실패: {e}")
+    return result
+
+
+def query_rollup(db, name, start_dt=None, end_dt=None, filters=None):
+    """요약 테이블 조회 (strd_dt 범위 + 그룹 컬럼 일치 조건)"""
+    spec = ROLLUPS[name]
+    target = spec["target"]
+    q = db.query(target)
+    if start_dt:
+        q = q.filter(target.strd_dt >= start_dt)
+    if end_dt:
+        q = q.filter(target.strd_dt <= end_dt)
+    for col, value in (filters or {}).items():
+        if col in spec["group_by"] and value is not None:
+            q = q.filter(getattr(target, col) == value)
+    q = q.order_by(target.strd_dt.desc(), *[getattr(target, col) for col in spec["group_by"]])
+    value_cols = ["strd_dt"] + spec["group_by"] + spec["sums"] + list(spec.get("extra", {})) + ["row_cnt"]
+    return [{col: getattr(r, col) for col in value_cols} for r in q.all()]
@@ -0,0 +1,280 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import date, datetime
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from app.config import settings
+from app.db import engine
+from app.common.trading_calendar import is_trading_day
+from app.service.naver_finance_crawler import NaverFinanceCrawler
+from app.service.ev_car_portal_crawler import EvCarPortalCrawler
+from app.service.finance_data_reader_parser import FinanceDataReaderParser
+from app.service.market_ohlcv_store import MarketOhlcvStore
+from app.service.naver_blog_crawler import NaverBlogCrawler
+from app.service.youtube_comment_crawler import YoutubeCommentCrawler
+from app.service.seoul_public_data_crawler import SeoulPublicDataCrawler
+from app.service.kma_public_data_crawler import KmaPublicDataCrawler
+from app.service.jeju_public_data_crawler import JejuPublicDataCrawler
+from app.service.retention import RETENTION_POLICIES, apply_retention
+
+logger = logging.getLogger(__name__)
+
+# 내장 크롤러 스케줄러 (APScheduler)
+# 작업 목록과 기본 cron은 SCHEDULED_JOBS에 두고, 일시 정지 / cron 변경 / 다음 실행 시각은 작업 저장소(DB)에 남겨
+# 서버를 다시 시작해도 유지합니다. 작업 함수는 "모듈:함수" 문자열(run_job)로 저장되어 DB에 직렬화됩니다.
+
+
+def _finance_data_reader():
+    parser = FinanceDataReaderParser()
+    df = parser.get_data()
+    df['stock_day'] = df['stock_day'].astype(str)
+    parser.save_to_dbms_market_stock(df)
+    return len(df)
+
+
+def _krx_trading_day(func):
+    """KRX 휴장일(공휴일 포함)에는 실행하지 않는 작업"""
+    def wrapper():
+        if not is_trading_day("KRX", date.today()):
+            return "휴장일"
+        return func()
+    return wrapper
+
+
+# 작업 이름 → 실행 함수, 기본 cron (분 시 일 월 요일, SCHEDULER_TIMEZONE 기준), 설명
+# 카카오톡 크롤러는 메시지를 보내는 작업이라 예약 실행하지 않습니다.
+SCHEDULED_JOBS = {
+    "naver-finance": {
+        "func": _krx_trading_day(lambda: NaverFinanceCrawler().run()),
+        "cron": "40 15 * * mon-fri", "description": "네이버 금융 크롤링 (장 마감 후)",
+    },
+    "finance-data-reader": {
+        "func": _krx_trading_day(_finance_data_reader),
+        "cron": "50 15 * * mon-fri", "description": "FinanceDataReader 종목 시세 저장",
+    },
+    "market-ohlcv": {
+        "func": lambda: MarketOhlcvStore().load_missing(),
+        "cron": "0 16 * * mon-fri", "description": "시세 저장소 누락 거래일 적재",
+    },
+    "ev-car-portal": {
+        "func": lambda: EvCarPortalCrawler().run(),
+        "cron": "0 9 * * *", "description": "EV 포털 크롤링",
+    },
+    "naver-blog": {
+        "func": lambda: NaverBlogCrawler().run_registry(),
+        "cron": "0 7 * * *", "description": "네이버 블로그 등록 키워드 크롤링",
+    },
+    "youtube-comment": {
+        "func": lambda: YoutubeCommentCrawler().run(),
+        "cron": "0 8 * * *", "description": "유튜브 댓글 크롤링",
+    },
+    "seoul-public-data": {
+        "func": lambda: SeoulPublicDataCrawler().run_seoul_api_crawler(),
+        "cron": "30 6 * * *", "description": "서울 생활인구 공공데이터 수집",
+    },
+    "kma-public-data": {
+        "func": lambda: KmaPublicDataCrawler().run_kma_api_crawler(),
+        "cron": "15 2-23/3 * * *", "description": "기상청 단기예보 수집 (발표 3시간 간격)",
+    },
+    "jeju-public-data": {
+        "func": lambda: JejuPublicDataCrawler().run_jeju_api_crawler(),
+        "cron": "0 6 * * *", "description": "제주 유동인구 공공데이터 수집",
+    },
+    "retention": {
+        "func": lambda: [apply_retention(name) for name in RETENTION_POLICIES],
+        "cron": "30 3 * * *", "description": "보관 기간이 지난 데이터 정리",
+    },
+}
+
+# 작업별 최근 실행 기록 / 실행 중인 수 (수동 실행과 예약 실행을 합쳐 SCHEDULER_MAX_INSTANCES로 제한)
+_history = {}
+_running = {}
+_lock = threading.Lock()
+
+scheduler = None
+
+
+def _summary(result):
+    if result is None or isinstance(result, (str, int, float)):
+        return result
+    if isinstance(result, dict):
+        return {k: v for k, v in result.items() if isinstance(v, (str, int, float, bool))}
+    return len(result) if hasattr(result, "__len__") else None
+
+
+# 예외 대신 {"status": "error", "message": ...}를 돌려주는 크롤러(서울/기상청/제주 공공데이터)의 실패 상태값
+FAILED_STATUSES = {"error", "fail"}
+
+
+def _failure(result):
+    """작업 결과가 실패 상태 dict이면 오류 메시지 (성공이면 None)"""
+    if isinstance(result, dict) and str(result.get("status", "")).lower() in FAILED_STATUSES:
+        return str(result.get("message") or result.get("error") or result["status"])
+    return None
+
+
+def _record(name, **fields):
+    with _lock:
+        _history.setdefault(name, {}).update(fields)
+
+
+def run_job(name):
+    """작업 실행 (작업 저장소에 "app.service.scheduler:run_job"으로 저장됨)"""
+    with _lock:
+        if _running.get(name, 0) >= settings.SCHEDULER_MAX_INSTANCES:
+            _history.setdefault(name, {})["last_skipped"] = datetime.now().strftime('%Y%m%d%H%M%S')
+            logger.warning(f"[스케줄러] {name} 이미 실행 중이라 건너뜀")
+            return
+        _running[name] = _running.get(name, 0) + 1
+    started = time.perf_counter()
+    _record(name, last_start=datetime.now().strftime('%Y%m%d%H%M%S'), status="running")
+    logger.info(f"[스케줄러] {name} 시작")
+    try:
+        result = SCHEDULED_JOBS[name]["func"]()
+        if asyncio.iscoroutine(result):
+            result = asyncio.run(result)
+        error = _failure(result)
+        if error:
+            _record(name, status="failed", error=error, result=_summary(result))
+            logger.error(f"[스케줄러] {name} 실패: {error}")
+        else:
+            _record(name, status="success", error=None, result=_summary(result))
+            logger.info(f"[스케줄러] {name} 완료 ({time.perf_counter() - started:.1f}s)")
+    except Exception as e:
+        _record(name, status="failed", error=str(e), result=None)
+        logger.exception(f"[스케줄러] {name} 실패: {e}")
+    finally:
+        _record(name, last_end=datetime.now().strftime('%Y%m%d%H%M%S'),
+                duration=round(time.perf_counter() - started, 3))
+        with _lock:
+            _running[name] -= 1
+
+
+def _on_event(event):
+    name = event.job_id.split("@")[0]
+    if event.code == EVENT_JOB_MISSED:
+        _record(name, last_missed=event.scheduled_run_time.strftime('%Y%m%d%H%M%S'))
+        logger.warning(f"[스케줄러] {name} 예정 시각({event.scheduled_run_time}) 초과로 실행하지 않음")
+    else:
+        _record(name, last_skipped=datetime.now().strftime('%Y%m%d%H%M%S'))
+        logger.warning(f"[스케줄러] {name} 최대 동시 실행 수 초과로 건너뜀")
+
+
+def cron_trigger(cron):
+    """crontab 문자열 → CronTrigger (실행 시각을 0~SCHEDULER_JITTER초 무작위로 늦춰 외부 API 요청이 몰리지 않게 함)
+
+    요일은 APScheduler 규칙(숫자 0=월요일)을 따르므로 mon-fri처럼 이름으로 적습니다.
+    """
+    fields = cron.split()
+    if len(fields) != 5:
+        raise ValueError(f"cron 항목은 5개여야 합니다 (분 시 일 월 요일): {cron}")
+    minute, hour, day, month, day_of_week = fields
+    return CronTrigger(minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week,
+                       timezone=settings.SCHEDULER_TIMEZONE, jitter=settings.SCHEDULER_JITTER or None)
+
+
+def create_scheduler():
+    jobstore = (SQLAlchemyJobStore(url=settings.SCHEDULER_JOBSTORE_URL) if settings.SCHEDULER_JOBSTORE_URL
+                else SQLAlchemyJobStore(engine=engine))
+    return BackgroundScheduler(
+        jobstores={"default": jobstore, "manual": MemoryJobStore()},
+        executors={"default": ThreadPoolExecutor(settings.SCHEDULER_MAX_WORKERS)},
+        job_defaults={
+            "coalesce": True,  # 밀린 실행이 여러 번이어도 한 번만 실행
+            "max_instances": settings.SCHEDULER_MAX_INSTANCES,
+            "misfire_grace_time": settings.SCHEDULER_MISFIRE_GRACE_TIME,
+        },
+        timezone=settings.SCHEDULER_TIMEZONE,
+    )
+
+
+def _sync_jobs():
+    """SCHEDULED_JOBS와 작업 저장소 맞추기
+
+    저장소에 없는 작업은 기본 cron(또는 SCHEDULER_CRONS)으로 추가하고, 이미 있는 작업은 저장된 상태(일시 정지, API로 바꾼 cron)를 유지합니다.
+    SCHEDULER_CRONS에 지정한 작업은 매번 그 cron으로 맞추며, 코드에서 빠진 작업은 저장소에서 삭제합니다.
+    """
+    for job in scheduler.get_jobs(jobstore="default"):
+        if job.id not in SCHEDULED_JOBS:
+            scheduler.remove_job(job.id)
+            logger.info(f"[스케줄러] 등록되지 않은 작업 삭제: {job.id}")
+    for name, spec in SCHEDULED_JOBS.items():
+        cron = settings.SCHEDULER_CRONS.get(name)
+        job = scheduler.get_job(name, jobstore="default")
+        if job is None:
+            scheduler.add_job("app.service.scheduler:run_job", cron_trigger(cron or spec["cron"]), args=[name],
+                              id=name, name=spec["description"], jobstore="default")
+        elif cron:
+            set_cron(name, cron)
+
+
+def start():
+    """스케줄러 시작 (SCHEDULER_YN=Y일 때만)"""
+    global scheduler
+    if settings.SCHEDULER_YN != "Y" or scheduler is not None:
+        return scheduler
+    scheduler = create_scheduler()
+    scheduler.add_listener(_on_event, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+    # 작업을 맞추는 동안 실행되지 않도록 일시 정지 상태로 시작
+    scheduler.start(paused=True)
+    _sync_jobs()
+    scheduler.resume()
+    logger.info(f"[스케줄러] 시작: 작업 {len(SCHEDULED_JOBS)}개 ({settings.SCHEDULER_TIMEZONE})")
+    return scheduler
+
+
+def shutdown():
+    global scheduler
+    if scheduler is not None:
+        scheduler.shutdown(wait=False)
+        scheduler = None
+        logger.info("[스케줄러] 종료")
+
+
+def set_cron(name, cron):
+    """cron 변경 (일시 정지된 작업은 정지 상태를 유지)"""
+    trigger = cron_trigger(cron)
+    if scheduler.get_job(name).next_run_time is None:
+        scheduler.modify_job(name, trigger=trigger)
+    else:
+        scheduler.reschedule_job(name, trigger=trigger)
+
+
+def run_now(name):
+    """예약과 별도로 즉시 1회 실행 (일회성 작업은 메모리 저장소에 추가)"""
+    scheduler.add_job(run_job, args=[name], id=f"{name}@{time.time_ns()}", jobstore="manual",
+                      misfire_grace_time=None)
+
+
+def schedule_status():
+    """작업별 cron, 다음 실행 시각, 일시 정지 여부, 최근 실행 기록"""
+    with _lock:
+        history = {name: dict(record) for name, record in _history.items()}
+        running = dict(_running)
+    jobs = {job.id: job for job in scheduler.get_jobs(jobstore="default")} if scheduler else {}
+    items = []
+    for name, spec in SCHEDULED_JOBS.items():
+        job = jobs.get(name)
+        items.append({
+            "id": name,
+            "description": spec["description"],
+            "trigger": str(job.trigger) if job else None,
+            "next_run_time": job.next_run_time.strftime('%Y%m%d%H%M%S') if job and job.next_run_time else None,
+            "paused": bool(job) and job.next_run_time is None,
+            "running": running.get(name, 0),
+            **history.get(name, {}),
+        })
+    return {
+        "running": scheduler is not None and scheduler.running,
+        "timezone": settings.SCHEDULER_TIMEZONE,
+        "jitter": settings.SCHEDULER_JITTER,
+        "max_instances": settings.SCHEDULER_MAX_INSTANCES,
+        "misfire_grace_time": settings.SCHEDULER_MISFIRE_GRACE_TIME,
+        "jobs": items,
+    }
@@ -1,9 +1,10 @@
 import httpx
 from bs4 import BeautifulSoup
+from app.common.http_client import GovernedAsyncTransport
 
 async def fetch_example(keyword: str) -> list[dict]:
     url = f"https://example.com/search?q={keyword}"
-    async with httpx.AsyncClient(timeout=20) as client:
+    async with httpx.AsyncClient(timeout=20, transport=GovernedAsyncTransport()) as client:
         r = await client.get(url)
         r.raise_for_status()
     soup = BeautifulSoup(r.text, "lxml")
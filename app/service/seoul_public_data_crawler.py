@@ -6,7 +6,9 @@ import logging
 from datetime import date, timedelta
 from app.db import SessionLocal
 from app.models import SeoulForPop
+from app.service.rollup import refresh_after_save
 from app.config import settings
+from app.common import http_client
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -43,7 +45,7 @@ class SeoulPublicDataCrawler:
             url = f'{self.base_url}/{self.apikey}/json/{self.api_endpoint}/{start_num}/{end_num}/{date_str}'
             logger.info(f"[서울공공데이터] API 호출: {url}")
             
-            response = requests.get(url, timeout=30)
+            response = http_client.get(url, timeout=30)
             response.raise_for_status()
             
             json_data = response.json()
@@ -206,6 +208,7 @@ class SeoulPublicDataCrawler:
             
             session.commit()
             logger.info(f"[서울공공데이터] 데이터베이스 저장 완료 - {len(records)}건")
+            refresh_after_save(SeoulForPop.__tablename__, self.strd_dt)
             return len(records)
             
         except Exception as e:
@@ -248,7 +251,7 @@ class SeoulPublicDataCrawler:
                 logger.info(f"[서울공공데이터] 테스트 URL: {test_url}")
                 
                 try:
-                    test_response = requests.get(test_url, timeout=30)
+                    test_response = http_client.get(test_url, timeout=30)
                     test_response.raise_for_status()
                     test_json = test_response.json()
                     
@@ -2,14 +2,27 @@ import pandas as pd
 import time
 import logging
 from googleapiclient.discovery import build
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from googleapiclient.errors import HttpError
 from app.config import settings
+from app.db import SessionLocal
 from app.models import YoutubeComment
+from app.service.rollup import refresh_after_save
+from app.common.rate_governor import QuotaExceeded, governor
+from app.common import resilience
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# YouTube Data API 메서드별 할당량 단위 (search.list는 100단위라 일일 할당량 대부분을 차지)
+QUOTA_COSTS = {"search": 100, "videos": 1, "commentThreads": 1}
+
+
+def _retryable(error):
+    """HttpError는 429·5xx만 재시도 (403 quotaExceeded 등은 재시도해도 같은 결과), 그 외 접속 오류는 재시도"""
+    if isinstance(error, HttpError):
+        return error.resp.status in resilience.RETRY_STATUSES
+    return not isinstance(error, QuotaExceeded)
+
 class YoutubeCommentCrawler:
     
     def __init__(self, api_key=None):
@@ -19,20 +32,23 @@ class YoutubeCommentCrawler:
             logger.warning("YouTube API 키가 기본값입니다. config.py에서 DEVELOPER_KEY를 설정해주세요.")
         
         self.youtube_api = build("youtube", "v3", developerKey=self.api_key)
-        
-        # 데이터베이스 연결 설정
-        engine = create_engine(settings.DB_URL)
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        self.db = SessionLocal()
+
+    def execute(self, resource, request):
+        """API 요청 실행 (호출 제한의 youtube 소스로 초당 호출 수 / 일일 할당량 단위 관리, 429·5xx·접속 오류는 재시도)"""
+        def run():
+            with governor.limit("youtube", cost=QUOTA_COSTS[resource]):
+                return request.execute()
+
+        return resilience.call("youtube", run, retryable=_retryable)
 
     def video_search_list(self, query, max_results=10):
         """키워드로 동영상 검색"""
         try:
-            search_response = self.youtube_api.search().list(
+            search_response = self.execute("search", self.youtube_api.search().list(
                 q=query,
                 part='id,snippet',
                 maxResults=max_results
-            ).execute()
+            ))
 
             video_ids = []
             for item in search_response.get("items", []):
@@ -46,10 +62,10 @@ class YoutubeCommentCrawler:
     def get_video_info(self, video_ids):
         """동영상 정보 가져오기"""
         try:
-            videos_list_response = self.youtube_api.videos().list(
+            videos_list_response = self.execute("videos", self.youtube_api.videos().list(
                 id=video_ids,
                 part='snippet,statistics'
-            ).execute()
+            ))
 
             video_list = []
             for item in videos_list_response.get("items", []):
@@ -68,11 +84,11 @@ class YoutubeCommentCrawler:
     def get_comments(self, keyword, video_id, max_cnt=10):
         """특정 동영상의 댓글 가져오기"""
         try:
-            comment_list_response = self.youtube_api.commentThreads().list(
+            comment_list_response = self.execute("commentThreads", self.youtube_api.commentThreads().list(
                 videoId=video_id,
                 part='id,replies,snippet',
                 maxResults=max_cnt
-            ).execute()
+            ))
 
             strd_dt = time.strftime('%Y%m%d')
             ins_dt = time.strftime('%Y%m%d%H%M%S')
@@ -126,7 +142,8 @@ class YoutubeCommentCrawler:
         return all_comments
 
     def save_to_db(self, comments_data):
-        """댓글 데이터를 데이터베이스에 저장"""
+        """댓글 데이터를 데이터베이스에 저장 (저장할 때만 공용 커넥션 풀에서 세션을 열고 바로 반납)"""
+        session = SessionLocal()
         try:
             saved_count = 0
             for comment_data in comments_data:
@@ -139,16 +156,19 @@ class YoutubeCommentCrawler:
                     comment_author=comment_data['comment_author'],
                     ins_dt=comment_data['ins_dt']
                 )
-                self.db.add(youtube_comment)
+                session.add(youtube_comment)
                 saved_count += 1
             
-            self.db.commit()
+            session.commit()
             logger.info(f"데이터베이스에 {saved_count}개 댓글 저장 완료")
+            refresh_after_save(YoutubeComment.__tablename__, [c['strd_dt'] for c in comments_data])
             return saved_count
         except Exception as e:
-            self.db.rollback()
+            session.rollback()
             logger.error(f"데이터베이스 저장 중 오류: {str(e)}")
             raise e
+        finally:
+            session.close()
 
     def run(self, search_keyword="노트북", video_count=10):
         """유튜브 댓글 크롤링 실행"""
@@ -170,6 +190,4 @@ class YoutubeCommentCrawler:
             
         except Exception as e:
             logger.error(f'유튜브 댓글 크롤링 중 오류 발생: {str(e)}')
-            raise e
-        finally:
-            self.db.close()
\ No newline at end of file
+            raise e
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""/all 목록 엔드포인트 직렬화 벤치마크 (기존: ORM 객체 → dict → jsonable_encoder → json / 변경: 컬럼 튜플 → orjson)
+
+실행: python bench_api_serialization.py [행 수]
+임시 SQLite DB에 테이블별로 N행을 넣고 엔드포인트 함수 + 응답 본문 생성까지의 시간을 비교합니다.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_YN", "N")
+from app.config import settings
+
+settings.DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_api.db')}"
+
+import orjson
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.db import SessionLocal, upgrade_schema
+from app.models import NaverFinance, EvTop, YoutubeComment, KmaForecast, JejuFloPop
+from app.common.df_loader import replace_partition
+from app.common.json_response import frame_response, rows_response
+from app.registry import MODEL_SPECS
+from app.service.model_query import all_rows
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+REPEAT = 5
+
+# 엔드포인트 → (app.registry 데이터셋 이름, 모델, 테스트 행 생성 함수)
+ENDPOINTS = {
+    "/api/stock/all": ("stock", NaverFinance, lambda i: {
+        "strd_dt": "20261019", "stock_cd": f"{i:06d}", "stock_nm": f"종목{i}", "pre_price": 82500,
+        "today_price": 83000, "trading_volume": 1234567 + i, "ins_dt": "20261019101112"}),
+    "/api/ev/all": ("ev", EvTop, lambda i: {
+        "strd_dt": "20261019", "sido_nm": "서울", "region": f"지역{i % 25}", "receipt_way": "온라인",
+        "receipt_priority": "일반", "value": i, "ins_dt": "20261019101112"}),
+    "/api/youtube/all": ("youtube", YoutubeComment, lambda i: {
+        "strd_dt": "20261019", "keword": "노트북", "link": f"https://www.youtube.com/watch?v={i}",
+        "video_id": f"v{i}", "main_text": "댓글 내용입니다", "comment_author": f"user{i}", "ins_dt": "20261019101112"}),
+    "/api/kma/forecast/all": ("kma", KmaForecast, lambda i: {
+        "strd_dt": "20261019", "strd_tm": "0600", "category": "T1H", "nx": 60, "ny": 127,
+        "obsr_value": f"{i % 30}.5", "ins_dt": "20261019101112"}),
+    "/api/jeju/flo-pop/all": ("jeju-flo-pop", JejuFloPop, lambda i: {
+        "strd_dt": "20261019", "regist_dt": "20261019", "city": "제주시", "emd": f"동{i % 40}", "gender": "M",
+        "age_group": "30", "resd_pop": i, "work_pop": i // 2, "visit_pop": i // 3, "ins_dt": "20261019101112"}),
+}
+
+
+def legacy_handler(model, columns, order_by):
+    """변경 전 방식: ORM 객체 조회 → dict 목록 → FastAPI jsonable_encoder → 표준 json"""
+    def run(db):
+        rows = db.query(model).order_by(*order_by).all()
+        items = [{c: getattr(r, c) for c in columns} for r in rows]
+        return JSONResponse(jsonable_encoder({"items": items})).body
+    return run
+
+
+def timed(func, *args):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def seed():
+    upgrade_schema()
+    for path, (_, model, make_row) in ENDPOINTS.items():
+        replace_partition(pd.DataFrame([make_row(i) for i in range(N)]), model)
+
+
+if __name__ == "__main__":
+    seed()
+    db = SessionLocal()
+    print(f"행 수 {N:,}, {REPEAT}회 중 최소 시간")
+    for path, (name, model, make_row) in ENDPOINTS.items():
+        handler = lambda db, spec=MODEL_SPECS[name]: rows_response(*all_rows(db, spec))  # /all 엔드포인트와 동일
+        columns = list(orjson.loads(handler(db).body)["items"][0])  # 응답 키를 그대로 사용
+        order_by = [model.id.desc()]
+        if path in ("/api/stock/all", "/api/ev/all", "/api/youtube/all"):
+            order_by = [model.ins_dt.desc(), model.id.desc()]
+        legacy = timed(legacy_handler(model, columns, order_by), db)
+        current = timed(lambda: handler(db).body)
+        print(f"{path:<24} legacy {legacy * 1000:8.1f}ms ({N / legacy:>10,.0f} rows/s) | "
+              f"orjson {current * 1000:8.1f}ms ({N / current:>10,.0f} rows/s) | x{legacy / current:.1f}")
+    db.close()
+
+    # run_finance_data_reader 응답: df.to_dict(orient="records") + JSONResponse vs DataFrame 직접 인코딩
+    df = pd.DataFrame([ENDPOINTS["/api/stock/all"][2](i) for i in range(N)])
+    legacy = timed(lambda: JSONResponse({"rows": df.to_dict(orient="records")}).body)
+    current = timed(lambda: frame_response(df).body)
+    assert orjson.loads(frame_response(df).body) == orjson.loads(JSONResponse({"rows": df.to_dict(orient="records")}).body)
+    print(f"{'DataFrame rows':<24} legacy {legacy * 1000:8.1f}ms ({N / legacy:>10,.0f} rows/s) | "
+          f"orjson {current * 1000:8.1f}ms ({N / current:>10,.0f} rows/s) | x{legacy / current:.1f}")
@@ -0,0 +1,101 @@
+"""목록 API 동시 요청 부하 비교: 스레드풀 동기 Session vs 이벤트 루프 AsyncSession
+
+실행: python bench_async_list.py [동시 요청 수] [총 요청 수] [DB URL]
+DB URL을 주지 않으면 임시 SQLite DB(aiosqlite 필요)를 사용합니다. 데이터를 넣은 뒤 같은 목록 경로를 동기/비동기 핸들러로
+각각 등록한 앱을 별도 프로세스의 uvicorn으로 띄우고, httpx 비동기 클라이언트로 동시에 요청합니다. (응답 캐시는 끄고 측정)
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SERVE = len(sys.argv) > 1 and sys.argv[1] == "--serve"  # 서버 프로세스: --serve threadpool|async 포트
+os.environ["RESPONSE_CACHE_YN"] = "N"
+os.environ["DB_ASYNC_YN"] = "Y"  # 비교를 위해 비동기 엔진 생성 (설정 기본값은 N)
+if len(sys.argv) > 3 and not SERVE:
+    os.environ["DB_URL"] = sys.argv[3]
+else:
+    os.environ.setdefault("DB_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_async.db')}")
+
+import httpx
+import pandas as pd
+import uvicorn
+from fastapi import APIRouter, FastAPI
+from app.db import upgrade_schema, async_engine
+from app.models import EvTop
+from app.common.df_loader import replace_partition
+from app.common.json_response import FastJSONResponse
+from app.routers.model_routes import register_all
+
+CONCURRENCY = int(sys.argv[1]) if len(sys.argv) > 1 and not SERVE else 200
+TOTAL = int(sys.argv[2]) if len(sys.argv) > 2 and not SERVE else 4000
+PATH = "/api/ev/top10"
+PARAMS = {"start_date": "2026-10-19", "limit": 50}
+
+
+def build_app(use_async):
+    router = APIRouter(prefix="/api")
+    register_all(router, use_async=use_async)
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(router)
+    return app
+
+
+def serve(mode, port):
+    """벤치 클라이언트와 GIL을 나눠 쓰지 않도록 서버는 별도 프로세스로 실행"""
+    process = subprocess.Popen([sys.executable, __file__, "--serve", mode, str(port)], env=os.environ.copy())
+    for _ in range(200):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"서버 시작 실패: {mode}")
+
+
+async def load(port):
+    limits = httpx.Limits(max_connections=CONCURRENCY, max_keepalive_connections=CONCURRENCY)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+        await client.get(PATH, params=PARAMS)  # 워밍업
+        queue = asyncio.Queue()
+        for _ in range(TOTAL):
+            queue.put_nowait(None)
+        latencies = []
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(PATH, params=PARAMS)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(CONCURRENCY)])
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return TOTAL / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+if __name__ == "__main__" and SERVE:
+    uvicorn.run(build_app(sys.argv[2] == "async"), port=int(sys.argv[3]), log_level="warning")
+elif __name__ == "__main__":
+    if async_engine is None:
+        sys.exit("비동기 드라이버(aiosqlite)가 없어 비교할 수 없습니다: pip install aiosqlite")
+    upgrade_schema()
+    replace_partition(pd.DataFrame([{
+        "strd_dt": "20261019", "sido_nm": "서울", "region": f"지역{i % 25}", "receipt_way": "온라인",
+        "receipt_priority": "일반", "value": i, "ins_dt": "20261019101112"} for i in range(5000)]), EvTop)
+
+    print(f"{PATH} 동시 요청 {CONCURRENCY}, 총 {TOTAL}건 ({async_engine.url.drivername})")
+    for port, name in enumerate(("threadpool", "async"), start=18741):
+        server = serve(name, port)
+        try:
+            rps, p50, p99 = asyncio.run(load(port))
+        finally:
+            server.terminate()
+            server.wait()
+        print(f"{name:<11} {rps:8.1f} req/s | p50 {p50 * 1000:7.1f}ms | p99 {p99 * 1000:7.1f}ms")
@@ -0,0 +1,71 @@
+"""JSON 전체 조회(/api/jeju/flo-pop/all)와 Parquet / Arrow 내보내기(/api/export/...) 비교
+
+실행: python bench_export.py [행 수]
+임시 SQLite DB에 N행을 넣고 응답 생성 시간, 응답 크기, pandas DataFrame으로 읽는 시간을 측정합니다.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_YN", "N")
+from app.config import settings
+
+settings.DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_export.db')}"
+
+import pandas as pd
+import pyarrow as pa
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models import JejuFloPop
+from app.common.df_loader import replace_partition
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+
+def seed():
+    days = [f"202610{d:02d}" for d in range(1, 31)]
+    df = pd.DataFrame({
+        "strd_dt": [days[i % len(days)] for i in range(N)],
+        "regist_dt": [days[i % len(days)] for i in range(N)],
+        "city": ["제주시" if i % 2 else "서귀포시" for i in range(N)],
+        "emd": [f"동{i % 40}" for i in range(N)],
+        "gender": ["M" if i % 2 else "F" for i in range(N)],
+        "age_group": [str(10 * (i % 8)) for i in range(N)],
+        "resd_pop": range(N), "work_pop": range(N), "visit_pop": range(N),
+        "ins_dt": ["20261019101112"] * N,
+    })
+    replace_partition(df, JejuFloPop, chunksize=2000)
+
+
+def read_json(body):
+    return pd.DataFrame(pd.io.json.ujson_loads(body)["items"])
+
+
+def read_parquet(body):
+    return pd.read_parquet(io.BytesIO(body))
+
+
+def read_arrow(body):
+    return pa.ipc.open_stream(body).read_all().to_pandas()
+
+
+if __name__ == "__main__":
+    seed()
+    client = TestClient(app)
+    cases = [
+        ("JSON /all", "/api/jeju/flo-pop/all", read_json),
+        ("Parquet", "/api/export/dbms_jeju_api_floating_population.parquet", read_parquet),
+        ("Arrow IPC", "/api/export/dbms_jeju_api_floating_population.arrow", read_arrow),
+    ]
+    print(f"행 수 {N:,}")
+    for name, path, reader in cases:
+        start = time.perf_counter()
+        body = client.get(path).content
+        served = time.perf_counter() - start
+        start = time.perf_counter()
+        df = reader(body)
+        parsed = time.perf_counter() - start
+        print(f"{name:<10} 응답 {served:6.2f}s | 크기 {len(body) / 1024 / 1024:8.1f}MB | "
+              f"DataFrame 변환 {parsed:6.2f}s | {len(df):,}행")
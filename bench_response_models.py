@@ -0,0 +1,73 @@
+"""목록 응답 직렬화 벤치마크: 응답 스키마 검증 vs model_construct vs 행 튜플 직접 직렬화
+
+실행: python bench_response_models.py [행 수]
+임시 SQLite DB의 dbms_ev_car_portal에 N행을 넣고, 같은 조회 결과(행 튜플)를 세 가지 방식으로 JSON 본문까지 만드는 시간을 비교합니다.
+  validated   : 행마다 dict → ListAll[EvOut].model_validate → model_dump_json (response_model 검증 경로)
+  constructed : 행마다 EvOut.model_construct (검증 생략) → model_dump_json
+  raw         : rows_response (목록 엔드포인트가 사용하는 방식, 스키마 객체 없이 orjson)
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("RESPONSE_CACHE_YN", "N")
+from app.config import settings
+
+settings.DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_models.db')}"
+
+import orjson
+import pandas as pd
+from app.db import SessionLocal, upgrade_schema
+from app.models import EvTop
+from app.schema import EvOut, ListAll
+from app.registry import MODEL_SPECS
+from app.common.df_loader import replace_partition
+from app.common.json_response import rows_response
+from app.service.model_query import all_rows
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+REPEAT = 5
+
+
+def validated(rows, keys):
+    return ListAll[EvOut].model_validate({"items": [dict(zip(keys, row)) for row in rows]}).model_dump_json()
+
+
+def constructed(rows, keys):
+    items = [EvOut.model_construct(**dict(zip(keys, row))) for row in rows]
+    return ListAll[EvOut].model_construct(items=items).model_dump_json()
+
+
+def raw(rows, columns):
+    return rows_response(rows, columns).body
+
+
+def timed(func, *args):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    upgrade_schema()
+    replace_partition(pd.DataFrame([{
+        "strd_dt": "20261019", "sido_nm": "서울", "region": f"지역{i % 25}", "receipt_way": "온라인",
+        "receipt_priority": "일반", "value": i, "ins_dt": "20261019101112"} for i in range(N)]), EvTop)
+
+    db = SessionLocal()
+    rows, columns = all_rows(db, MODEL_SPECS["ev"])
+    db.close()
+    keys = [c.key for c in columns]
+    # 세 방식의 응답 내용이 같은지 먼저 확인
+    assert orjson.loads(validated(rows, keys)) == orjson.loads(constructed(rows, keys)) == orjson.loads(raw(rows, columns))
+
+    print(f"행 수 {N:,}, {REPEAT}회 중 최소 시간 (조회 제외, 본문 생성만)")
+    base = timed(validated, rows, keys)
+    for name, func, args in (("validated", validated, (rows, keys)), ("constructed", constructed, (rows, keys)),
+                             ("raw", raw, (rows, columns))):
+        elapsed = base if func is validated else timed(func, *args)
+        print(f"{name:<12} {elapsed * 1000:8.1f}ms ({N / elapsed:>10,.0f} rows/s) | x{base / elapsed:.1f}")
@@ -0,0 +1,86 @@
+"""블로그 제목 정제 벤치마크 (기존 건별 re.sub 루프 vs text_cleaner 배치 정제)
+
+실행: python bench_text_cleaner.py [총 아이템 수]
+- 기존 건별 처리: 인라인 re.sub 2회 + 건별 print
+- 배치 처리: parse_and_clean_data와 같이 키워드 검색 결과 전체(최대 1000건)를 이어 붙여 한 번에 정제
+  (한 번에 전체 N건을 넘기는 경우도 함께 측정)
+"""
+import os
+import re
+import sys
+import time
+import random
+import contextlib
+from app.common.text_cleaner import clean_blog_titles
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+BATCH_SIZE = 1000  # 키워드 하나의 최대 검색 결과 수 (네이버 검색 API start 최대값)
+KEYWORD = "시흥대야역맛집"
+STRIP_TERMS = {KEYWORD: ["시흥대야역", "시흥대야", "맛집"]}
+
+
+def make_items(n):
+    """네이버 블로그 검색 응답과 비슷한 형태의 테스트 데이터 (약 10% 행에 HTML 엔티티 포함)"""
+    words = ["시흥대야역", "<b>맛집</b>", "카페", "추천", "#데이트", "'분위기'", "대야동", "숨은", "리뷰", "정말", "맛있는"]
+    rnd = random.Random(0)
+    items = []
+    for i in range(n):
+        description = " ".join(rnd.choices(words, k=12))
+        if rnd.random() < 0.1:
+            description += " &quot;강추&quot; &amp; 재방문"
+        items.append({
+            "title": " ".join(rnd.choices(words, k=6)),
+            "link": f"https://blog.naver.com/example{i}",
+            "description": description,
+            "postdate": "20250101",
+        })
+    return items
+
+
+def legacy_parse(items):
+    """기존 parse_and_clean_data의 건별 처리 (인라인 re.sub 2회 + 건별 dict/print)"""
+    strd_dt = time.strftime('%Y%m%d')
+    ins_dt = time.strftime('%Y%m%d%H%M%S')
+    parsed_data = []
+    for i, item in enumerate(items):
+        try:
+            title = re.sub(r"(<b>|</b>|'|#|시흥대야역|시흥대야|맛집)", "", item.get('description', ''))[:20]
+            if len(title.strip()) < 5:
+                title = re.sub(r"(<b>|</b>|'|#)", "", item.get('title', ''))[:20]
+            row = {'strd_dt': strd_dt, 'keword': KEYWORD, 'title': title.strip(),
+                   'link': item.get('link', ''), 'ins_dt': ins_dt}
+            parsed_data.append(row)
+            print(f"[네이버 블로그 검색] 파싱 완료 {i+1}: {title[:15]}...")
+        except Exception:
+            continue
+    return parsed_data
+
+
+def batch_parse(items):
+    """현재 구현: 정제한 제목 목록을 한 번에 만든 뒤 행 dict 구성"""
+    strd_dt, ins_dt = time.strftime('%Y%m%d'), time.strftime('%Y%m%d%H%M%S')
+    titles = clean_blog_titles(items, KEYWORD, STRIP_TERMS)
+    return [
+        {'strd_dt': strd_dt, 'keword': KEYWORD, 'title': title, 'link': item.get('link') or '',
+         'postdate': item.get('postdate') or '', 'ins_dt': ins_dt}
+        for item, title in zip(items, titles)
+    ]
+
+
+def in_batches(func, size):
+    return lambda items: [row for i in range(0, len(items), size) for row in func(items[i:i + size])]
+
+
+if __name__ == "__main__":
+    items = make_items(N)
+    cases = [
+        ("legacy per-item loop", legacy_parse),
+        (f"batch per {BATCH_SIZE:,} items", in_batches(batch_parse, BATCH_SIZE)),
+        ("batch all items", batch_parse),
+    ]
+    for name, func in cases:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            func(items)
+            elapsed = time.perf_counter() - start
+        print(f"{name:<22} {N:,} items: {elapsed:.3f}s ({N / elapsed:,.0f} items/s)", file=sys.stdout)
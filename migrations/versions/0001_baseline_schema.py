@@ -0,0 +1,415 @@
+"""baseline schema (Base.metadata.create_all 시점의 테이블 구성)
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 17:15:29.975014
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_all로 이미 테이블이 만들어진 기존 DB에서도 그대로 실행되도록 없는 테이블만 생성
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'api_batch_stat' not in existing:
+        op.create_table('api_batch_stat',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=True),
+        sa.Column('api_nm', sa.String(length=100), nullable=True),
+        sa.Column('data_gb', sa.String(length=50), nullable=True),
+        sa.Column('data_cnt', sa.Integer(), nullable=True),
+        sa.Column('memo', sa.String(length=500), nullable=True),
+        sa.Column('ins_dt', sa.String(length=19), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('api_batch_stat', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_api_batch_stat_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_blog_keword' not in existing:
+        op.create_table('dbms_blog_keword',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('keword', sa.String(length=200), nullable=True),
+        sa.Column('title', sa.String(length=500), nullable=True),
+        sa.Column('link', sa.String(length=1000), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_blog_keword', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_blog_keword_ins_dt'), ['ins_dt'], unique=False)
+            batch_op.create_index(batch_op.f('ix_dbms_blog_keword_strd_dt'), ['strd_dt'], unique=False)
+            batch_op.create_index('ux_blog_keword_link', ['keword', 'link'], unique=True, mysql_length={'keword': 191, 'link': 512})
+
+    if 'dbms_blog_keword_registry' not in existing:
+        op.create_table('dbms_blog_keword_registry',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('keword', sa.String(length=200), nullable=False),
+        sa.Column('use_yn', sa.String(length=1), nullable=False),
+        sa.Column('newest_postdate', sa.String(length=8), nullable=True),
+        sa.Column('strip_terms', sa.String(length=500), nullable=True),
+        sa.Column('upd_dt', sa.String(length=14), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('keword')
+        )
+
+    if 'dbms_ev_car_portal' not in existing:
+        op.create_table('dbms_ev_car_portal',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('sido_nm', sa.String(length=50), nullable=True),
+        sa.Column('region', sa.String(length=100), nullable=True),
+        sa.Column('receipt_way', sa.String(length=50), nullable=True),
+        sa.Column('receipt_priority', sa.String(length=10), nullable=True),
+        sa.Column('value', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_ev_car_portal', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_ev_car_portal_ins_dt'), ['ins_dt'], unique=False)
+            batch_op.create_index(batch_op.f('ix_dbms_ev_car_portal_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_jeju_api_floating_population' not in existing:
+        op.create_table('dbms_jeju_api_floating_population',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=True),
+        sa.Column('regist_dt', sa.String(length=14), nullable=True),
+        sa.Column('city', sa.String(length=50), nullable=True),
+        sa.Column('emd', sa.String(length=50), nullable=True),
+        sa.Column('gender', sa.String(length=10), nullable=True),
+        sa.Column('age_group', sa.String(length=20), nullable=True),
+        sa.Column('resd_pop', sa.Integer(), nullable=True),
+        sa.Column('work_pop', sa.Integer(), nullable=True),
+        sa.Column('visit_pop', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=19), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_jeju_api_floating_population', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_jeju_api_floating_population_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_kakao_ai_image' not in existing:
+        op.create_table('dbms_kakao_ai_image',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('suggest_word', sa.String(length=500), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_kakao_ai_image', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_kakao_ai_image_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_kakao_talk' not in existing:
+        op.create_table('dbms_kakao_talk',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('access_token', sa.String(length=2000), nullable=True),
+        sa.Column('token_type', sa.String(length=50), nullable=True),
+        sa.Column('refresh_token', sa.String(length=2000), nullable=True),
+        sa.Column('scope', sa.String(length=500), nullable=True),
+        sa.Column('upd_dt', sa.String(length=19), nullable=True),
+        sa.Column('ins_dt', sa.String(length=19), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_kakao_talk', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_kakao_talk_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_kma_neighborhood_forecast' not in existing:
+        op.create_table('dbms_kma_neighborhood_forecast',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=True),
+        sa.Column('strd_tm', sa.String(length=4), nullable=True),
+        sa.Column('category', sa.String(length=20), nullable=True),
+        sa.Column('nx', sa.Integer(), nullable=True),
+        sa.Column('ny', sa.Integer(), nullable=True),
+        sa.Column('obsr_value', sa.String(length=20), nullable=True),
+        sa.Column('ins_dt', sa.String(length=19), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_kma_neighborhood_forecast', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_kma_neighborhood_forecast_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_market_indicator' not in existing:
+        op.create_table('dbms_market_indicator',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source', sa.String(length=10), nullable=False),
+        sa.Column('code', sa.String(length=50), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=True),
+        sa.Column('strd_dt', sa.String(length=8), nullable=False),
+        sa.Column('trade_dt', sa.String(length=8), nullable=True),
+        sa.Column('close_price', sa.Float(), nullable=True),
+        sa.Column('change_rate', sa.Float(), nullable=True),
+        sa.Column('ma5', sa.Float(), nullable=True),
+        sa.Column('ma20', sa.Float(), nullable=True),
+        sa.Column('ma60', sa.Float(), nullable=True),
+        sa.Column('volatility20', sa.Float(), nullable=True),
+        sa.Column('volume_zscore20', sa.Float(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_market_indicator', schema=None) as batch_op:
+            batch_op.create_index('ix_market_indicator_source_strd_dt', ['source', 'strd_dt'], unique=False)
+            batch_op.create_index('ux_market_indicator_source_code_strd_dt', ['source', 'code', 'strd_dt'], unique=True)
+
+    if 'dbms_market_ohlcv' not in existing:
+        op.create_table('dbms_market_ohlcv',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('symbol', sa.String(length=20), nullable=False),
+        sa.Column('market', sa.String(length=50), nullable=False),
+        sa.Column('trade_dt', sa.String(length=8), nullable=False),
+        sa.Column('opening_price', sa.Float(), nullable=True),
+        sa.Column('high_price', sa.Float(), nullable=True),
+        sa.Column('low_price', sa.Float(), nullable=True),
+        sa.Column('closing_price', sa.Float(), nullable=True),
+        sa.Column('volume', sa.BigInteger(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_market_ohlcv', schema=None) as batch_op:
+            batch_op.create_index('ux_market_ohlcv_symbol_trade_dt', ['symbol', 'trade_dt'], unique=True)
+
+    if 'dbms_market_stock' not in existing:
+        op.create_table('dbms_market_stock',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=True),
+        sa.Column('market', sa.String(length=50), nullable=True),
+        sa.Column('stock_day', sa.String(length=10), nullable=True),
+        sa.Column('opening_price', sa.Float(), nullable=True),
+        sa.Column('high_price', sa.Float(), nullable=True),
+        sa.Column('low_price', sa.Float(), nullable=True),
+        sa.Column('closing_price', sa.Float(), nullable=True),
+        sa.Column('volume', sa.BigInteger(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_market_stock', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_market_stock_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_naver_finance' not in existing:
+        op.create_table('dbms_naver_finance',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('stock_cd', sa.String(length=20), nullable=True),
+        sa.Column('stock_nm', sa.String(length=100), nullable=True),
+        sa.Column('pre_price', sa.BigInteger(), nullable=True),
+        sa.Column('today_price', sa.BigInteger(), nullable=True),
+        sa.Column('trading_volume', sa.BigInteger(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_naver_finance', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_naver_finance_ins_dt'), ['ins_dt'], unique=False)
+            batch_op.create_index(batch_op.f('ix_dbms_naver_finance_stock_cd'), ['stock_cd'], unique=False)
+            batch_op.create_index(batch_op.f('ix_dbms_naver_finance_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_public_apt_trade' not in existing:
+        op.create_table('dbms_public_apt_trade',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('sgg_cd', sa.String(length=20), nullable=True),
+        sa.Column('road_nm', sa.String(length=200), nullable=True),
+        sa.Column('apt_nm', sa.String(length=200), nullable=True),
+        sa.Column('excul_use_area', sa.Float(), nullable=True),
+        sa.Column('deal_year', sa.String(length=4), nullable=True),
+        sa.Column('deal_amount', sa.String(length=50), nullable=True),
+        sa.Column('floor', sa.String(length=10), nullable=True),
+        sa.Column('build_year', sa.String(length=4), nullable=True),
+        sa.Column('ins_dt', sa.String(length=19), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_public_apt_trade', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_public_apt_trade_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_rollup_blog_keword_daily' not in existing:
+        op.create_table('dbms_rollup_blog_keword_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=False),
+        sa.Column('keword', sa.String(length=200), nullable=True),
+        sa.Column('row_cnt', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_rollup_blog_keword_daily', schema=None) as batch_op:
+            batch_op.create_index('ix_rollup_blog_keword_daily_strd_dt', ['strd_dt', 'keword'], unique=False)
+
+    if 'dbms_rollup_ev_sido_daily' not in existing:
+        op.create_table('dbms_rollup_ev_sido_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=False),
+        sa.Column('sido_nm', sa.String(length=50), nullable=True),
+        sa.Column('value', sa.BigInteger(), nullable=True),
+        sa.Column('row_cnt', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_rollup_ev_sido_daily', schema=None) as batch_op:
+            batch_op.create_index('ix_rollup_ev_sido_daily_strd_dt', ['strd_dt', 'sido_nm'], unique=False)
+
+    if 'dbms_rollup_jeju_flo_pop_daily' not in existing:
+        op.create_table('dbms_rollup_jeju_flo_pop_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=False),
+        sa.Column('city', sa.String(length=50), nullable=True),
+        sa.Column('emd', sa.String(length=50), nullable=True),
+        sa.Column('resd_pop', sa.BigInteger(), nullable=True),
+        sa.Column('work_pop', sa.BigInteger(), nullable=True),
+        sa.Column('visit_pop', sa.BigInteger(), nullable=True),
+        sa.Column('row_cnt', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_rollup_jeju_flo_pop_daily', schema=None) as batch_op:
+            batch_op.create_index('ix_rollup_jeju_flo_pop_daily_strd_dt', ['strd_dt', 'city', 'emd'], unique=False)
+
+    if 'dbms_rollup_seoul_for_pop_daily' not in existing:
+        op.create_table('dbms_rollup_seoul_for_pop_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=False),
+        sa.Column('adstrd_code_se', sa.String(length=10), nullable=True),
+        sa.Column('tot_lvpop_co', sa.BigInteger(), nullable=True),
+        sa.Column('china_staypop_co', sa.BigInteger(), nullable=True),
+        sa.Column('etc_staypop_co', sa.BigInteger(), nullable=True),
+        sa.Column('row_cnt', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_rollup_seoul_for_pop_daily', schema=None) as batch_op:
+            batch_op.create_index('ix_rollup_seoul_for_pop_daily_strd_dt', ['strd_dt', 'adstrd_code_se'], unique=False)
+
+    if 'dbms_rollup_youtube_keword_daily' not in existing:
+        op.create_table('dbms_rollup_youtube_keword_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=False),
+        sa.Column('keword', sa.String(length=200), nullable=True),
+        sa.Column('video_cnt', sa.Integer(), nullable=True),
+        sa.Column('row_cnt', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_rollup_youtube_keword_daily', schema=None) as batch_op:
+            batch_op.create_index('ix_rollup_youtube_keword_daily_strd_dt', ['strd_dt', 'keword'], unique=False)
+
+    if 'dbms_seoul_api_spop_forn_long_resd_jachi' not in existing:
+        op.create_table('dbms_seoul_api_spop_forn_long_resd_jachi',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=8), nullable=True),
+        sa.Column('stdr_de_id', sa.String(length=8), nullable=True),
+        sa.Column('tmzon_pd_se', sa.String(length=2), nullable=True),
+        sa.Column('adstrd_code_se', sa.String(length=10), nullable=True),
+        sa.Column('tot_lvpop_co', sa.Integer(), nullable=True),
+        sa.Column('china_staypop_co', sa.Integer(), nullable=True),
+        sa.Column('etc_staypop_co', sa.Integer(), nullable=True),
+        sa.Column('ins_dt', sa.String(length=19), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_seoul_api_spop_forn_long_resd_jachi', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_seoul_api_spop_forn_long_resd_jachi_strd_dt'), ['strd_dt'], unique=False)
+
+    if 'dbms_youtube_keword' not in existing:
+        op.create_table('dbms_youtube_keword',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('strd_dt', sa.String(length=10), nullable=True),
+        sa.Column('keword', sa.String(length=200), nullable=True),
+        sa.Column('link', sa.String(length=1000), nullable=True),
+        sa.Column('video_id', sa.String(length=50), nullable=True),
+        sa.Column('main_text', sa.String(length=500), nullable=True),
+        sa.Column('comment_author', sa.String(length=200), nullable=True),
+        sa.Column('ins_dt', sa.String(length=14), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('dbms_youtube_keword', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_dbms_youtube_keword_ins_dt'), ['ins_dt'], unique=False)
+            batch_op.create_index(batch_op.f('ix_dbms_youtube_keword_strd_dt'), ['strd_dt'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('dbms_youtube_keword', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_youtube_keword_strd_dt'))
+        batch_op.drop_index(batch_op.f('ix_dbms_youtube_keword_ins_dt'))
+
+    op.drop_table('dbms_youtube_keword')
+    with op.batch_alter_table('dbms_seoul_api_spop_forn_long_resd_jachi', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_seoul_api_spop_forn_long_resd_jachi_strd_dt'))
+
+    op.drop_table('dbms_seoul_api_spop_forn_long_resd_jachi')
+    with op.batch_alter_table('dbms_rollup_youtube_keword_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_rollup_youtube_keword_daily_strd_dt')
+
+    op.drop_table('dbms_rollup_youtube_keword_daily')
+    with op.batch_alter_table('dbms_rollup_seoul_for_pop_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_rollup_seoul_for_pop_daily_strd_dt')
+
+    op.drop_table('dbms_rollup_seoul_for_pop_daily')
+    with op.batch_alter_table('dbms_rollup_jeju_flo_pop_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_rollup_jeju_flo_pop_daily_strd_dt')
+
+    op.drop_table('dbms_rollup_jeju_flo_pop_daily')
+    with op.batch_alter_table('dbms_rollup_ev_sido_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_rollup_ev_sido_daily_strd_dt')
+
+    op.drop_table('dbms_rollup_ev_sido_daily')
+    with op.batch_alter_table('dbms_rollup_blog_keword_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_rollup_blog_keword_daily_strd_dt')
+
+    op.drop_table('dbms_rollup_blog_keword_daily')
+    with op.batch_alter_table('dbms_public_apt_trade', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_public_apt_trade_strd_dt'))
+
+    op.drop_table('dbms_public_apt_trade')
+    with op.batch_alter_table('dbms_naver_finance', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_naver_finance_strd_dt'))
+        batch_op.drop_index(batch_op.f('ix_dbms_naver_finance_stock_cd'))
+        batch_op.drop_index(batch_op.f('ix_dbms_naver_finance_ins_dt'))
+
+    op.drop_table('dbms_naver_finance')
+    with op.batch_alter_table('dbms_market_stock', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_market_stock_strd_dt'))
+
+    op.drop_table('dbms_market_stock')
+    with op.batch_alter_table('dbms_market_ohlcv', schema=None) as batch_op:
+        batch_op.drop_index('ux_market_ohlcv_symbol_trade_dt')
+
+    op.drop_table('dbms_market_ohlcv')
+    with op.batch_alter_table('dbms_market_indicator', schema=None) as batch_op:
+        batch_op.drop_index('ux_market_indicator_source_code_strd_dt')
+        batch_op.drop_index('ix_market_indicator_source_strd_dt')
+
+    op.drop_table('dbms_market_indicator')
+    with op.batch_alter_table('dbms_kma_neighborhood_forecast', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_kma_neighborhood_forecast_strd_dt'))
+
+    op.drop_table('dbms_kma_neighborhood_forecast')
+    with op.batch_alter_table('dbms_kakao_talk', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_kakao_talk_strd_dt'))
+
+    op.drop_table('dbms_kakao_talk')
+    with op.batch_alter_table('dbms_kakao_ai_image', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_kakao_ai_image_strd_dt'))
+
+    op.drop_table('dbms_kakao_ai_image')
+    with op.batch_alter_table('dbms_jeju_api_floating_population', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_jeju_api_floating_population_strd_dt'))
+
+    op.drop_table('dbms_jeju_api_floating_population')
+    with op.batch_alter_table('dbms_ev_car_portal', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_dbms_ev_car_portal_strd_dt'))
+        batch_op.drop_index(batch_op.f('ix_dbms_ev_car_portal_ins_dt'))
+
+    op.drop_table('dbms_ev_car_portal')
+    op.drop_table('dbms_blog_keword_registry')
+    with op.batch_alter_table('dbms_blog_keword', schema=None) as batch_op:
+        batch_op.drop_index('ux_blog_keword_link', mysql_length={'keword': 191, 'link': 512})
+        batch_op.drop_index(batch_op.f('ix_dbms_blog_keword_strd_dt'))
+        batch_op.drop_index(batch_op.f('ix_dbms_blog_keword_ins_dt'))
+
+    op.drop_table('dbms_blog_keword')
+    with op.batch_alter_table('api_batch_stat', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_api_batch_stat_strd_dt'))
+
+    op.drop_table('api_batch_stat')
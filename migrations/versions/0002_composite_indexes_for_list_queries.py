@@ -0,0 +1,125 @@
+"""composite indexes for list queries
+
+목록 API(strd_dt 필터 + ins_dt desc, id desc 또는 id desc 정렬)와
+(strd_dt, keword) / (strd_dt, api_nm) 조회·삭제 조건에 맞춘 복합 인덱스
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 17:16:13.440431
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 새 복합 인덱스를 먼저 만든 뒤, 선두 컬럼이 겹치는 기존 strd_dt 단일 인덱스를 제거
+    with op.batch_alter_table('api_batch_stat', schema=None) as batch_op:
+        batch_op.create_index('ix_api_batch_stat_strd_dt_api_nm', ['strd_dt', 'api_nm'], unique=False)
+        batch_op.create_index('ix_api_batch_stat_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_api_batch_stat_strd_dt'))
+
+    with op.batch_alter_table('dbms_blog_keword', schema=None) as batch_op:
+        batch_op.create_index('ix_blog_keword_strd_dt_ins_dt', ['strd_dt', 'ins_dt', 'id'], unique=False)
+        batch_op.create_index('ix_blog_keword_strd_dt_keword', ['strd_dt', 'keword'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_blog_keword_strd_dt'))
+
+    with op.batch_alter_table('dbms_ev_car_portal', schema=None) as batch_op:
+        batch_op.create_index('ix_ev_car_portal_strd_dt_ins_dt', ['strd_dt', 'ins_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_ev_car_portal_strd_dt'))
+
+    with op.batch_alter_table('dbms_jeju_api_floating_population', schema=None) as batch_op:
+        batch_op.create_index('ix_jeju_flo_pop_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_jeju_api_floating_population_strd_dt'))
+
+    with op.batch_alter_table('dbms_kakao_ai_image', schema=None) as batch_op:
+        batch_op.create_index('ix_kakao_ai_image_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_kakao_ai_image_strd_dt'))
+
+    with op.batch_alter_table('dbms_kakao_talk', schema=None) as batch_op:
+        batch_op.create_index('ix_kakao_talk_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_kakao_talk_strd_dt'))
+
+    with op.batch_alter_table('dbms_kma_neighborhood_forecast', schema=None) as batch_op:
+        batch_op.create_index('ix_kma_forecast_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_kma_neighborhood_forecast_strd_dt'))
+
+    with op.batch_alter_table('dbms_market_stock', schema=None) as batch_op:
+        batch_op.create_index('ix_market_stock_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_market_stock_strd_dt'))
+
+    with op.batch_alter_table('dbms_naver_finance', schema=None) as batch_op:
+        batch_op.create_index('ix_naver_finance_strd_dt_ins_dt', ['strd_dt', 'ins_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_naver_finance_strd_dt'))
+
+    with op.batch_alter_table('dbms_public_apt_trade', schema=None) as batch_op:
+        batch_op.create_index('ix_public_apt_trade_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_public_apt_trade_strd_dt'))
+
+    with op.batch_alter_table('dbms_seoul_api_spop_forn_long_resd_jachi', schema=None) as batch_op:
+        batch_op.create_index('ix_seoul_for_pop_strd_dt_id', ['strd_dt', 'id'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_seoul_api_spop_forn_long_resd_jachi_strd_dt'))
+
+    with op.batch_alter_table('dbms_youtube_keword', schema=None) as batch_op:
+        batch_op.create_index('ix_youtube_keword_strd_dt_ins_dt', ['strd_dt', 'ins_dt', 'id'], unique=False)
+        batch_op.create_index('ix_youtube_keword_strd_dt_keword', ['strd_dt', 'keword'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_dbms_youtube_keword_strd_dt'))
+
+
+def downgrade():
+    with op.batch_alter_table('dbms_youtube_keword', schema=None) as batch_op:
+        batch_op.drop_index('ix_youtube_keword_strd_dt_keword')
+        batch_op.drop_index('ix_youtube_keword_strd_dt_ins_dt')
+        batch_op.create_index(batch_op.f('ix_dbms_youtube_keword_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_seoul_api_spop_forn_long_resd_jachi', schema=None) as batch_op:
+        batch_op.drop_index('ix_seoul_for_pop_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_seoul_api_spop_forn_long_resd_jachi_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_public_apt_trade', schema=None) as batch_op:
+        batch_op.drop_index('ix_public_apt_trade_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_public_apt_trade_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_naver_finance', schema=None) as batch_op:
+        batch_op.drop_index('ix_naver_finance_strd_dt_ins_dt')
+        batch_op.create_index(batch_op.f('ix_dbms_naver_finance_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_market_stock', schema=None) as batch_op:
+        batch_op.drop_index('ix_market_stock_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_market_stock_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_kma_neighborhood_forecast', schema=None) as batch_op:
+        batch_op.drop_index('ix_kma_forecast_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_kma_neighborhood_forecast_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_kakao_talk', schema=None) as batch_op:
+        batch_op.drop_index('ix_kakao_talk_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_kakao_talk_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_kakao_ai_image', schema=None) as batch_op:
+        batch_op.drop_index('ix_kakao_ai_image_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_kakao_ai_image_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_jeju_api_floating_population', schema=None) as batch_op:
+        batch_op.drop_index('ix_jeju_flo_pop_strd_dt_id')
+        batch_op.create_index(batch_op.f('ix_dbms_jeju_api_floating_population_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_ev_car_portal', schema=None) as batch_op:
+        batch_op.drop_index('ix_ev_car_portal_strd_dt_ins_dt')
+        batch_op.create_index(batch_op.f('ix_dbms_ev_car_portal_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('dbms_blog_keword', schema=None) as batch_op:
+        batch_op.drop_index('ix_blog_keword_strd_dt_keword')
+        batch_op.drop_index('ix_blog_keword_strd_dt_ins_dt')
+        batch_op.create_index(batch_op.f('ix_dbms_blog_keword_strd_dt'), ['strd_dt'], unique=False)
+
+    with op.batch_alter_table('api_batch_stat', schema=None) as batch_op:
+        batch_op.drop_index('ix_api_batch_stat_strd_dt_id')
+        batch_op.drop_index('ix_api_batch_stat_strd_dt_api_nm')
+        batch_op.create_index(batch_op.f('ix_api_batch_stat_strd_dt'), ['strd_dt'], unique=False)
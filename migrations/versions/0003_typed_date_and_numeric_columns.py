@@ -0,0 +1,255 @@
+"""typed date and numeric columns
+
+문자열로 저장하던 날짜/일시/숫자 컬럼을 DATE/DATETIME/숫자 타입으로 변환하고 기존 값을 백필합니다.
+애플리케이션에서는 app.common.types의 컬럼 타입이 기존 문자열 형식으로 다시 변환합니다.
+NOT NULL 컬럼은 NOT NULL을 유지하고, 변환할 수 없는 값은 NULL 대신 대체값(FALLBACK)으로 채웁니다.
+제주 유동인구 regist_dt는 원본 길이(8/10자리 등)가 일정하지 않아 문자열 그대로 둡니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 18:02:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+DATE, DATETIME, YEAR, AMOUNT, DECIMAL = "date", "datetime", "year", "amount", "decimal"
+
+# (테이블, 컬럼, 변환 종류, 기존 문자열 길이)
+COLUMNS = [
+    ("dbms_naver_finance", "strd_dt", DATE, 10),
+    ("dbms_naver_finance", "ins_dt", DATETIME, 14),
+    ("dbms_ev_car_portal", "strd_dt", DATE, 10),
+    ("dbms_ev_car_portal", "ins_dt", DATETIME, 14),
+    ("dbms_market_stock", "strd_dt", DATE, 8),
+    ("dbms_market_stock", "ins_dt", DATETIME, 20),
+    ("dbms_market_ohlcv", "trade_dt", DATE, 8),
+    ("dbms_market_ohlcv", "ins_dt", DATETIME, 14),
+    ("dbms_market_indicator", "strd_dt", DATE, 8),
+    ("dbms_market_indicator", "trade_dt", DATE, 8),
+    ("dbms_market_indicator", "ins_dt", DATETIME, 14),
+    ("dbms_blog_keword", "strd_dt", DATE, 10),
+    ("dbms_blog_keword", "ins_dt", DATETIME, 14),
+    ("dbms_blog_keword_registry", "newest_postdate", DATE, 8),
+    ("dbms_blog_keword_registry", "upd_dt", DATETIME, 14),
+    ("dbms_blog_keword_registry", "ins_dt", DATETIME, 14),
+    ("dbms_youtube_keword", "strd_dt", DATE, 10),
+    ("dbms_youtube_keword", "ins_dt", DATETIME, 14),
+    ("dbms_kakao_ai_image", "strd_dt", DATE, 10),
+    ("dbms_kakao_talk", "strd_dt", DATE, 10),
+    ("dbms_kakao_talk", "ins_dt", DATETIME, 19),
+    ("dbms_public_apt_trade", "strd_dt", DATE, 10),
+    ("dbms_public_apt_trade", "deal_year", YEAR, 4),
+    ("dbms_public_apt_trade", "deal_amount", AMOUNT, 50),
+    ("dbms_public_apt_trade", "ins_dt", DATETIME, 19),
+    ("dbms_kma_neighborhood_forecast", "strd_dt", DATE, 8),
+    ("dbms_kma_neighborhood_forecast", "obsr_value", DECIMAL, 20),
+    ("dbms_kma_neighborhood_forecast", "ins_dt", DATETIME, 19),
+    ("dbms_jeju_api_floating_population", "strd_dt", DATE, 8),
+    ("dbms_jeju_api_floating_population", "ins_dt", DATETIME, 19),
+    ("dbms_seoul_api_spop_forn_long_resd_jachi", "strd_dt", DATE, 8),
+    ("dbms_seoul_api_spop_forn_long_resd_jachi", "stdr_de_id", DATE, 8),
+    ("dbms_seoul_api_spop_forn_long_resd_jachi", "ins_dt", DATETIME, 19),
+    ("api_batch_stat", "strd_dt", DATE, 8),
+    ("api_batch_stat", "ins_dt", DATETIME, 19),
+] + [
+    (table, column, kind, length)
+    for table in ("dbms_rollup_jeju_flo_pop_daily", "dbms_rollup_seoul_for_pop_daily", "dbms_rollup_ev_sido_daily",
+                  "dbms_rollup_youtube_keword_daily", "dbms_rollup_blog_keword_daily")
+    for column, kind, length in (("strd_dt", DATE, 8), ("ins_dt", DATETIME, 14))
+]
+
+NEW_TYPES = {
+    DATE: sa.Date(),
+    DATETIME: sa.DateTime(),
+    YEAR: sa.SmallInteger(),
+    AMOUNT: sa.BigInteger(),
+    DECIMAL: sa.Numeric(12, 3),
+}
+
+
+# NOT NULL 컬럼에서 변환할 수 없는 값의 대체값 (일시는 마이그레이션 시각, 날짜는 1970-01-01, 숫자는 0)
+FALLBACK = {
+    "mysql": {DATE: "'19700101'", DATETIME: "DATE_FORMAT(NOW(), '%Y%m%d%H%i%s')"},
+    "sqlite": {DATE: "'19700101'", DATETIME: "strftime('%Y%m%d%H%M%S', 'now', 'localtime')"},
+    "postgresql": {DATE: "DATE '1970-01-01'", DATETIME: "LOCALTIMESTAMP(0)"},
+}
+
+
+def _fallback(dialect, kind):
+    return FALLBACK[dialect].get(kind, "0")
+
+
+def _by_table():
+    tables = {}
+    for table, column, kind, length in COLUMNS:
+        tables.setdefault(table, []).append((column, kind, length))
+    return tables
+
+
+def _digits(column):
+    return f"REGEXP_REPLACE({column}, '[^0-9]', '')"
+
+
+# ---- PostgreSQL: ALTER COLUMN ... TYPE ... USING 으로 변환과 백필을 한 번에 처리 ----
+def _pg_using(column, kind):
+    digits = f"NULLIF(REGEXP_REPLACE({column}, '[^0-9]', '', 'g'), '')"
+    if kind == DATE:
+        return f"TO_DATE(LEFT({digits}, 8), 'YYYYMMDD')"
+    if kind == DATETIME:
+        return f"TO_TIMESTAMP(RPAD(LEFT({digits}, 14), 14, '0'), 'YYYYMMDDHH24MISS')"
+    if kind == YEAR:
+        return f"{digits}::smallint"
+    if kind == AMOUNT:
+        return f"NULLIF(REGEXP_REPLACE({column}, '[^0-9-]', '', 'g'), '')::bigint"
+    return f"CASE WHEN TRIM({column}) ~ '^-?[0-9]+(\\.[0-9]+)?$' THEN TRIM({column})::numeric(12, 3) END"
+
+
+def _pg_back(column, kind):
+    if kind == DATE:
+        return f"TO_CHAR({column}, 'YYYYMMDD')"
+    if kind == DATETIME:
+        return f"TO_CHAR({column}, 'YYYYMMDDHH24MISS')"
+    if kind == YEAR:
+        return f"LPAD({column}::text, 4, '0')"
+    if kind == AMOUNT:
+        return f"TO_CHAR({column}, 'FM999,999,999,999')"
+    return f"TRIM(TRAILING '.' FROM TRIM(TRAILING '0' FROM {column}::text))"
+
+
+# ---- MySQL: 값을 변환 가능한 형태로 먼저 정리(UPDATE)한 뒤 MODIFY ----
+#      empty: 변환할 수 없는 값에 넣을 값 (NULL 허용 컬럼은 NULL, NOT NULL 컬럼은 FALLBACK)
+def _mysql_prepare(table, column, kind, empty="NULL"):
+    if kind in (DATE, DATETIME, YEAR):
+        width = {DATE: 8, DATETIME: 14, YEAR: 4}[kind]
+        value = f"LEFT({_digits(column)}, {width})"
+        if kind == DATETIME:
+            value = f"RPAD({value}, 14, '0')"
+        op.execute(f"UPDATE {table} SET {column} = COALESCE(NULLIF({value}, REPEAT('0', {width})), {empty}) WHERE {column} IS NOT NULL")
+        op.execute(f"UPDATE {table} SET {column} = {empty} WHERE {column} = ''")
+    elif kind == AMOUNT:
+        op.execute(f"UPDATE {table} SET {column} = COALESCE(NULLIF(REGEXP_REPLACE({column}, '[^0-9-]', ''), ''), {empty}) "
+                   f"WHERE {column} IS NOT NULL")
+    else:
+        op.execute(f"UPDATE {table} SET {column} = {empty} WHERE TRIM({column}) NOT REGEXP '^-?[0-9]+(\\\\.[0-9]+)?$'")
+
+
+def _mysql_back(table, column, kind):
+    if kind == DATE:
+        op.execute(f"UPDATE {table} SET {column} = REPLACE({column}, '-', '')")
+    elif kind == DATETIME:
+        op.execute(f"UPDATE {table} SET {column} = {_digits(column)}")
+    elif kind == AMOUNT:
+        op.execute(f"UPDATE {table} SET {column} = FORMAT({column}, 0)")
+
+
+# ---- SQLite: batch 모드(테이블 재생성)의 CAST(NUMERIC 친화도)에도 값이 보존되도록 숫자만 남긴 뒤 타입 변경,
+#      이후 날짜/일시는 SQLAlchemy Date/DateTime 저장 형식('YYYY-MM-DD', 'YYYY-MM-DD HH:MM:SS.000000')으로 변환 ----
+def _sqlite_prepare(table, column, kind, empty="NULL"):
+    digits = f"REPLACE(REPLACE(REPLACE(REPLACE(TRIM({column}), '-', ''), ':', ''), ' ', ''), '.', '')"
+    if kind in (DATE, DATETIME, YEAR):
+        width = {DATE: 8, DATETIME: 14, YEAR: 4}[kind]
+        value = f"SUBSTR({digits}, 1, {width})"
+        if kind == DATETIME:
+            value = f"SUBSTR({value} || '000000', 1, 14)"
+        op.execute(f"UPDATE {table} SET {column} = CASE WHEN {digits} = '' OR {digits} GLOB '*[^0-9]*' THEN {empty} "
+                   f"ELSE {value} END WHERE {column} IS NOT NULL")
+    elif kind == AMOUNT:
+        op.execute(f"UPDATE {table} SET {column} = COALESCE(NULLIF(REPLACE(TRIM({column}), ',', ''), ''), {empty}) "
+                   f"WHERE {column} IS NOT NULL")
+    else:
+        op.execute(f"UPDATE {table} SET {column} = {empty} "
+                   f"WHERE NOT (TRIM({column}) GLOB '*[0-9]*' AND TRIM({column}) NOT GLOB '*[^0-9.-]*')")
+
+
+def _sqlite_format(table, column, kind):
+    if kind == DATE:
+        value = f"SUBSTR({column}, 1, 4) || '-' || SUBSTR({column}, 5, 2) || '-' || SUBSTR({column}, 7, 2)"
+    elif kind == DATETIME:
+        value = (f"SUBSTR({column}, 1, 4) || '-' || SUBSTR({column}, 5, 2) || '-' || SUBSTR({column}, 7, 2) || ' ' || "
+                 f"SUBSTR({column}, 9, 2) || ':' || SUBSTR({column}, 11, 2) || ':' || SUBSTR({column}, 13, 2) || '.000000'")
+    else:
+        return
+    op.execute(f"UPDATE {table} SET {column} = {value} WHERE {column} IS NOT NULL")
+
+
+def _sqlite_back(table, column, kind):
+    if kind in (DATE, DATETIME):
+        width = 8 if kind == DATE else 14
+        op.execute(f"UPDATE {table} SET {column} = SUBSTR(REPLACE(REPLACE(REPLACE({column}, '-', ''), ':', ''), ' ', ''), 1, {width})")
+    elif kind == YEAR:
+        op.execute(f"UPDATE {table} SET {column} = printf('%04d', {column}) WHERE {column} IS NOT NULL")
+    elif kind == AMOUNT:
+        op.execute(f"UPDATE {table} SET {column} = printf('%,d', {column}) WHERE {column} IS NOT NULL")
+
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _nullable(table):
+    """컬럼별 현재 NULL 허용 여부 (alter_column의 existing_nullable - MySQL MODIFY가 NOT NULL을 지우지 않도록)"""
+    return {column["name"]: column["nullable"] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    existing = _existing_tables()
+    for table, columns in _by_table().items():
+        if table not in existing:
+            continue
+        nullable = _nullable(table)
+        if dialect == "postgresql":
+            for column, kind, length in columns:
+                using = _pg_using(column, kind)
+                if not nullable[column]:
+                    using = f"COALESCE({using}, {_fallback(dialect, kind)})"
+                op.alter_column(table, column, type_=NEW_TYPES[kind], existing_type=sa.String(length),
+                                existing_nullable=nullable[column], postgresql_using=using)
+            continue
+
+        for column, kind, length in columns:
+            empty = "NULL" if nullable[column] or dialect not in FALLBACK else _fallback(dialect, kind)
+            if dialect == "mysql":
+                _mysql_prepare(table, column, kind, empty)
+            elif dialect == "sqlite":
+                _sqlite_prepare(table, column, kind, empty)
+        with op.batch_alter_table(table) as batch_op:
+            for column, kind, length in columns:
+                batch_op.alter_column(column, type_=NEW_TYPES[kind], existing_type=sa.String(length),
+                                      existing_nullable=nullable[column])
+        if dialect == "sqlite":
+            for column, kind, length in columns:
+                _sqlite_format(table, column, kind)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    existing = _existing_tables()
+    for table, columns in _by_table().items():
+        if table not in existing:
+            continue
+        nullable = _nullable(table)
+        if dialect == "postgresql":
+            for column, kind, length in columns:
+                op.alter_column(table, column, type_=sa.String(length), existing_type=NEW_TYPES[kind],
+                                existing_nullable=nullable[column], postgresql_using=_pg_back(column, kind))
+            continue
+
+        with op.batch_alter_table(table) as batch_op:
+            for column, kind, length in columns:
+                batch_op.alter_column(column, type_=sa.String(length), existing_type=NEW_TYPES[kind],
+                                      existing_nullable=nullable[column])
+        for column, kind, length in columns:
+            if dialect == "mysql":
+                _mysql_back(table, column, kind)
+            elif dialect == "sqlite":
+                _sqlite_back(table, column, kind)
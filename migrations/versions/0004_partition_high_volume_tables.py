@@ -0,0 +1,155 @@
+"""partition high volume tables by strd_dt month
+
+dbms_youtube_keword / dbms_kma_neighborhood_forecast / dbms_jeju_api_floating_population 을
+strd_dt 월 단위 RANGE 파티션으로 전환합니다. (보관 기간 정리 시 DELETE 대신 파티션 DROP)
+
+- MySQL: 파티션 키가 모든 유니크 키에 포함되어야 하므로 PK를 (id, strd_dt)로 변경 후 PARTITION BY RANGE COLUMNS
+- PostgreSQL: 기존 테이블을 *_legacy로 바꾸고 파티션 테이블을 새로 만들어 데이터를 옮김 (PK (id, strd_dt))
+- SQLite 등 파티션을 지원하지 않는 DB는 변경 없음 (app.service.retention이 strd_dt 단위 DELETE로 정리)
+
+파티션 키 컬럼은 NULL을 허용하지 않으므로 strd_dt가 비어 있는 행은 ins_dt 날짜로 채웁니다.
+이후 월 파티션 추가는 app.service.retention.ensure_partitions가 담당합니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 18:40:07.512385
+
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+# 테이블 → 인덱스 (이름, 컬럼)
+TABLES = {
+    "dbms_youtube_keword": [
+        ("ix_dbms_youtube_keword_ins_dt", ["ins_dt"]),
+        ("ix_youtube_keword_strd_dt_ins_dt", ["strd_dt", "ins_dt", "id"]),
+        ("ix_youtube_keword_strd_dt_keword", ["strd_dt", "keword"]),
+    ],
+    "dbms_kma_neighborhood_forecast": [
+        ("ix_kma_forecast_strd_dt_id", ["strd_dt", "id"]),
+    ],
+    "dbms_jeju_api_floating_population": [
+        ("ix_jeju_flo_pop_strd_dt_id", ["strd_dt", "id"]),
+    ],
+}
+MONTHS_AHEAD = 2
+
+
+def _add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _months(conn, table):
+    """기존 데이터의 최소 월부터 이번 달 + MONTHS_AHEAD 까지의 월 시작일 목록"""
+    first = conn.execute(sa.text(f"SELECT MIN(strd_dt) FROM {table}")).scalar()
+    this_month = date.today().replace(day=1)
+    start = date(first.year, first.month, 1) if first else this_month
+    start = min(start, this_month)
+    months = []
+    while start <= _add_months(this_month, MONTHS_AHEAD):
+        months.append(start)
+        start = _add_months(start, 1)
+    return months
+
+
+def _fill_strd_dt(table, dialect):
+    if dialect == "mysql":
+        op.execute(f"UPDATE {table} SET strd_dt = COALESCE(DATE(ins_dt), CURRENT_DATE) WHERE strd_dt IS NULL")
+    else:
+        op.execute(f"UPDATE {table} SET strd_dt = COALESCE(ins_dt::date, CURRENT_DATE) WHERE strd_dt IS NULL")
+
+
+def _upgrade_mysql(conn, table):
+    _fill_strd_dt(table, "mysql")
+    op.execute(f"ALTER TABLE {table} MODIFY strd_dt DATE NOT NULL, DROP PRIMARY KEY, ADD PRIMARY KEY (id, strd_dt)")
+    partitions = ", ".join(
+        f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{_add_months(month, 1).isoformat()}')"
+        for month in _months(conn, table)
+    )
+    op.execute(f"ALTER TABLE {table} PARTITION BY RANGE COLUMNS(strd_dt) "
+               f"({partitions}, PARTITION pmax VALUES LESS THAN (MAXVALUE))")
+
+
+def _downgrade_mysql(table):
+    op.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+    op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id), MODIFY strd_dt DATE NULL")
+
+
+def _upgrade_postgresql(conn, table, indexes):
+    legacy = f"{table}_legacy"
+    _fill_strd_dt(table, "postgresql")
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+    for name, _ in indexes:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute(f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (strd_dt)")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN strd_dt SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, strd_dt)")
+    # id 시퀀스가 기존 테이블 삭제 시 함께 지워지지 않도록 소유 테이블 변경
+    op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq OWNED BY {table}.id")
+    for month in _months(conn, legacy):
+        op.execute(f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+                   f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')")
+    op.execute(f"CREATE TABLE {table}_pdefault PARTITION OF {table} DEFAULT")
+    for name, columns in indexes:
+        op.create_index(name, table, columns)
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    op.execute(f"DROP TABLE {legacy}")
+
+
+def _downgrade_postgresql(table, indexes):
+    partitioned = f"{table}_partitioned"
+    op.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+    op.execute(f"ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey")
+    for name, _ in indexes:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute(f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS)")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN strd_dt DROP NOT NULL")
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)")
+    op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq OWNED BY {table}.id")
+    for name, columns in indexes:
+        op.create_index(name, table, columns)
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned}")
+    op.execute(f"DROP TABLE {partitioned} CASCADE")
+
+
+def upgrade():
+    conn = op.get_bind()
+    dialect = conn.dialect.name
+    if dialect not in ("mysql", "postgresql"):
+        return
+    existing = set(sa.inspect(conn).get_table_names())
+    for table, indexes in TABLES.items():
+        if table not in existing:
+            continue
+        if dialect == "mysql":
+            _upgrade_mysql(conn, table)
+        else:
+            _upgrade_postgresql(conn, table, indexes)
+
+
+def downgrade():
+    conn = op.get_bind()
+    dialect = conn.dialect.name
+    if dialect not in ("mysql", "postgresql"):
+        return
+    existing = set(sa.inspect(conn).get_table_names())
+    for table, indexes in TABLES.items():
+        if table not in existing:
+            continue
+        if dialect == "mysql":
+            _downgrade_mysql(table)
+        else:
+            _downgrade_postgresql(table, indexes)
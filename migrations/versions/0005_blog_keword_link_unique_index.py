@@ -0,0 +1,43 @@
+"""blog keword/link unique index for existing databases
+
+0001은 dbms_blog_keword가 없을 때만 테이블과 함께 ux_blog_keword_link를 만들기 때문에
+create_all로 만들어져 있던 기존 DB에는 유니크 인덱스가 없습니다.
+(keword, link) 기준 중복 행은 가장 먼저 저장된 행(MIN(id))만 남기고 삭제한 뒤 인덱스를 추가합니다.
+keword 또는 link가 NULL인 행은 유니크 제약에 걸리지 않으므로 삭제하지 않습니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 10:12:44.218307
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+TABLE = 'dbms_blog_keword'
+INDEX = 'ux_blog_keword_link'
+
+
+def upgrade():
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(TABLE)}
+    if INDEX in indexes:
+        return
+
+    # MySQL은 삭제 대상 테이블을 서브쿼리에서 바로 읽을 수 없으므로 파생 테이블(keep)로 한 번 감쌈
+    op.execute(
+        f"DELETE FROM {TABLE} WHERE keword IS NOT NULL AND link IS NOT NULL AND id NOT IN ("
+        f"SELECT id FROM (SELECT MIN(id) AS id FROM {TABLE} "
+        f"WHERE keword IS NOT NULL AND link IS NOT NULL GROUP BY keword, link) keep)"
+    )
+    with op.batch_alter_table(TABLE, schema=None) as batch_op:
+        batch_op.create_index(INDEX, ['keword', 'link'], unique=True, mysql_length={'keword': 191, 'link': 512})
+
+
+def downgrade():
+    # 인덱스는 0001의 테이블 정의에 속하므로(0001 downgrade가 삭제) 여기서는 되돌리지 않음, 삭제한 중복 행도 복구하지 않음
+    pass
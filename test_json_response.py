@@ -0,0 +1,46 @@
+"""orjson 응답 헬퍼(app.common.json_response) 확인
+
+실행: python -m pytest -q test_json_response.py  또는  python test_json_response.py
+"""
+import math
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from app.common.json_response import dumps, frame_response
+
+
+def legacy_rows(df):
+    """이전 응답 경로 (df.to_dict → FastJSONResponse)의 결과"""
+    return orjson.loads(dumps({"rows": df.to_dict(orient="records")}))
+
+
+def test_frame_response_round_trips_floats():
+    df = pd.DataFrame({
+        "stock_code": ["005930", "000660", "035420"],
+        "stock_day": ["2026-10-19", "2026-10-19", "2026-10-19"],
+        "closing_price": [0.1 + 0.2, 1234567.123456789, 1 / 3],
+        "change_rate": [-0.000123456789012, float("nan"), 98765.4321098765],
+        "volume": np.array([12345678901, 0, 42], dtype="int64"),
+        "note": ["ok", None, "한글"],
+    })
+    body = orjson.loads(frame_response(df).body)
+    assert body == legacy_rows(df)
+    # df.to_json 기본값(double_precision=10)이면 잘리는 값도 그대로 유지
+    assert body["rows"][0]["closing_price"] == 0.1 + 0.2
+    assert body["rows"][1]["closing_price"] == 1234567.123456789
+    assert body["rows"][1]["change_rate"] is None
+
+
+def test_frame_response_extra_fields_and_empty_frame():
+    df = pd.DataFrame({"value": [math.pi]})
+    assert orjson.loads(frame_response(df, key="items", count=1).body) == {"count": 1, "items": [{"value": math.pi}]}
+    assert orjson.loads(frame_response(pd.DataFrame(columns=["value"])).body) == {"rows": []}
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")
@@ -0,0 +1,224 @@
+"""목록 API가 인덱스를 타는지 EXPLAIN QUERY PLAN으로 확인 (SQLite, Alembic 마이그레이션으로 스키마 생성)
+
+실행: python -m pytest -q test_query_plans.py  또는  python test_query_plans.py
+"""
+import os
+import re
+import tempfile
+from pathlib import Path
+
+# 실행된 SELECT를 동기 엔진 이벤트로 수집하므로 목록 API도 동기 Session(get_db) 경로로 등록
+os.environ.setdefault("DB_ASYNC_YN", "N")
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base, get_db, get_read_db
+from app.models import BlogCrawl, NaverFinance
+from app.service.model_query import encode_cursor
+from app.common.upsert import insert_if_unseen
+from app.routers import api
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "query_plans.db")
+DB_URL = f"sqlite:///{DB_PATH}"
+
+# 날짜 필터가 있는 목록 조회는 모두 인덱스 SEARCH + 정렬 없이 처리되어야 함
+FILTERED_ENDPOINTS = [
+    "/api/stock/top5", "/api/ev/top10", "/api/market/top10", "/api/blog/naver",
+    "/api/youtube/comments", "/api/kakao/ai-image", "/api/kakao/talk", "/api/public/apt-trade",
+    "/api/kma/forecast", "/api/jeju/flo-pop", "/api/seoul/for-pop", "/api/batch/stats",
+]
+# 날짜 필터 없이 ins_dt desc, id desc 로 정렬하는 전체 조회
+UNFILTERED_ENDPOINTS = ["/api/stock/all", "/api/ev/all", "/api/blog/all", "/api/youtube/all"]
+
+
+def migrate(url=DB_URL):
+    config = Config(str(Path(__file__).resolve().parent / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+
+engine = None
+statements = []
+
+
+def setup_module(module=None):
+    global engine
+    migrate()
+    engine = create_engine(DB_URL)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not statement.lstrip().upper().startswith("SELECT 1"):
+            statements.append((statement, parameters))
+
+
+def client():
+    Session = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(api.router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    return TestClient(app)
+
+
+def query_plan(statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return [row[-1] for row in rows]
+
+
+def plans_for(path, params=None):
+    statements.clear()
+    response = client().get(path, params=params or {})
+    assert response.status_code == 200, response.text
+    assert statements, f"{path}: 실행된 SELECT 없음"
+    return [(statement, query_plan(statement, parameters)) for statement, parameters in statements]
+
+
+def table_lines(statement, plan):
+    """plan 중 엔드포인트의 대상 테이블에 대한 접근 라인만"""
+    table = re.search(r"FROM (\w+)", statement).group(1)
+    return table, [line for line in plan if re.search(rf"\b{table}\b", line)]
+
+
+def assert_indexed(path, statement, plan, allow_sort=False):
+    table, lines = table_lines(statement, plan)
+    assert lines, f"{path}: {table} 접근 계획 없음 {plan}"
+    for line in lines:
+        if "WHERE" not in statement and line.startswith("SCAN"):
+            continue  # 조건 없는 조회(/batch/stats 등)는 PK(rowid) 순서 스캔 + LIMIT
+        assert "USING" in line and "INDEX" in line, f"{path}: 인덱스 미사용 - {line}\n{statement}"
+    if not allow_sort:
+        assert not any("TEMP B-TREE" in line for line in plan), f"{path}: 정렬용 임시 B-TREE 사용 - {plan}"
+
+
+def test_schema_matches_models():
+    """마이그레이션 결과와 모델 정의(인덱스 포함)가 일치"""
+    with engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    assert diff == [], diff
+
+
+def test_filtered_list_endpoints_use_index():
+    for path in FILTERED_ENDPOINTS:
+        for statement, plan in plans_for(path, {"start_date": "2026-10-19"}):
+            assert_indexed(path, statement, plan)
+
+
+def test_range_filtered_list_endpoints_use_index():
+    # 기간 조회는 정렬 키가 인덱스 순서와 달라질 수 있어 인덱스 범위 탐색만 확인
+    for path in FILTERED_ENDPOINTS:
+        for statement, plan in plans_for(path, {"start_date": "2026-10-01", "end_date": "2026-10-19"}):
+            assert_indexed(path, statement, plan, allow_sort=True)
+
+
+def test_unfiltered_ins_dt_order_uses_index():
+    for path in UNFILTERED_ENDPOINTS:
+        for statement, plan in plans_for(path):
+            assert_indexed(path, statement, plan)
+
+
+def test_delete_and_count_filters_use_index():
+    checks = [
+        ("SELECT id FROM api_batch_stat WHERE strd_dt = ? AND api_nm = ?", ("20261019", "Airflow")),
+        ("SELECT count(*) FROM dbms_youtube_keword WHERE strd_dt = ? AND keword = ?", ("20261019", "노트북")),
+        ("SELECT id FROM dbms_blog_keword WHERE strd_dt = ? AND keword = ?", ("20261019", "노트북")),
+    ]
+    for statement, parameters in checks:
+        assert_indexed(statement, statement, query_plan(statement, parameters))
+
+
+def test_keyset_paging_through_tied_ins_dt():
+    """ins_dt가 같은 행들도 (ins_dt, id) 커서로 빠짐/중복 없이 offset 페이징과 같은 순서로 조회"""
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([
+            NaverFinance(strd_dt="20261018", stock_cd=f"K{i:03d}", stock_nm=f"종목{i}", today_price=i,
+                         ins_dt="20261018153000" if i < 6 else "20261018160000")
+            for i in range(9)
+        ])
+        db.commit()
+
+    http = client()
+    params = {"start_date": "2026-10-18", "limit": 2}
+    by_offset = [item["stock_cd"] for offset in range(0, 10, 2)
+                 for item in http.get("/api/stock/top5", params={**params, "offset": offset}).json()["items"]]
+    by_cursor, cursor = [], None
+    while True:
+        body = http.get("/api/stock/top5", params={**params, **({"cursor": cursor} if cursor else {})}).json()
+        by_cursor += [item["stock_cd"] for item in body["items"]]
+        cursor = body["meta"]["next_cursor"]
+        if not cursor:
+            break
+    assert by_cursor == by_offset and sorted(by_cursor) == [f"K{i:03d}" for i in range(9)]
+    assert by_cursor[:3] == ["K008", "K007", "K006"]  # ins_dt 내림차순, 같은 ins_dt는 id 내림차순
+
+
+def test_cursor_with_wrong_value_types_is_rejected():
+    # 형식은 맞지만 값 타입이 정렬 컬럼(ins_dt, id)과 맞지 않는 커서 ([1, 2], ["x", 1], [ins_dt, "1"])
+    http = client()
+    for cursor in ("WzEsMl0", encode_cursor(["x", 1]), encode_cursor(["20261018153000", "1"])):
+        response = http.get("/api/stock/top5", params={"cursor": cursor})
+        assert response.status_code == 400, response.text
+        assert response.json()["error"] == "잘못된 목록 요청"
+
+
+def test_baseline_db_upgrade_adds_blog_unique_index():
+    """create_all로 만든 기존 DB(유니크 인덱스 없음, 중복 행 있음)를 head로 올리면 중복 정리 + 인덱스 추가"""
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'baseline.db')}"
+    baseline = MetaData()
+    Table(
+        "dbms_blog_keword", baseline,
+        Column("id", Integer, primary_key=True),
+        Column("strd_dt", String(10), index=True),
+        Column("keword", String(200)),
+        Column("title", String(500)),
+        Column("link", String(1000)),
+        Column("ins_dt", String(14), nullable=False, index=True),
+    )
+    baseline_engine = create_engine(url)
+    baseline.create_all(baseline_engine)
+    with baseline_engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO dbms_blog_keword (id, strd_dt, keword, title, link, ins_dt) VALUES "
+            "(1, '20261018', '맛집', '첫 수집', 'https://blog/1', '20261018090000'),"
+            "(2, '20261019', '맛집', '중복 수집', 'https://blog/1', '20261019090000'),"
+            "(3, '20261019', '맛집', '다른 글', 'https://blog/2', '20261019090000')"
+        ))
+
+    migrate(url)
+    upgraded = create_engine(url)
+    assert "ux_blog_keword_link" in {index["name"] for index in inspect(upgraded).get_indexes("dbms_blog_keword")}
+    with upgraded.connect() as conn:
+        assert conn.execute(text("SELECT id FROM dbms_blog_keword ORDER BY id")).scalars().all() == [1, 3]
+        assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+
+    # 크롤러 저장 경로(ON CONFLICT DO NOTHING)가 동작하고 이미 있는 글은 건너뜀
+    with sessionmaker(bind=upgraded)() as db:
+        rows = [{"strd_dt": "20261020", "keword": "맛집", "title": t, "link": link, "ins_dt": "20261020090000"}
+                for t, link in (("재수집", "https://blog/1"), ("새 글", "https://blog/3"))]
+        assert insert_if_unseen(db, BlogCrawl, rows, ["keword", "link"]) == 1
+        db.commit()
+
+
+if __name__ == "__main__":
+    setup_module()
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")
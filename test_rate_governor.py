@@ -0,0 +1,138 @@
+"""외부 호출 제한(app.common.rate_governor) 확인 - 네트워크 호출 없이 제한 동작만 확인
+
+실행: python -m pytest -q test_rate_governor.py  또는  python test_rate_governor.py
+"""
+import asyncio
+import threading
+import time
+
+from app.common.rate_governor import QuotaExceeded, RateGovernor
+
+
+def governor(**spec):
+    return RateGovernor({"test": {"hosts": ["api.example.com"], **spec}})
+
+
+def test_token_bucket_limits_rate_after_burst():
+    g = governor(rate=20, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        with g.limit("https://api.example.com/v1?q=1"):
+            pass
+    # 처음 2건은 바로, 나머지 4건은 초당 20건 간격 (약 0.2초)
+    assert 0.15 <= time.monotonic() - start < 0.5
+
+
+def test_max_concurrency_across_threads():
+    g = governor(max_concurrency=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def call():
+        with g.limit("test"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 2
+
+
+def test_daily_quota_counts_cost_and_rejects():
+    g = governor(daily_quota=150)
+    with g.limit("test", cost=100):
+        pass
+    try:
+        with g.limit("api.example.com", cost=100):
+            pass
+        assert False, "할당량 초과 예외가 발생해야 함"
+    except QuotaExceeded:
+        pass
+    with g.limit("test", cost=50):
+        pass
+    status = g.status()["test"]
+    assert status["used"] == 150 and status["rejected"] == 1
+
+
+def test_unknown_host_gets_own_default_source():
+    g = governor()
+    with g.limit("https://other.example.org/path"):
+        pass
+    assert "other.example.org" in g.status()
+
+
+def test_async_calls_share_concurrency():
+    g = governor(max_concurrency=1)
+    order = []
+
+    async def run():
+        async def call(name):
+            async with g.limit_async("test"):
+                order.append(f"{name}-in")
+                await asyncio.sleep(0.02)
+                order.append(f"{name}-out")
+
+        await asyncio.gather(call("a"), call("b"))
+
+    asyncio.run(run())
+    assert order in (["a-in", "a-out", "b-in", "b-out"], ["b-in", "b-out", "a-in", "a-out"])
+    assert g.status()["test"]["active"] == 0
+
+
+def test_async_and_sync_share_concurrency():
+    g = governor(max_concurrency=1)
+    order = []
+
+    # 스레드가 동기 limit으로 자리를 잡고 있는 동안 비동기 호출은 기다림
+    entered = threading.Event()
+
+    def sync_call():
+        with g.limit("test"):
+            order.append("sync-in")
+            entered.set()
+            time.sleep(0.1)
+            order.append("sync-out")
+
+    async def async_call(name):
+        async with g.limit_async("test"):
+            order.append(f"{name}-in")
+            await asyncio.sleep(0.1)
+            order.append(f"{name}-out")
+
+    thread = threading.Thread(target=sync_call)
+    thread.start()
+    assert entered.wait(5)
+    asyncio.run(async_call("async"))
+    thread.join()
+    assert order == ["sync-in", "sync-out", "async-in", "async-out"]
+
+    # 반대로 비동기 호출이 자리를 잡고 있는 동안 스레드의 동기 호출이 기다림
+    order.clear()
+    entered.clear()
+
+    async def hold_then_start_thread():
+        async with g.limit_async("test"):
+            order.append("async-in")
+            thread = threading.Thread(target=sync_call)
+            thread.start()
+            await asyncio.sleep(0.1)
+            assert not entered.is_set()
+            order.append("async-out")
+        return thread
+
+    asyncio.run(hold_then_start_thread()).join()
+    assert order == ["async-in", "async-out", "sync-in", "sync-out"]
+    assert g.status()["test"]["active"] == 0
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")
@@ -0,0 +1,175 @@
+"""읽기 복제본 라우팅 확인 (SQLite 파일 2~3개를 primary / replica로 사용, Alembic 마이그레이션으로 스키마 생성)
+
+실행: python -m pytest -q test_read_replica.py  또는  python test_read_replica.py
+복제는 하지 않으므로 각 DB에 서로 다른 행을 넣고, 조회 결과가 어느 DB에서 왔는지로 라우팅을 확인합니다.
+"""
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("DB_ASYNC_YN", "N")
+os.environ.setdefault("RESPONSE_CACHE_YN", "N")
+
+from alembic import command
+from alembic.config import Config
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.common.db_routing import ReplicaSet, RoutingSession
+from app.common.response_cache import ResponseCacheMiddleware, response_cache
+from app.config import settings
+from app.db import get_read_db
+from app.models import EvTop
+from app.routers import api
+
+DB_DIR = tempfile.mkdtemp()
+NAMES = ("primary", "replica1", "replica2")
+engines = {}
+
+
+def migrate(url):
+    config = Config(str(Path(__file__).resolve().parent / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+
+def setup_module(module=None):
+    for name in NAMES:
+        url = f"sqlite:///{os.path.join(DB_DIR, name + '.db')}"
+        migrate(url)
+        engines[name] = create_engine(url)
+        # 각 DB에 DB 이름을 region으로 가진 행 1건
+        with sessionmaker(bind=engines[name])() as db:
+            db.add(EvTop(strd_dt="20261019", sido_nm="서울", region=name, value=1, ins_dt="20261019101112"))
+            db.commit()
+
+
+def routing_session(*replica_names, lag_probe=lambda engine: 0.0, max_lag=30):
+    replicas = ReplicaSet([engines[n] for n in replica_names], max_lag=max_lag, lag_probe=lag_probe)
+    replicas.refresh()  # 백그라운드 스레드의 첫 지연 확인이 끝난 상태
+    return sessionmaker(bind=engines["primary"], class_=RoutingSession, replicas=replicas)
+
+
+def regions(db):
+    return sorted(db.scalars(select(EvTop.region)).all())
+
+
+def test_select_goes_to_replica():
+    with routing_session("replica1")() as db:
+        assert regions(db) == ["replica1"]
+
+
+def test_round_robin_between_replicas():
+    Session = routing_session("replica1", "replica2")
+    seen = []
+    for _ in range(4):
+        with Session() as db:
+            seen.append(regions(db)[0])
+    assert seen == ["replica1", "replica2", "replica1", "replica2"]
+
+
+def test_write_goes_to_primary_and_session_sticks_to_primary():
+    with routing_session("replica1")() as db:
+        db.add(EvTop(strd_dt="20261020", sido_nm="부산", region="written", value=2, ins_dt="20261020101112"))
+        db.flush()
+        # 쓰기 이후 같은 세션의 조회는 방금 쓴 행이 보이도록 primary
+        assert "written" in regions(db)
+        db.rollback()
+    with sessionmaker(bind=engines["replica1"])() as db:
+        assert regions(db) == ["replica1"]
+
+
+def test_lagging_replica_is_skipped():
+    lags = {"replica1": 120.0, "replica2": 0.0}
+    Session = routing_session("replica1", "replica2", lag_probe=lambda e: lags[Path(e.url.database).stem])
+    for _ in range(3):
+        with Session() as db:
+            assert regions(db) == ["replica2"]
+
+
+def test_all_replicas_lagging_falls_back_to_primary():
+    with routing_session("replica1", lag_probe=lambda engine: float("inf"))() as db:
+        assert regions(db) == ["primary"]
+
+
+def test_unchecked_replica_is_not_used_and_probe_runs_in_background():
+    """요청 스레드는 지연 확인(접속)을 기다리지 않고, 확인 전에는 primary를 사용"""
+    release = threading.Event()
+
+    def slow_probe(engine):
+        release.wait(5)  # 접속이 안 되는 복제본
+        return 0.0
+
+    replicas = ReplicaSet([engines["replica1"]], check_interval=60, lag_probe=slow_probe)
+    Session = sessionmaker(bind=engines["primary"], class_=RoutingSession, replicas=replicas)
+    try:
+        with Session() as db:
+            assert regions(db) == ["primary"]
+        assert replicas.status()[0]["checked"] is False
+        release.set()
+        deadline = time.monotonic() + 5
+        while not replicas.status()[0]["checked"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with Session() as db:
+            assert regions(db) == ["replica1"]
+    finally:
+        release.set()
+        replicas.stop()
+
+
+def client(Session, cache=False):
+    def override_get_read_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(api.router)
+    if cache:
+        app.add_middleware(ResponseCacheMiddleware, routes=api.CACHE_ROUTES)
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    return TestClient(app)
+
+
+def test_list_endpoint_reads_from_replica():
+    items = client(routing_session("replica1")).get("/api/ev/all").json()["items"]
+    assert [item["region"] for item in items] == ["replica1"]
+
+
+def test_replica_response_not_cached_right_after_invalidation():
+    """쓰기 커밋(무효화) 직후 복제 지연 허용 시간 동안은 복제본에서 읽은 응답을 저장하지 않음"""
+    saved = settings.RESPONSE_CACHE_YN, response_cache.replica_max_lag
+    settings.RESPONSE_CACHE_YN = "Y"
+    response_cache.replica_max_lag = 30
+    try:
+        replica_client = client(routing_session("replica1"), cache=True)
+        response_cache.invalidate(EvTop.__tablename__)
+        for _ in range(2):
+            assert replica_client.get("/api/ev/all", params={"case": "replica"}).headers["X-Cache"] == "SKIP"
+
+        # primary에서 읽은 응답(복제본이 모두 지연된 경우 등)은 바로 저장
+        primary_client = client(routing_session("replica1", lag_probe=lambda engine: float("inf")), cache=True)
+        assert primary_client.get("/api/ev/all", params={"case": "primary"}).headers["X-Cache"] == "MISS"
+        assert primary_client.get("/api/ev/all", params={"case": "primary"}).headers["X-Cache"] == "HIT"
+
+        # 허용 시간이 지나면 복제본 응답도 저장
+        response_cache.replica_max_lag = 0
+        assert replica_client.get("/api/ev/all", params={"case": "replica"}).headers["X-Cache"] == "MISS"
+        assert replica_client.get("/api/ev/all", params={"case": "replica"}).headers["X-Cache"] == "HIT"
+    finally:
+        settings.RESPONSE_CACHE_YN, response_cache.replica_max_lag = saved
+
+
+if __name__ == "__main__":
+    setup_module()
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")
@@ -0,0 +1,173 @@
+"""외부 호출 재시도 / 서킷 브레이커(app.common.resilience, app.common.http_client) 확인
+
+실행: python -m pytest -q test_resilience.py  또는  python test_resilience.py
+로컬 HTTP 서버가 경로별로 정해 둔 상태 코드를 차례로 돌려주고, 클라이언트의 재시도 횟수와 서킷 상태를 확인합니다.
+"""
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.common import http_client, resilience
+from app.common.resilience import CircuitBreaker, CircuitOpen, Retry, retry_after
+
+# 경로 → 남은 응답 목록 [(상태 코드, 헤더)], 마지막 응답은 계속 반복
+SCRIPTS = {}
+HITS = {}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _reply(self):
+        HITS[self.path] = HITS.get(self.path, 0) + 1
+        script = SCRIPTS[self.path]
+        status, headers = script.pop(0) if len(script) > 1 else script[0]
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+BASE = f"http://127.0.0.1:{server.server_port}"
+
+
+def script(path, *responses):
+    SCRIPTS[path] = [(r, {}) if isinstance(r, int) else r for r in responses]
+    HITS[path] = 0
+    return BASE + path
+
+
+def reset_circuit():
+    resilience._breakers.clear()
+
+
+def test_retry_after_parsing():
+    assert retry_after("3") == 3.0
+    assert retry_after(None) is None
+    assert retry_after("not-a-date") is None
+    assert 0 <= retry_after(time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 5))) <= 5
+
+
+def test_retry_stops_at_max_attempts_and_deadline():
+    retry = Retry(max_attempts=3, deadline=60)
+    assert retry.next_delay() is not None and retry.next_delay() is not None and retry.next_delay() is None
+    # Retry-After가 남은 시간보다 길면 기다리지 않고 포기
+    assert Retry(max_attempts=5, deadline=1).next_delay(wait=5) is None
+
+
+def test_get_retries_5xx_then_succeeds():
+    reset_circuit()
+    url = script("/flaky", 503, 502, 200)
+    assert http_client.get(url, retries=3).status_code == 200
+    assert HITS["/flaky"] == 3
+
+
+def test_retry_after_header_is_honoured():
+    reset_circuit()
+    url = script("/throttled", (429, {"Retry-After": "1"}), 200)
+    start = time.monotonic()
+    assert http_client.get(url).status_code == 200
+    assert time.monotonic() - start >= 0.9
+
+
+def test_post_is_not_retried_on_5xx_but_is_on_429():
+    reset_circuit()
+    url = script("/send", 500, 200)
+    assert http_client.post(url).status_code == 500 and HITS["/send"] == 1
+    url = script("/send-throttled", (429, {"Retry-After": "0"}), 200)
+    assert http_client.post(url).status_code == 200 and HITS["/send-throttled"] == 2
+
+
+def test_circuit_opens_and_fails_fast():
+    reset_circuit()
+    url = script("/down", 500)
+    assert http_client.get(url, retries=3).status_code == 500
+    # 두 번째 호출의 재시도 중 연속 실패가 임계값(5)에 닿으면 남은 재시도는 호출하지 않고 실패
+    try:
+        http_client.get(url, retries=3)
+        assert False, "서킷이 열려 있어야 함"
+    except CircuitOpen:
+        pass
+    hits = HITS["/down"]
+    assert hits == 5
+    try:
+        http_client.get(url)
+        assert False, "서킷이 열려 있어야 함"
+    except CircuitOpen:
+        pass
+    assert HITS["/down"] == hits
+    assert resilience.breakers_status()["127.0.0.1"]["state"] == "open"
+
+
+def test_half_open_probe_closes_circuit():
+    circuit = CircuitBreaker("probe", failure_threshold=1, reset_timeout=0.05)
+    circuit.failure()
+    try:
+        circuit.allow()
+        assert False
+    except CircuitOpen:
+        pass
+    time.sleep(0.06)
+    circuit.allow()  # 시험 호출 1건 허용
+    try:
+        circuit.allow()  # 시험 호출 중에는 다른 호출 차단
+        assert False
+    except CircuitOpen:
+        pass
+    circuit.success()
+    assert circuit.status()["state"] == "closed"
+
+
+def test_call_does_not_retry_non_retryable_errors():
+    reset_circuit()
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    try:
+        resilience.call("lib", func, retryable=lambda e: not isinstance(e, ValueError))
+    except ValueError:
+        pass
+    assert len(calls) == 1 and resilience.breakers_status()["lib"]["failures"] == 0
+
+
+def test_bad_symbol_does_not_open_finance_data_reader_circuit():
+    """잘못된 심볼 오류는 재시도하지 않고 서킷도 열지 않아 다른 심볼 조회는 계속됨"""
+    from app.service.finance_data_reader_parser import FinanceDataReaderParser
+
+    reset_circuit()
+    calls = []
+
+    class FakeReader:
+        @staticmethod
+        def DataReader(symbol, start, end):
+            calls.append(symbol)
+            if symbol == "BAD":
+                raise ValueError(f"{symbol} not found")
+            return None
+
+    parser = FinanceDataReaderParser(symbols=[], max_attempts=1)
+    for _ in range(10):
+        assert parser.fetch_symbol(FakeReader, {"symbol": "BAD", "market": "BAD", "exchange": "KRX"},
+                                   date(2026, 10, 16), "20261019") is None
+    assert calls == ["BAD"] * 10
+    assert resilience.breakers_status()["finance-data-reader"]["state"] == "closed"
+    parser.fetch_symbol(FakeReader, {"symbol": "KS11", "market": "KOSPI", "exchange": "KRX"}, date(2026, 10, 16), "20261019")
+    assert calls[-1] == "KS11"
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")
@@ -0,0 +1,104 @@
+"""응답 캐시(app.common.response_cache) 무효화 확인 - 크롤러 저장이 캐시된 조회 응답을 무효화하는지
+
+실행: python -m pytest -q test_response_cache.py  또는  python test_response_cache.py
+SQLite 파일 DB(Alembic 마이그레이션으로 스키마 생성)에 app.db.engine과 같은 방식으로 쓰기 추적을 붙여 사용합니다.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("DB_ASYNC_YN", "N")
+
+from alembic import command
+from alembic.config import Config
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import db as app_db
+from app.common.response_cache import ResponseCacheMiddleware, track_table_writes
+from app.config import settings
+from app.db import get_db, get_read_db
+from app.routers import api
+from app.service import youtube_comment_crawler
+from app.service.youtube_comment_crawler import YoutubeCommentCrawler
+
+DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'response_cache.db')}"
+engine = None
+Session = None
+
+
+def setup_module(module=None):
+    global engine, Session
+    config = Config(str(Path(__file__).resolve().parent / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", DB_URL)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+    engine = create_engine(DB_URL)
+    track_table_writes(engine)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def client():
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(api.router)
+    app.add_middleware(ResponseCacheMiddleware, routes=api.CACHE_ROUTES)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    return TestClient(app)
+
+
+def comment(text):
+    return {
+        "strd_dt": "20261019", "keword": "노트북", "link": "https://www.youtube.com/watch?v=abc", "video_id": "abc",
+        "main_text": text, "comment_author": "tester", "ins_dt": "20261019101112",
+    }
+
+
+def test_crawler_uses_shared_engine():
+    # 쓰기 추적(track_table_writes)과 커넥션 풀 설정(DB_POOL_*, /api/db/pool)은 app.db.engine에만 적용되므로 크롤러도 같은 세션 팩토리를 사용해야 함
+    assert youtube_comment_crawler.SessionLocal is app_db.SessionLocal
+    assert app_db.SessionLocal.kw["bind"] is app_db.engine
+
+
+def test_crawler_save_evicts_cached_responses():
+    paths = ["/api/youtube/comments", "/api/youtube/all", "/api/aggregate/youtube"]
+    saved = (settings.RESPONSE_CACHE_YN, youtube_comment_crawler.SessionLocal, youtube_comment_crawler.refresh_after_save)
+    settings.RESPONSE_CACHE_YN = "Y"
+    youtube_comment_crawler.SessionLocal = Session
+    youtube_comment_crawler.refresh_after_save = lambda table, strd_dts: {}
+    try:
+        http = client()
+        before = {}
+        for path in paths:
+            assert http.get(path).headers["X-Cache"] == "MISS"
+            response = http.get(path)
+            assert response.headers["X-Cache"] == "HIT"
+            before[path] = response.json()
+
+        assert YoutubeCommentCrawler(api_key="test").save_to_db([comment("첫 댓글")]) == 1
+        assert engine.pool.checkedout() == 0  # 저장이 끝나면 커넥션을 풀에 반납
+
+        for path in paths:
+            response = http.get(path)
+            assert response.headers["X-Cache"] == "MISS", path
+            assert response.json() != before[path], path
+        assert len(http.get("/api/youtube/all").json()["items"]) == 1
+    finally:
+        settings.RESPONSE_CACHE_YN, youtube_comment_crawler.SessionLocal, youtube_comment_crawler.refresh_after_save = saved
+
+
+if __name__ == "__main__":
+    setup_module()
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")
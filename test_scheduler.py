@@ -0,0 +1,113 @@
+"""내장 스케줄러(app.service.scheduler) 확인 - 크롤러를 실제로 호출하지 않고 작업 실행 기록과 작업 저장소만 확인
+
+실행: python -m pytest -q test_scheduler.py  또는  python test_scheduler.py
+작업 저장소는 임시 SQLite 파일(SCHEDULER_JOBSTORE_URL)을 사용합니다.
+"""
+import os
+import tempfile
+import threading
+
+os.environ.setdefault("DB_ASYNC_YN", "N")
+
+from app.config import settings
+from app.service import scheduler
+
+JOBSTORE_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'jobs.db')}"
+
+
+def run_test_job(func):
+    """SCHEDULED_JOBS에 임시 작업을 등록해 run_job으로 실행하고 실행 기록을 반환"""
+    name = f"test-{func.__name__}"
+    scheduler.SCHEDULED_JOBS[name] = {"func": func, "cron": "0 0 * * *", "description": "테스트"}
+    try:
+        scheduler.run_job(name)
+    finally:
+        del scheduler.SCHEDULED_JOBS[name]
+    return scheduler._history.pop(name)
+
+
+def test_error_status_result_is_failure():
+    # 서울/기상청/제주 공공데이터 크롤러는 예외 대신 status가 error인 dict를 반환
+    def error_dict():
+        return {"status": "error", "message": "API 키 오류"}
+
+    def fail_dict():
+        return {"status": "FAIL"}
+
+    def success_dict():
+        return {"status": "success", "count": 3}
+
+    def raises():
+        raise RuntimeError("접속 실패")
+
+    record = run_test_job(error_dict)
+    assert record["status"] == "failed" and record["error"] == "API 키 오류"
+    assert run_test_job(fail_dict)["status"] == "failed"
+    assert run_test_job(raises)["error"] == "접속 실패"
+    record = run_test_job(success_dict)
+    assert record["status"] == "success" and record["result"] == {"status": "success", "count": 3}
+
+
+def test_max_instances_skips_overlapping_run():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+
+    name = "test-slow"
+    scheduler.SCHEDULED_JOBS[name] = {"func": slow, "cron": "0 0 * * *", "description": "테스트"}
+    try:
+        worker = threading.Thread(target=scheduler.run_job, args=[name])
+        worker.start()
+        assert started.wait(5)
+        scheduler.run_job(name)  # SCHEDULER_MAX_INSTANCES(1)개가 실행 중이므로 건너뜀
+        assert "last_skipped" in scheduler._history[name] and len(calls) == 1
+        release.set()
+        worker.join()
+        assert scheduler._history[name]["status"] == "success" and scheduler._running[name] == 0
+    finally:
+        release.set()
+        del scheduler.SCHEDULED_JOBS[name]
+        scheduler._history.pop(name, None)
+        scheduler._running.pop(name, None)
+
+
+def jobs():
+    return {job["id"]: job for job in scheduler.schedule_status()["jobs"]}
+
+
+def test_pause_and_reschedule_survive_restart():
+    saved = settings.SCHEDULER_YN, settings.SCHEDULER_JOBSTORE_URL
+    settings.SCHEDULER_YN, settings.SCHEDULER_JOBSTORE_URL = "Y", JOBSTORE_URL
+    try:
+        scheduler.start()
+        scheduler.scheduler.pause_job("ev-car-portal")
+        scheduler.set_cron("ev-car-portal", "5 10 * * *")  # 일시 정지 상태에서 cron 변경
+        scheduler.set_cron("retention", "45 4 * * *")
+        scheduler.shutdown()
+
+        scheduler.start()
+        status = jobs()
+        assert status["ev-car-portal"]["paused"] and "hour='10'" in status["ev-car-portal"]["trigger"]
+        assert not status["retention"]["paused"] and "hour='4'" in status["retention"]["trigger"]
+        assert status["retention"]["next_run_time"] is not None
+        assert not status["naver-blog"]["paused"]
+
+        try:
+            scheduler.set_cron("retention", "0 4 * *")
+            assert False, "cron 항목 수 오류가 발생해야 함"
+        except ValueError:
+            pass
+    finally:
+        scheduler.shutdown()
+        settings.SCHEDULER_YN, settings.SCHEDULER_JOBSTORE_URL = saved
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"[OK] {name}")